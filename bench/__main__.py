@@ -3,6 +3,7 @@ import asyncio
 from .bench_channel import bench_dm_channels, bench_group_channels, bench_text_channels
 from .bench_member import bench_members
 from .bench_message import bench_messages
+from .bench_routes import bench_routes
 from .bench_server import bench_servers
 from .bench_user import bench_users
 
@@ -22,6 +23,9 @@ async def main():
     print('Benchmarking Message parsing.')
     await bench_messages()
 
+    print('Benchmarking route building.')
+    await bench_routes()
+
     print('Benchmarking Server parsing.')
     await bench_servers()
 
@@ -0,0 +1,29 @@
+import timeit
+from urllib.parse import quote
+
+import pyvolt
+from pyvolt import routes
+
+
+async def bench_routes():
+    route = routes.CHANNELS_MESSAGE_FETCH
+    rate_limiter = pyvolt.DefaultRateLimiter()
+
+    # What building path and ratelimit keys cost before routes were precompiled
+    def using_format_map():
+        compiled = route.compile(channel_id='01HZ1N6DA5X6YBXW3Q7M3B0RJ9', message_id='01HZ1N7Q1P3VK6Y2W4T8JXG5EA')
+        compiled.route.path.format_map({k: quote(str(v)) for k, v in compiled.args.items()})
+        for _ in range(4):
+            compiled.route.ratelimit_key_template.format_map({k: quote(str(v)) for k, v in compiled.args.items()})
+
+    def using_precompiled():
+        compiled = route.compile(channel_id='01HZ1N6DA5X6YBXW3Q7M3B0RJ9', message_id='01HZ1N7Q1P3VK6Y2W4T8JXG5EA')
+        compiled.build()
+        for _ in range(4):
+            rate_limiter.get_ratelimit_key_for(compiled)
+
+    time_format_map = timeit.timeit(using_format_map, number=100_000)
+    time_precompiled = timeit.timeit(using_precompiled, number=100_000)
+
+    print(f"[Route] Time using format_map -: {time_format_map:.6f} seconds")
+    print(f"[Route] Time using precompiled: {time_precompiled:.6f} seconds")
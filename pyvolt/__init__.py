@@ -18,6 +18,7 @@ from . import (
 from .authentication import *
 from .base import *
 from .bot import *
+from .bulk import *
 from .cache import *
 from .cdn import *
 from .channel import *
@@ -34,14 +35,17 @@ from .flags import *
 from .http import *
 from .instance import *
 from .invite import *
+from .iterators import *
 from .message import *
 from .parser import *
 from .permissions import *
 from .read_state import *
+from .retry import *
 from .safety_reports import *
 from .server import *
 from .settings import *
 from .shard import *
+from .sqlite_cache import *
 from .state import *
 from .user import *
 from .utils import *
@@ -27,6 +27,8 @@ from __future__ import annotations
 import typing
 
 from .context_managers import Typing
+from .core import resolve_id
+from .iterators import MessageIterator
 
 if typing.TYPE_CHECKING:
     from collections.abc import Mapping
@@ -95,6 +97,131 @@ class Messageable:
         channel_id = await self.fetch_channel_id()
         await state.shard.end_typing(channel_id)
 
+    def history(
+        self,
+        *,
+        limit: typing.Optional[int] = None,
+        before: typing.Optional[ULIDOr[BaseMessage]] = None,
+        after: typing.Optional[ULIDOr[BaseMessage]] = None,
+        oldest_first: bool = False,
+        populate_users: typing.Optional[bool] = None,
+        cache: bool = False,
+        page_size: int = 100,
+        prefetch: bool = True,
+    ) -> MessageIterator:
+        """Returns an asynchronous iterator over message history of this channel, retrieving messages page by page.
+
+        You must have :attr:`~Permissions.read_message_history` to do this.
+
+        Examples
+        --------
+
+        Exporting whole history, from oldest messages to newest ones: ::
+
+            async for message in channel.history(oldest_first=True):
+                print(message.author_id, message.content)
+
+        Parameters
+        ----------
+        limit: Optional[:class:`int`]
+            The maximum number of messages to retrieve. If ``None``, the whole history is retrieved.
+        before: Optional[ULIDOr[:class:`.BaseMessage`]]
+            The message before which messages should be retrieved.
+        after: Optional[ULIDOr[:class:`.BaseMessage`]]
+            The message after which messages should be retrieved.
+        oldest_first: :class:`bool`
+            Whether to iterate from oldest messages to newest ones. Defaults to ``False``.
+        populate_users: Optional[:class:`bool`]
+            Whether to populate user (and member, if server channel) objects.
+        cache: :class:`bool`
+            Whether to store retrieved messages in cache, and serve already cached parts of history from there.
+            Defaults to ``False``.
+        page_size: :class:`int`
+            The maximum number of messages to retrieve per request. Must be between 1 and 100. Defaults to 100.
+        prefetch: :class:`bool`
+            Whether to retrieve next page while current one is consumed. Defaults to ``True``.
+
+        Returns
+        -------
+        :class:`.MessageIterator`
+            The iterator.
+        """
+        return MessageIterator(
+            self._get_state().http,
+            self,
+            before=None if before is None else resolve_id(before),
+            after=None if after is None else resolve_id(after),
+            oldest_first=oldest_first,
+            populate_users=populate_users,
+            cache=cache,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+
+    def search_history(
+        self,
+        query: typing.Optional[str] = None,
+        *,
+        pinned: typing.Optional[bool] = None,
+        limit: typing.Optional[int] = None,
+        before: typing.Optional[ULIDOr[BaseMessage]] = None,
+        after: typing.Optional[ULIDOr[BaseMessage]] = None,
+        oldest_first: bool = False,
+        populate_users: typing.Optional[bool] = None,
+        page_size: int = 100,
+        prefetch: bool = True,
+    ) -> MessageIterator:
+        """Returns an asynchronous iterator over all messages in this channel matching search,
+        retrieving them page by page.
+
+        Results are ordered by time, not by relevance. Exactly one of ``query`` and ``pinned`` must be provided.
+
+        .. note::
+            This can only be used by non-bot accounts.
+
+        Parameters
+        ----------
+        query: Optional[:class:`str`]
+            The full-text search query. See `MongoDB documentation <https://www.mongodb.com/docs/manual/text-search/>`_ for more information.
+        pinned: Optional[:class:`bool`]
+            Whether to search for (un-)pinned messages or not.
+        limit: Optional[:class:`int`]
+            The maximum number of messages to retrieve. If ``None``, all matching messages are retrieved.
+        before: Optional[ULIDOr[:class:`.BaseMessage`]]
+            The message before which messages should be retrieved.
+        after: Optional[ULIDOr[:class:`.BaseMessage`]]
+            The message after which messages should be retrieved.
+        oldest_first: :class:`bool`
+            Whether to iterate from oldest messages to newest ones. Defaults to ``False``.
+        populate_users: Optional[:class:`bool`]
+            Whether to populate user (and member, if server channel) objects.
+        page_size: :class:`int`
+            The maximum number of messages to retrieve per request. Must be between 1 and 100. Defaults to 100.
+        prefetch: :class:`bool`
+            Whether to retrieve next page while current one is consumed. Defaults to ``True``.
+
+        Returns
+        -------
+        :class:`.MessageIterator`
+            The iterator.
+        """
+        if query is None and pinned is None:
+            raise TypeError('Either query or pinned must be provided')
+        return MessageIterator(
+            self._get_state().http,
+            self,
+            query=query,
+            pinned=pinned,
+            before=None if before is None else resolve_id(before),
+            after=None if after is None else resolve_id(after),
+            oldest_first=oldest_first,
+            populate_users=populate_users,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+
     async def search(
         self,
         query: typing.Optional[str] = None,
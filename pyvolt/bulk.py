@@ -0,0 +1,166 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2024-present MCausc78
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+import logging
+import typing
+
+from attrs import define, field
+
+if typing.TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+
+_L = logging.getLogger(__name__)
+
+T = typing.TypeVar('T')
+
+
+@define(slots=True)
+class BulkResult(typing.Generic[T]):
+    """Represents the result of operation on single target of :class:`.BulkOperation`."""
+
+    target: str = field(repr=True, kw_only=True)
+    """:class:`str`: The target's ID."""
+
+    value: typing.Optional[T] = field(repr=True, kw_only=True)
+    """Optional[T]: The value returned by operation, if it succeeded."""
+
+    error: typing.Optional[Exception] = field(repr=True, kw_only=True)
+    """Optional[:class:`Exception`]: The exception raised by operation, if it failed."""
+
+    @property
+    def ok(self) -> bool:
+        """:class:`bool`: Whether the operation succeeded."""
+        return self.error is None
+
+
+class BulkOperation(typing.Generic[T]):
+    """An asynchronous iterator that performs operation on many targets concurrently,
+    yielding :class:`.BulkResult` for each target as soon as it completes.
+
+    Targets that failed, or were not processed because iteration was stopped early, are kept
+    in :attr:`.remaining`, and iterating over operation again retries them.
+
+    .. container:: operations
+
+        .. describe:: async for result in x
+
+            Performs the operation on remaining targets.
+
+    Parameters
+    ----------
+    targets: Iterable[:class:`str`]
+        The IDs of targets. Duplicates are ignored.
+    func: Callable[[:class:`str`], Awaitable[T]]
+        The function performing operation on single target.
+    concurrency: :class:`int`
+        How many targets to process at once. Excess requests wait for rate limiter anyway,
+        so this mostly should match the size of ratelimit bucket.
+
+    Attributes
+    ----------
+    remaining: Dict[:class:`str`, None]
+        The targets that were not processed successfully yet, in order they were provided.
+    failed: Dict[:class:`str`, :class:`Exception`]
+        The targets whose last attempt failed, mapped to exception raised.
+    concurrency: :class:`int`
+        How many targets to process at once.
+    """
+
+    __slots__ = (
+        '_func',
+        'concurrency',
+        'failed',
+        'remaining',
+    )
+
+    def __init__(
+        self,
+        targets: Iterable[str],
+        func: Callable[[str], Awaitable[T]],
+        /,
+        *,
+        concurrency: int = 10,
+    ) -> None:
+        self._func: Callable[[str], Awaitable[T]] = func
+        self.concurrency: int = max(concurrency, 1)
+        self.failed: dict[str, Exception] = {}
+        self.remaining: dict[str, None] = dict.fromkeys(targets)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} remaining={len(self.remaining)} failed={len(self.failed)}>'
+
+    def __aiter__(self) -> AsyncGenerator[BulkResult[T], None]:
+        return self._run()
+
+    def _record(self, result: BulkResult[T], /) -> None:
+        if result.error is None:
+            self.remaining.pop(result.target, None)
+            self.failed.pop(result.target, None)
+        else:
+            self.failed[result.target] = result.error
+
+    async def _run(self) -> AsyncGenerator[BulkResult[T], None]:
+        targets = deque(self.remaining)
+        count = len(targets)
+        if not count:
+            return
+
+        results: asyncio.Queue[BulkResult[T]] = asyncio.Queue()
+        func = self._func
+
+        async def worker() -> None:
+            while targets:
+                target = targets.popleft()
+                try:
+                    value = await func(target)
+                except Exception as exc:
+                    _L.debug('Bulk operation on %s failed: %s', target, exc)
+                    results.put_nowait(BulkResult(target=target, value=None, error=exc))
+                else:
+                    results.put_nowait(BulkResult(target=target, value=value, error=None))
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(self.concurrency, count))]
+        try:
+            for _ in range(count):
+                result = await results.get()
+                self._record(result)
+                yield result
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+            # Do not retry targets that completed while iteration was being stopped
+            while not results.empty():
+                self._record(results.get_nowait())
+
+
+__all__ = (
+    'BulkResult',
+    'BulkOperation',
+)
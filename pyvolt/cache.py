@@ -25,19 +25,35 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from array import array
+import asyncio
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator, MutableMapping
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+import gc
+from io import BytesIO
 import logging
+import os
+import pickle
+from sys import getsizeof
+import threading
+from time import monotonic
 import typing
 
 from attrs import define, field
 
+from .core import __version__ as version
 from .emoji import DetachedEmoji, ServerEmoji, Emoji
 from .enums import Enum
 from .user import User
 
 if typing.TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Iterable, Mapping, Sequence
+    from os import PathLike
 
-    from .channel import DMChannel, GroupChannel, Channel, ChannelVoiceStateContainer
+    from .cdn import StatelessAsset
+    from .channel import DMChannel, GroupChannel, ServerChannel, Channel, ChannelVoiceStateContainer
     from .events import (
         ReadyEvent,
         PrivateChannelCreateEvent,
@@ -86,7 +102,8 @@ if typing.TYPE_CHECKING:
     )
     from .message import Message
     from .read_state import ReadState
-    from .server import Server, Member
+    from .server import Server, Member, Role
+    from .state import State
 
 _L = logging.getLogger(__name__)
 
@@ -780,6 +797,25 @@ class Cache(ABC):
 
     __slots__ = ()
 
+    async def start(self) -> None:
+        """|coro|
+
+        Called when the client is starting up, before the shard connects.
+        """
+        pass
+
+    async def close(self) -> None:
+        """|coro|
+
+        Called when the client is closing.
+        """
+        pass
+
+    @property
+    def stats(self) -> typing.Optional[CacheStats]:
+        """Optional[:class:`.CacheStats`]: The statistics of cache operations, if collected."""
+        return None
+
     ############
     # Channels #
     ############
@@ -844,6 +880,64 @@ class Cache(ABC):
         """Mapping[:class:`str`, Union[:class:`.DMChannel`, :class:`.GroupChannel`]]: Retrieve all private channels as mapping."""
         ...
 
+    @abstractmethod
+    def get_server_channels_mapping_of(
+        self, server_id: str, ctx: BaseCacheContext, /
+    ) -> typing.Optional[Mapping[str, ServerChannel]]:
+        """Optional[Mapping[:class:`str`, :class:`.ServerChannel`]]: Retrieves all channels from a server as mapping.
+
+        Parameters
+        ----------
+        server_id: :class:`str`
+            The server's ID.
+        ctx: :class:`.BaseCacheContext`
+            The context.
+        """
+        ...
+
+    @abstractmethod
+    def delete_server_channels_of(self, server_id: str, ctx: BaseCacheContext, /) -> None:
+        """Deletes all channels from a server.
+
+        Parameters
+        ----------
+        server_id: :class:`str`
+            The server's ID.
+        ctx: :class:`.BaseCacheContext`
+            The context.
+        """
+        ...
+
+    def get_channels_by_name(
+        self,
+        name: str,
+        ctx: BaseCacheContext,
+        /,
+        *,
+        server_id: typing.Optional[str] = None,
+        prefix: bool = False,
+    ) -> Sequence[Channel]:
+        """Sequence[:class:`.Channel`]: Retrieves channels by name, case-insensitively.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The channel's name.
+        ctx: :class:`.BaseCacheContext`
+            The context.
+        server_id: Optional[:class:`str`]
+            The server's ID to retrieve channels from. If ``None``, channels are retrieved from everywhere.
+        prefix: :class:`bool`
+            Whether to retrieve channels with name starting with ``name``, instead of exactly matching. Defaults to ``False``.
+        """
+        if server_id is None:
+            channels = self.get_channels_mapping().values()
+        else:
+            channels = (self.get_server_channels_mapping_of(server_id, ctx) or {}).values()
+
+        name = name.casefold()
+        return [channel for channel in channels if _name_matches(name, prefix, getattr(channel, 'name', None))]
+
     ####################
     # Channel Messages #
     ####################
@@ -933,6 +1027,149 @@ class Cache(ABC):
         """
         ...
 
+    @abstractmethod
+    def get_messages_by_author(self, author_id: str, ctx: BaseCacheContext, /) -> Sequence[Message]:
+        """Sequence[:class:`.Message`]: Retrieves all messages sent by a user or webhook, across all channels.
+
+        Parameters
+        ----------
+        author_id: :class:`str`
+            The user's or webhook's ID.
+        ctx: :class:`.BaseCacheContext`
+            The context.
+        """
+        ...
+
+    @abstractmethod
+    def delete_messages_by_author(self, author_id: str, ctx: BaseCacheContext, /) -> None:
+        """Deletes all messages sent by a user or webhook, across all channels.
+
+        Parameters
+        ----------
+        author_id: :class:`str`
+            The user's or webhook's ID.
+        ctx: :class:`.BaseCacheContext`
+            The context.
+        """
+        ...
+
+    @abstractmethod
+    def get_messages_in_server(self, server_id: str, ctx: BaseCacheContext, /) -> Sequence[Message]:
+        """Sequence[:class:`.Message`]: Retrieves all messages sent in channels of a server.
+
+        Parameters
+        ----------
+        server_id: :class:`str`
+            The server's ID.
+        ctx: :class:`.BaseCacheContext`
+            The context.
+        """
+        ...
+
+    @abstractmethod
+    def delete_messages_in_server(self, server_id: str, ctx: BaseCacheContext, /) -> None:
+        """Deletes all messages sent in channels of a server.
+
+        Parameters
+        ----------
+        server_id: :class:`str`
+            The server's ID.
+        ctx: :class:`.BaseCacheContext`
+            The context.
+        """
+        ...
+
+    def get_messages_range(
+        self,
+        channel_id: str,
+        ctx: BaseCacheContext,
+        /,
+        *,
+        before: typing.Optional[str] = None,
+        after: typing.Optional[str] = None,
+        limit: int = 50,
+        oldest_first: bool = False,
+        partial: bool = False,
+    ) -> typing.Optional[list[Message]]:
+        """Retrieves messages from a channel, but only if cache is known to hold every message in requested range.
+
+        The default implementation always returns ``None``.
+
+        Parameters
+        ----------
+        channel_id: :class:`str`
+            The channel's ID.
+        ctx: :class:`.BaseCacheContext`
+            The context.
+        before: Optional[:class:`str`]
+            The message ID to retrieve messages before, exclusive.
+        after: Optional[:class:`str`]
+            The message ID to retrieve messages after, exclusive.
+        limit: :class:`int`
+            The maximum number of messages to retrieve.
+        oldest_first: :class:`bool`
+            Whether to retrieve oldest messages in range first. Defaults to ``False``, retrieving newest messages.
+        partial: :class:`bool`
+            Whether to return messages up to first gap in cache, instead of returning ``None``.
+            Messages start at ``before`` (or ``after``, if ``oldest_first`` is ``True``), and the list
+            is empty if messages right next to it are not known to be cached.
+
+        Returns
+        -------
+        Optional[List[:class:`.Message`]]
+            The messages, sorted in requested order, or ``None`` if some of them might be missing from cache.
+        """
+        return None
+
+    def store_messages_range(
+        self,
+        channel_id: str,
+        messages: list[Message],
+        ctx: BaseCacheContext,
+        /,
+        *,
+        before: typing.Optional[str] = None,
+        after: typing.Optional[str] = None,
+        limit: int = 50,
+        oldest_first: bool = False,
+    ) -> None:
+        """Stores messages retrieved from API, marking the range they were retrieved from as contiguous.
+
+        The parameters are same as ones passed to :meth:`.HTTPClient.get_messages`. The default
+        implementation stores messages using :meth:`.store_message`.
+
+        Parameters
+        ----------
+        channel_id: :class:`str`
+            The channel's ID.
+        messages: List[:class:`.Message`]
+            The messages to store.
+        ctx: :class:`.BaseCacheContext`
+            The context.
+        before: Optional[:class:`str`]
+            The message ID messages were retrieved before.
+        after: Optional[:class:`str`]
+            The message ID messages were retrieved after.
+        limit: :class:`int`
+            The maximum number of messages that were requested.
+        oldest_first: :class:`bool`
+            Whether the oldest messages were requested first.
+        """
+        for message in messages:
+            self.store_message(message, ctx)
+
+    def reset_live_message_ranges(self, ctx: BaseCacheContext, /) -> None:
+        """Called when messages might have been missed, such as after reconnecting.
+
+        Messages received afterwards are no longer known to be contiguous with ones cached before.
+
+        Parameters
+        ----------
+        ctx: :class:`.BaseCacheContext`
+            The context.
+        """
+        pass
+
     ###############
     # Read States #
     ###############
@@ -1085,6 +1322,36 @@ class Cache(ABC):
         """
         ...
 
+    def get_emojis_by_name(
+        self,
+        name: str,
+        ctx: BaseCacheContext,
+        /,
+        *,
+        server_id: typing.Optional[str] = None,
+        prefix: bool = False,
+    ) -> Sequence[Emoji]:
+        """Sequence[:class:`.Emoji`]: Retrieves emojis by name, case-insensitively.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The emoji's name.
+        ctx: :class:`.BaseCacheContext`
+            The context.
+        server_id: Optional[:class:`str`]
+            The server's ID to retrieve emojis from. If ``None``, emojis are retrieved from everywhere.
+        prefix: :class:`bool`
+            Whether to retrieve emojis with name starting with ``name``, instead of exactly matching. Defaults to ``False``.
+        """
+        if server_id is None:
+            emojis = self.get_emojis_mapping().values()
+        else:
+            emojis = (self.get_server_emojis_mapping_of(server_id, ctx) or {}).values()
+
+        name = name.casefold()
+        return [emoji for emoji in emojis if _name_matches(name, prefix, emoji.name)]
+
     ###########
     # Servers #
     ###########
@@ -1148,6 +1415,29 @@ class Cache(ABC):
         """
         ...
 
+    def get_roles_by_name(
+        self, server_id: str, name: str, ctx: BaseCacheContext, /, *, prefix: bool = False
+    ) -> Sequence[Role]:
+        """Sequence[:class:`.Role`]: Retrieves roles in server by name, case-insensitively.
+
+        Parameters
+        ----------
+        server_id: :class:`str`
+            The server's ID.
+        name: :class:`str`
+            The role's name.
+        ctx: :class:`.BaseCacheContext`
+            The context.
+        prefix: :class:`bool`
+            Whether to retrieve roles with name starting with ``name``, instead of exactly matching. Defaults to ``False``.
+        """
+        server = self.get_server(server_id, ctx)
+        if server is None:
+            return []
+
+        name = name.casefold()
+        return [role for role in server.roles.values() if _name_matches(name, prefix, role.name)]
+
     ##################
     # Server Members #
     ##################
@@ -1279,6 +1569,37 @@ class Cache(ABC):
         """
         ...
 
+    def get_server_members_by_name(
+        self, server_id: str, name: str, ctx: BaseCacheContext, /, *, prefix: bool = False
+    ) -> Sequence[Member]:
+        """Sequence[:class:`.Member`]: Retrieves members in server by nickname, name or display name, case-insensitively.
+
+        Parameters
+        ----------
+        server_id: :class:`str`
+            The server's ID.
+        name: :class:`str`
+            The member's nickname, or user's name or display name.
+        ctx: :class:`.BaseCacheContext`
+            The context.
+        prefix: :class:`bool`
+            Whether to retrieve members with name starting with ``name``, instead of exactly matching. Defaults to ``False``.
+        """
+        members = self.get_server_members_mapping_of(server_id, ctx)
+        if not members:
+            return []
+
+        name = name.casefold()
+        result = []
+        for member in members.values():
+            if _name_matches(name, prefix, member.nick):
+                result.append(member)
+                continue
+            user = self.get_user(member.id, ctx)
+            if user is not None and _name_matches(name, prefix, user.name, user.display_name):
+                result.append(member)
+        return result
+
     #########
     # Users #
     #########
@@ -1336,6 +1657,25 @@ class Cache(ABC):
         """
         ...
 
+    def get_users_by_name(self, name: str, ctx: BaseCacheContext, /, *, prefix: bool = False) -> Sequence[User]:
+        """Sequence[:class:`.User`]: Retrieves users by name or display name, case-insensitively.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The user's name or display name.
+        ctx: :class:`.BaseCacheContext`
+            The context.
+        prefix: :class:`bool`
+            Whether to retrieve users with name starting with ``name``, instead of exactly matching. Defaults to ``False``.
+        """
+        name = name.casefold()
+        return [
+            user
+            for user in self.get_users_mapping().values()
+            if _name_matches(name, prefix, user.name, user.display_name)
+        ]
+
     ############################
     # Private Channels by User #
     ############################
@@ -1484,6 +1824,14 @@ class EmptyCache(Cache):
     def get_private_channels_mapping(self) -> dict[str, typing.Union[DMChannel, GroupChannel]]:
         return {}
 
+    def get_server_channels_mapping_of(
+        self, server_id: str, ctx: BaseCacheContext, /
+    ) -> typing.Optional[Mapping[str, ServerChannel]]:
+        return None
+
+    def delete_server_channels_of(self, server_id: str, ctx: BaseCacheContext, /) -> None:
+        pass
+
     ####################
     # Channel Messages #
     ####################
@@ -1504,6 +1852,18 @@ class EmptyCache(Cache):
     def delete_messages_of(self, channel_id: str, ctx: BaseCacheContext, /) -> None:
         pass
 
+    def get_messages_by_author(self, author_id: str, ctx: BaseCacheContext, /) -> Sequence[Message]:
+        return []
+
+    def delete_messages_by_author(self, author_id: str, ctx: BaseCacheContext, /) -> None:
+        pass
+
+    def get_messages_in_server(self, server_id: str, ctx: BaseCacheContext, /) -> Sequence[Message]:
+        return []
+
+    def delete_messages_in_server(self, server_id: str, ctx: BaseCacheContext, /) -> None:
+        pass
+
     ###############
     # Read States #
     ###############
@@ -1681,6 +2041,482 @@ def _put1(d: dict[str, V], k: str, v: V, max_size: int, /) -> None:
         d[k] = v
 
 
+K = typing.TypeVar('K')
+
+
+def _touch(expiry: dict[K, float], k: K, deadline: float, /) -> None:
+    # Re-insert the key so the mapping stays ordered by deadline, as TTL is same for every key.
+    expiry.pop(k, None)
+    expiry[k] = deadline
+
+
+def _pop_expired(expiry: dict[K, float], now: float, /) -> list[K]:
+    keys = []
+    for key, deadline in expiry.items():
+        if deadline > now:
+            break
+        keys.append(key)
+    for key in keys:
+        del expiry[key]
+    return keys
+
+
+def _name_matches(name: str, prefix: bool, /, *candidates: typing.Optional[str]) -> bool:
+    for candidate in candidates:
+        if candidate:
+            candidate = candidate.casefold()
+            if candidate.startswith(name) if prefix else candidate == name:
+                return True
+    return False
+
+
+class _NameIndex(typing.Generic[K]):
+    """Case-insensitive index of names to keys, supporting exact and prefix lookups."""
+
+    __slots__ = ('_keys', '_names', '_sorted_names')
+
+    def __init__(self) -> None:
+        self._keys: dict[K, tuple[str, ...]] = {}
+        self._names: dict[str, dict[K, None]] = {}
+        # Built lazily on first prefix lookup, and dropped when new name is added.
+        # Names removed since then are still there, but are skipped on lookup.
+        self._sorted_names: typing.Optional[list[str]] = None
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def set(self, key: K, names: Iterable[typing.Optional[str]], /) -> None:
+        folded = tuple(dict.fromkeys(name.casefold() for name in names if name))
+        old = self._keys.get(key)
+        if old == folded:
+            return
+        if old is not None:
+            self._discard(key, old)
+        if not folded:
+            self._keys.pop(key, None)
+            return
+        self._keys[key] = folded
+        for name in folded:
+            keys = self._names.get(name)
+            if keys is None:
+                self._names[name] = {key: None}
+                self._sorted_names = None
+            else:
+                keys[key] = None
+
+    def remove(self, key: K, /) -> None:
+        old = self._keys.pop(key, None)
+        if old is not None:
+            self._discard(key, old)
+
+    def _discard(self, key: K, names: tuple[str, ...], /) -> None:
+        for name in names:
+            keys = self._names.get(name)
+            if keys is not None:
+                keys.pop(key, None)
+                if not keys:
+                    del self._names[name]
+
+    def get(self, name: str, /, *, prefix: bool = False) -> list[K]:
+        name = name.casefold()
+        if not prefix:
+            keys = self._names.get(name)
+            return list(keys) if keys else []
+
+        sorted_names = self._sorted_names
+        if sorted_names is None:
+            sorted_names = self._sorted_names = sorted(self._names)
+
+        result: dict[K, None] = {}
+        for i in range(bisect_left(sorted_names, name), len(sorted_names)):
+            current = sorted_names[i]
+            if not current.startswith(name):
+                break
+            keys = self._names.get(current)
+            if keys:
+                result.update(keys)
+        return list(result)
+
+
+def _range_start(r: list[str], /) -> str:
+    return r[0]
+
+
+class _MessageTimeline:
+    """Message IDs of single channel in ULID order, along with ranges known to be contiguous.
+
+    Range ``[lo, hi]`` means that every existing message with ID between ``lo`` and ``hi`` inclusive is cached.
+    Empty ``lo`` means the range starts at the beginning of channel. The live range is extended
+    by messages received over WebSocket, and covers everything up to now.
+    """
+
+    __slots__ = ('ids', 'ranges', 'live')
+
+    def __init__(self) -> None:
+        self.ids: list[str] = []
+        self.ranges: list[list[str]] = []
+        self.live: typing.Optional[list[str]] = None
+
+    def add(self, message_id: str, /, *, live: bool = False) -> None:
+        ids = self.ids
+        i = bisect_left(ids, message_id)
+        if i == len(ids) or ids[i] != message_id:
+            ids.insert(i, message_id)
+
+        if live:
+            current = self.live
+            if current is None:
+                self.live = self.cover(message_id, message_id)
+            elif message_id > current[1]:
+                self.live = self.cover(current[0], message_id)
+
+    def discard(self, message_id: str, /) -> None:
+        ids = self.ids
+        i = bisect_left(ids, message_id)
+        if i != len(ids) and ids[i] == message_id:
+            del ids[i]
+
+    def evict(self, message_id: str, /) -> None:
+        # Unlike deleted messages, evicted ones still exist, so ranges containing them must be split
+        self.discard(message_id)
+
+        ranges = self.ranges
+        i = bisect_right(ranges, message_id, key=_range_start) - 1
+        if i < 0:
+            return
+        r = ranges[i]
+        if r[1] < message_id:
+            return
+
+        ids = self.ids
+        j = bisect_left(ids, message_id)
+        left = [r[0], ids[j - 1]] if j > 0 and ids[j - 1] >= r[0] else None
+        if j < len(ids) and ids[j] <= r[1]:
+            r[0] = ids[j]
+            if left is not None:
+                ranges.insert(i, left)
+        else:
+            if r is self.live:
+                self.live = None
+            if left is not None:
+                ranges[i] = left
+            else:
+                del ranges[i]
+
+    def cover(self, lo: str, hi: str, /) -> list[str]:
+        """Marks messages between ``lo`` and ``hi`` as contiguous, merging overlapping ranges."""
+        ranges = self.ranges
+        i = bisect_left(ranges, lo, key=_range_start)
+        if i > 0 and ranges[i - 1][1] >= lo:
+            i -= 1
+        j = i
+        while j < len(ranges) and ranges[j][0] <= hi:
+            j += 1
+
+        merged = None
+        for r in ranges[i:j]:
+            if r[0] < lo:
+                lo = r[0]
+            if r[1] > hi:
+                hi = r[1]
+            if r is self.live:
+                merged = r
+        if merged is None:
+            merged = [lo, hi]
+        else:
+            merged[0] = lo
+            merged[1] = hi
+        ranges[i:j] = [merged]
+        return merged
+
+    def query(
+        self,
+        before: typing.Optional[str],
+        after: typing.Optional[str],
+        limit: int,
+        oldest_first: bool,
+        partial: bool = False,
+        /,
+    ) -> typing.Optional[list[str]]:
+        ids = self.ids
+        start = 0 if after is None else bisect_right(ids, after)
+        end = len(ids) if before is None else bisect_left(ids, before)
+        if end < start:
+            end = start
+
+        if partial:
+            # Take messages from the range containing the anchor (``after`` or ``before``), up to its end
+            ranges = self.ranges
+            if oldest_first:
+                anchor = after or ''
+                i = bisect_right(ranges, anchor, key=_range_start) - 1
+                if i < 0:
+                    return []
+                r = ranges[i]
+                if r is not self.live:
+                    if r[1] < anchor:
+                        return []
+                    end = min(end, bisect_right(ids, r[1]))
+                return ids[start : min(end, start + limit)]
+
+            if before is None:
+                r = self.live
+                if r is None:
+                    return []
+            else:
+                i = bisect_right(ranges, before, key=_range_start) - 1
+                if i < 0:
+                    return []
+                r = ranges[i]
+                if r is not self.live and r[1] < before:
+                    return []
+            start = max(start, bisect_left(ids, r[0]))
+            return ids[max(start, end - limit) : end]
+
+        if oldest_first:
+            selected = ids[start : min(end, start + limit)]
+            need_lo = after or ''
+            need_hi = selected[-1] if len(selected) == limit else before
+        else:
+            selected = ids[max(start, end - limit) : end]
+            need_lo = selected[0] if len(selected) == limit else (after or '')
+            need_hi = before
+
+        ranges = self.ranges
+        i = bisect_right(ranges, need_lo, key=_range_start) - 1
+        if i < 0:
+            return None
+        r = ranges[i]
+        if r is not self.live and (need_hi is None or r[1] < need_hi):
+            return None
+        return selected
+
+
+_EPOCH: typing.Final[datetime] = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND: typing.Final[timedelta] = timedelta(microseconds=1)
+
+
+class _CompactMemberMap(MutableMapping[str, 'Member']):
+    """A mapping of user IDs to members of single server, which stores member fields in parallel arrays.
+
+    Roles are stored as bitmaps against per-server role table, and rarely set fields
+    (nicks, avatars and timeouts) are stored in sparse dicts. :class:`.Member` objects are
+    materialized on each access, so mutating them has no effect on cache until they are stored again.
+    """
+
+    __slots__ = (
+        '_avatars',
+        '_flags',
+        '_ids',
+        '_joined_at',
+        '_nicks',
+        '_role_bits',
+        '_role_ids',
+        '_roles',
+        '_rows',
+        '_server_id',
+        '_state',
+        '_timeouts',
+    )
+
+    def __init__(self, server_id: str, /) -> None:
+        self._server_id: str = server_id
+        self._state: typing.Optional[State] = None
+        # User ID -> row. Key order is insertion order, used for iteration and trimming.
+        self._rows: dict[str, int] = {}
+        self._ids: list[str] = []
+        # Microseconds since Unix epoch.
+        self._joined_at: array[int] = array('q')
+        self._roles: list[int] = []
+        # Bit 0 is can_publish, bit 1 is can_receive.
+        self._flags: bytearray = bytearray()
+        self._nicks: dict[str, str] = {}
+        self._avatars: dict[str, StatelessAsset] = {}
+        self._timeouts: dict[str, datetime] = {}
+        self._role_ids: list[str] = []
+        self._role_bits: dict[str, int] = {}
+
+    def _pack_roles(self, roles: Iterable[str], /) -> int:
+        bits = 0
+        role_bits = self._role_bits
+        for role_id in roles:
+            bit = role_bits.get(role_id)
+            if bit is None:
+                bit = role_bits[role_id] = len(self._role_ids)
+                self._role_ids.append(role_id)
+            bits |= 1 << bit
+        return bits
+
+    def _unpack_roles(self, bits: int, /) -> list[str]:
+        roles = []
+        role_ids = self._role_ids
+        i = 0
+        while bits:
+            if bits & 1:
+                roles.append(role_ids[i])
+            bits >>= 1
+            i += 1
+        return roles
+
+    def __getitem__(self, user_id: str, /) -> Member:
+        from .server import Member
+
+        row = self._rows[user_id]
+        flags = self._flags[row]
+        return Member(
+            state=self._state,  # type: ignore
+            server_id=self._server_id,
+            _user=user_id,
+            joined_at=_EPOCH + self._joined_at[row] * _MICROSECOND,
+            nick=self._nicks.get(user_id),
+            internal_server_avatar=self._avatars.get(user_id),
+            roles=self._unpack_roles(self._roles[row]),
+            timed_out_until=self._timeouts.get(user_id),
+            can_publish=bool(flags & 1),
+            can_receive=bool(flags & 2),
+        )
+
+    def __setitem__(self, user_id: str, member: Member, /) -> None:
+        if self._state is None:
+            self._state = member.state
+
+        joined_at = member.joined_at
+        if joined_at.tzinfo is None:
+            joined_at = joined_at.replace(tzinfo=timezone.utc)
+        micros = (joined_at - _EPOCH) // _MICROSECOND
+        roles = self._pack_roles(member.roles)
+        flags = member.can_publish | (member.can_receive << 1)
+
+        row = self._rows.get(user_id)
+        if row is None:
+            self._rows[user_id] = len(self._ids)
+            self._ids.append(user_id)
+            self._joined_at.append(micros)
+            self._roles.append(roles)
+            self._flags.append(flags)
+        else:
+            self._joined_at[row] = micros
+            self._roles[row] = roles
+            self._flags[row] = flags
+
+        for sparse, value in (
+            (self._nicks, member.nick),
+            (self._avatars, member.internal_server_avatar),
+            (self._timeouts, member.timed_out_until),
+        ):
+            if value is None:
+                sparse.pop(user_id, None)  # type: ignore
+            else:
+                sparse[user_id] = value  # type: ignore
+
+    def __delitem__(self, user_id: str, /) -> None:
+        row = self._rows.pop(user_id)
+
+        # Move last row into the hole, so removal is O(1)
+        last = len(self._ids) - 1
+        if row != last:
+            moved = self._ids[last]
+            self._ids[row] = moved
+            self._joined_at[row] = self._joined_at[last]
+            self._roles[row] = self._roles[last]
+            self._flags[row] = self._flags[last]
+            self._rows[moved] = row
+
+        self._ids.pop()
+        self._joined_at.pop()
+        self._roles.pop()
+        self._flags.pop()
+
+        self._nicks.pop(user_id, None)
+        self._avatars.pop(user_id, None)
+        self._timeouts.pop(user_id, None)
+
+    def __contains__(self, user_id: object, /) -> bool:
+        return user_id in self._rows
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} server_id={self._server_id!r} len={len(self._rows)}>'
+
+
+_SNAPSHOT_VERSION: typing.Final[int] = 1
+
+
+_ATTRS_FIELDS: dict[type, tuple[str, ...]] = {}
+
+
+def _attrs_fields_of(cls: type, /) -> tuple[str, ...]:
+    try:
+        return _ATTRS_FIELDS[cls]
+    except KeyError:
+        pass
+    ret = _ATTRS_FIELDS[cls] = tuple(a.name for a in cls.__attrs_attrs__)  # type: ignore
+    return ret
+
+
+def _restore_attrs(cls: type, values: tuple[typing.Any, ...], /) -> typing.Any:
+    obj = cls.__new__(cls)
+    setattr = object.__setattr__
+    for name, value in zip(_attrs_fields_of(cls), values):
+        setattr(obj, name, value)
+    return obj
+
+
+def _snapshot_state() -> typing.NoReturn:
+    # Stands in for State in snapshots, and is resolved by _SnapshotUnpickler.find_class
+    raise RuntimeError('State can be only restored via MapCache.load_snapshot')
+
+
+@contextmanager
+def _paused_gc() -> Iterator[None]:
+    # Garbage collector passes are triggered by allocations, and take most of time when
+    # millions of objects are (un)pickled at once. Disabling it affects whole process,
+    # so this is done only on main thread, where event loop usually runs.
+    if not gc.isenabled() or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+class _SnapshotPickler(pickle.Pickler):
+    def reducer_override(self, obj: typing.Any, /) -> typing.Any:
+        # Pickle attrs slotted classes as tuple of field values, as attrs's own
+        # __getstate__ builds a dictionary for every object, which is slow and large.
+        cls = type(obj)
+        names = _ATTRS_FIELDS.get(cls)
+        if names is None:
+            from .state import State
+
+            if isinstance(obj, State):
+                return (_snapshot_state, ())
+            if '__slots__' not in cls.__dict__ or getattr(cls, '__attrs_attrs__', None) is None:
+                return NotImplemented
+            names = _attrs_fields_of(cls)
+        return (_restore_attrs, (cls, tuple([getattr(obj, name) for name in names])))
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    def __init__(self, file: typing.IO[bytes], state: State, /) -> None:
+        super().__init__(file)
+        self.state: State = state
+
+    def find_class(self, module: str, name: str, /) -> typing.Any:
+        if module == __name__ and name == '_snapshot_state':
+            state = self.state
+            return lambda: state
+        return super().find_class(module, name)
+
+
 class MapCache(Cache):
     """Implementation of :class:`.Cache` ABC based on :class:`dict`'s.
 
@@ -1710,31 +2546,87 @@ class MapCache(Cache):
         How many users can have cache. Defaults to ``-1``.
     channel_voice_states_max_size: :class:`int`
         How many channel voice state containers can have cache. Defaults to ``-1``.
+    messages_ttl: Optional[:class:`float`]
+        How long, in seconds, a message is kept in cache since it was last stored. Defaults to ``None``, meaning forever.
+    server_members_ttl: Optional[:class:`float`]
+        How long, in seconds, a member is kept in cache since it was last stored. Defaults to ``None``, meaning forever.
+    users_ttl: Optional[:class:`float`]
+        How long, in seconds, a user is kept in cache since it was last stored. Defaults to ``None``, meaning forever.
+    expiry_sweep_interval: :class:`float`
+        How often, in seconds, expired entries are swept out in background after :meth:`.start` is called.
+        Expired entries are also dropped lazily on access and when storing new entries.
+        Defaults to ``60``.
+    name_indexes: :class:`bool`
+        Whether to maintain case-insensitive indexes of user, member, channel, role and emoji names,
+        used by lookups such as :meth:`.get_users_by_name`. Defaults to ``False``.
+    stats: :class:`bool`
+        Whether to collect statistics of cache operations, available via :attr:`.stats`. Defaults to ``False``.
+    compact_members: :class:`bool`
+        Whether to store server members compactly, with fields in parallel arrays and roles as bitmaps.
+        This greatly reduces memory used by large servers, at cost of creating :class:`.Member` object
+        on each access. Mutating such members has no effect until they are stored again, and order
+        of :attr:`.Member.roles` is not preserved. Defaults to ``False``.
+    snapshot_path: Optional[Union[:class:`str`, :class:`os.PathLike`]]
+        The path to snapshot file. If set, the cache is restored from it in :meth:`.start`, before
+        the shard connects, and saved to it periodically and in :meth:`.close`. Defaults to ``None``.
+
+        .. warning::
+            Snapshots are pickled, so only restore snapshots written by yourself.
+    snapshot_interval: :class:`float`
+        How often, in seconds, the snapshot is saved in background. Non-positive value means
+        the snapshot is only saved on close. Defaults to ``300``.
+    state: Optional[:class:`.State`]
+        The state to attach objects restored from snapshot to. Required if ``snapshot_path`` is set.
     """
 
     __slots__ = (
         '_channels',
+        '_channel_names',
         '_channels_max_size',
         '_channel_voice_states',
         '_channel_voice_states_max_size',
+        '_compact_members',
         '_emojis',
+        '_emoji_names',
         '_emojis_max_size',
+        '_expiry_sweep_interval',
+        '_expiry_sweeper',
+        '_name_indexes',
         '_private_channels',
         '_private_channels_by_user',
         '_private_channels_by_user_max_size',
         '_private_channels_max_size',
         '_messages',
+        '_messages_by_author',
+        '_message_channels_by_server',
+        '_message_channel_servers',
+        '_messages_expiry',
+        '_message_timelines',
         '_messages_max_size',
+        '_messages_ttl',
         '_read_states',
         '_read_states_max_size',
+        '_role_names',
         '_servers',
         '_servers_max_size',
+        '_snapshot_interval',
+        '_snapshot_path',
+        '_snapshot_saver',
+        '_snapshot_state',
+        '_stats',
+        '_server_channels',
         '_server_emojis',
         '_server_emojis_max_size',
         '_server_members',
+        '_server_members_expiry',
+        '_server_member_nicks',
         '_server_members_max_size',
+        '_server_members_ttl',
         '_users',
+        '_users_expiry',
+        '_user_names',
         '_users_max_size',
+        '_users_ttl',
     )
 
     def __init__(
@@ -1751,7 +2643,20 @@ class MapCache(Cache):
         servers_max_size: int = -1,
         users_max_size: int = -1,
         channel_voice_states_max_size: int = -1,
+        messages_ttl: typing.Optional[float] = None,
+        server_members_ttl: typing.Optional[float] = None,
+        users_ttl: typing.Optional[float] = None,
+        expiry_sweep_interval: float = 60.0,
+        name_indexes: bool = False,
+        stats: bool = False,
+        compact_members: bool = False,
+        snapshot_path: typing.Optional[typing.Union[str, PathLike[str]]] = None,
+        snapshot_interval: float = 300.0,
+        state: typing.Optional[State] = None,
     ) -> None:
+        if snapshot_path is not None and state is None:
+            raise TypeError('state must be provided when snapshot_path is set')
+
         self._channels: dict[str, Channel] = {}
         self._channels_max_size: int = channels_max_size
         self._emojis: dict[str, Emoji] = {}
@@ -1762,109 +2667,688 @@ class MapCache(Cache):
         self._private_channels_max_size: int = private_channels_max_size
         self._messages: dict[str, dict[str, Message]] = {}
         self._messages_max_size = messages_max_size
+        # Secondary indexes. Dicts with ``None`` values are used as ordered sets.
+        self._messages_by_author: dict[str, dict[tuple[str, str], None]] = {}
+        self._message_timelines: dict[str, _MessageTimeline] = {}
+        self._message_channels_by_server: dict[str, dict[str, None]] = {}
+        self._message_channel_servers: dict[str, str] = {}
         self._read_states: dict[str, ReadState] = {}
         self._read_states_max_size: int = read_states_max_size
         self._servers: dict[str, Server] = {}
         self._servers_max_size: int = servers_max_size
+        self._server_channels: dict[str, dict[str, ServerChannel]] = {}
         self._server_emojis: dict[str, dict[str, ServerEmoji]] = {}
         self._server_emojis_max_size: int = server_emojis_max_size
-        self._server_members: dict[str, dict[str, Member]] = {}
+        self._server_members: dict[str, MutableMapping[str, Member]] = {}
         self._server_members_max_size: int = server_members_max_size
+        self._compact_members: bool = compact_members
         self._users: dict[str, User] = {}
         self._users_max_size: int = users_max_size
         self._channel_voice_states: dict[str, ChannelVoiceStateContainer] = {}
         self._channel_voice_states_max_size: int = channel_voice_states_max_size
+        self._messages_expiry: dict[tuple[str, str], float] = {}
+        self._messages_ttl: typing.Optional[float] = messages_ttl
+        self._server_members_expiry: dict[tuple[str, str], float] = {}
+        self._server_members_ttl: typing.Optional[float] = server_members_ttl
+        self._users_expiry: dict[str, float] = {}
+        self._users_ttl: typing.Optional[float] = users_ttl
+        self._expiry_sweep_interval: float = expiry_sweep_interval
+        self._expiry_sweeper: typing.Optional[asyncio.Task[None]] = None
+        self._name_indexes: bool = name_indexes
+        self._channel_names: _NameIndex[str] = _NameIndex()
+        self._emoji_names: _NameIndex[str] = _NameIndex()
+        self._role_names: dict[str, _NameIndex[str]] = {}
+        self._server_member_nicks: dict[str, _NameIndex[str]] = {}
+        self._user_names: _NameIndex[str] = _NameIndex()
+        self._stats: typing.Optional[CacheStats] = CacheStats() if stats else None
+        self._snapshot_path: typing.Optional[typing.Union[str, PathLike[str]]] = snapshot_path
+        self._snapshot_interval: float = snapshot_interval
+        self._snapshot_saver: typing.Optional[asyncio.Task[None]] = None
+        self._snapshot_state: typing.Optional[State] = state
+
+    @property
+    def stats(self) -> typing.Optional[CacheStats]:
+        return self._stats
+
+    async def start(self) -> None:
+        path = self._snapshot_path
+        if path is not None:
+            # Do not overwrite data if client was restarted without closing cache
+            if not self._servers and not self._users:
+                await self._restore_snapshot(path)
+            if self._snapshot_saver is None and self._snapshot_interval > 0:
+                self._snapshot_saver = asyncio.create_task(
+                    self._save_snapshot_loop(path), name='pyvolt-cache-snapshot-saver'
+                )
+
+        if self._expiry_sweeper is not None or self._expiry_sweep_interval <= 0:
+            return
+        if self._messages_ttl is None and self._server_members_ttl is None and self._users_ttl is None:
+            return
+        self._expiry_sweeper = asyncio.create_task(self._sweep_expired_loop(), name='pyvolt-cache-expiry-sweeper')
+
+    async def close(self) -> None:
+        for task in (self._expiry_sweeper, self._snapshot_saver):
+            if task is None:
+                continue
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._expiry_sweeper = None
+        self._snapshot_saver = None
+
+        path = self._snapshot_path
+        if path is not None:
+            try:
+                await self._save_snapshot(path)
+            except Exception:
+                _L.exception('Failed to save cache snapshot to %s', path)
 
     ############
-    # Channels #
+    # Snapshot #
     ############
-    def get_channel(self, channel_id: str, ctx: BaseCacheContext, /) -> typing.Optional[Channel]:
-        return self._channels.get(channel_id)
 
-    def get_channels_mapping(self) -> Mapping[str, Channel]:
-        return self._channels
+    def _collect_snapshot(self) -> dict[str, typing.Any]:
+        # Only containers are copied, so this is fast enough to do on event loop.
+        return {
+            'version': _SNAPSHOT_VERSION,
+            'library_version': version,
+            'users': dict(self._users),
+            'servers': list(self._servers.values()),
+            'channels': list(self._channels.values()),
+            'emojis': list(self._emojis.values()),
+            'server_members': {server_id: dict(members) for server_id, members in self._server_members.items()},
+            'messages': [list(messages.values()) for messages in self._messages.values()],
+            'read_states': list(self._read_states.values()),
+            'private_channels_by_user': dict(self._private_channels_by_user),
+            'channel_voice_states': dict(self._channel_voice_states),
+        }
+
+    @staticmethod
+    def _write_snapshot(fp: typing.IO[bytes], snapshot: dict[str, typing.Any], /) -> None:
+        with _paused_gc():
+            _SnapshotPickler(fp, protocol=pickle.HIGHEST_PROTOCOL).dump(snapshot)
+
+    @staticmethod
+    def _read_snapshot(fp: typing.IO[bytes], state: State, /) -> dict[str, typing.Any]:
+        with _paused_gc():
+            snapshot = _SnapshotUnpickler(fp, state).load()
+
+        if not isinstance(snapshot, dict):
+            raise ValueError('Invalid cache snapshot')
+        if snapshot.get('version') != _SNAPSHOT_VERSION or snapshot.get('library_version') != version:
+            raise ValueError(
+                f'Unsupported cache snapshot version: {snapshot.get("version")!r} (pyvolt {snapshot.get("library_version")})'
+            )
+        return snapshot
+
+    def _apply_snapshot(self, snapshot: dict[str, typing.Any], /) -> None:
+        ctx = _UNDEFINED
+
+        self.bulk_store_users(snapshot['users'], ctx)
+        for server in snapshot['servers']:
+            self.store_server(server, ctx)
+        for channel in snapshot['channels']:
+            self.store_channel(channel, ctx)
+        for emoji in snapshot['emojis']:
+            self.store_emoji(emoji, ctx)
+        for server_id, members in snapshot['server_members'].items():
+            self.bulk_store_server_members(server_id, members, ctx)
+        for messages in snapshot['messages']:
+            for message in messages:
+                self.store_message(message, ctx)
+        for read_state in snapshot['read_states']:
+            self.store_read_state(read_state, ctx)
+        self._private_channels_by_user.update(snapshot['private_channels_by_user'])
+        self.bulk_store_channel_voice_states(snapshot['channel_voice_states'], ctx)
+
+    def dump_snapshot(self, fp: typing.IO[bytes], /) -> None:
+        """Writes snapshot of cache contents to a binary file.
 
-    def store_channel(self, channel: Channel, ctx: BaseCacheContext, /) -> None:
-        _put1(self._channels, channel.id, channel, self._channels_max_size)
+        Parameters
+        ----------
+        fp: :class:`io.BufferedIOBase`
+            The file to write snapshot to.
+        """
+        self._write_snapshot(fp, self._collect_snapshot())
+
+    def load_snapshot(self, fp: typing.IO[bytes], state: State, /) -> None:
+        """Reads snapshot previously written by :meth:`.dump_snapshot`, and stores its contents in cache.
 
-        from .channel import DMChannel, GroupChannel
+        .. warning::
+            Snapshots are pickled, so only load snapshots written by yourself.
 
-        if isinstance(channel, (DMChannel, GroupChannel)):
+        Parameters
+        ----------
+        fp: :class:`io.BufferedIOBase`
+            The file to read snapshot from.
+        state: :class:`.State`
+            The state to attach restored objects to.
+
+        Raises
+        ------
+        ValueError
+            The snapshot is invalid, or was written by other version of library.
+        """
+        self._apply_snapshot(self._read_snapshot(fp, state))
+
+    @staticmethod
+    def _read_snapshot_file(path: typing.Union[str, PathLike[str]], /) -> bytes:
+        with open(path, 'rb') as fp:
+            return fp.read()
+
+    @staticmethod
+    def _write_snapshot_file(path: typing.Union[str, PathLike[str]], data: bytes, /) -> None:
+        tmp = f'{os.fspath(path)}.tmp'
+        with open(tmp, 'wb') as fp:
+            fp.write(data)
+        os.replace(tmp, path)
+
+    async def _restore_snapshot(self, path: typing.Union[str, PathLike[str]], /) -> None:
+        try:
+            data = await asyncio.to_thread(self._read_snapshot_file, path)
+            # Shard is not connected yet, so unpickling on event loop does not delay any events
+            snapshot = self._read_snapshot(BytesIO(data), self._snapshot_state)  # type: ignore
+        except FileNotFoundError:
+            return
+        except Exception:
+            _L.warning('Failed to read cache snapshot from %s, ignoring', path, exc_info=True)
+            return
+
+        self._apply_snapshot(snapshot)
+        _L.debug('Restored cache snapshot from %s', path)
+
+    async def _save_snapshot(self, path: typing.Union[str, PathLike[str]], /) -> None:
+        # Objects are pickled on event loop, as events would mutate them while being pickled in thread.
+        # Only writing the file is done in thread.
+        fp = BytesIO()
+        self._write_snapshot(fp, self._collect_snapshot())
+        await asyncio.to_thread(self._write_snapshot_file, path, fp.getvalue())
+
+    async def _save_snapshot_loop(self, path: typing.Union[str, PathLike[str]], /) -> None:
+        while True:
+            await asyncio.sleep(self._snapshot_interval)
+            try:
+                await self._save_snapshot(path)
+            except Exception:
+                _L.exception('Failed to save cache snapshot to %s', path)
+
+    async def _sweep_expired_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._expiry_sweep_interval)
+            try:
+                count = self.sweep_expired()
+            except Exception:
+                _L.exception('Failed to sweep expired cache entries')
+            else:
+                if count:
+                    _L.debug('Swept %i expired cache entries', count)
+
+    def sweep_expired(self) -> int:
+        """Removes all expired messages, members and users from cache.
+
+        Returns
+        -------
+        :class:`int`
+            How many entries were removed.
+        """
+        now = monotonic()
+        return len(self._expire_messages(now)) + len(self._expire_server_members(now)) + len(self._expire_users(now))
+
+    def _expire_messages(self, now: float, /) -> list[tuple[str, str]]:
+        keys = _pop_expired(self._messages_expiry, now)
+        for channel_id, message_id in keys:
+            messages = self._messages.get(channel_id)
+            if messages is not None:
+                message = messages.pop(message_id, None)
+                if message is not None:
+                    self._unindex_message(message)
+                    self._message_timelines[channel_id].evict(message_id)
+                if not messages:
+                    del self._messages[channel_id]
+                    del self._message_timelines[channel_id]
+                    self._unindex_message_channel(channel_id)
+        if keys and self._stats is not None:
+            self._stats.record_eviction('messages', len(keys))
+        return keys
+
+    def _expire_server_members(self, now: float, /) -> list[tuple[str, str]]:
+        keys = _pop_expired(self._server_members_expiry, now)
+        for server_id, user_id in keys:
+            members = self._server_members.get(server_id)
+            if members is not None:
+                members.pop(user_id, None)
+            nicks = self._server_member_nicks.get(server_id)
+            if nicks is not None:
+                nicks.remove(user_id)
+        if keys and self._stats is not None:
+            self._stats.record_eviction('server_members', len(keys))
+        return keys
+
+    def _expire_users(self, now: float, /) -> list[str]:
+        keys = _pop_expired(self._users_expiry, now)
+        for user_id in keys:
+            self._users.pop(user_id, None)
+            self._user_names.remove(user_id)
+        if keys and self._stats is not None:
+            self._stats.record_eviction('users', len(keys))
+        return keys
+
+    ############
+    # Channels #
+    ############
+    def get_channel(self, channel_id: str, ctx: BaseCacheContext, /) -> typing.Optional[Channel]:
+        channel = self._channels.get(channel_id)
+        if self._stats is not None:
+            self._stats.record_get('channels', ctx, channel is not None)
+        return channel
+
+    def get_channels_mapping(self) -> Mapping[str, Channel]:
+        return self._channels
+
+    def store_channel(self, channel: Channel, ctx: BaseCacheContext, /) -> None:
+        from .channel import BaseServerChannel, DMChannel, GroupChannel
+
+        stats = self._stats
+        if stats is not None:
+            stats.record_store('channels', ctx)
+
+        channels = self._channels
+        max_size = self._channels_max_size
+        if max_size == 0:
+            return
+        if max_size > 0 and channel.id not in channels:
+            while len(channels) >= max_size:
+                self._remove_channel(next(iter(channels)))
+                if stats is not None:
+                    stats.record_eviction('channels')
+        channels[channel.id] = channel
+        if self._name_indexes:
+            self._channel_names.set(channel.id, (getattr(channel, 'name', None),))
+
+        if isinstance(channel, BaseServerChannel):
+            server_channels = self._server_channels.get(channel.server_id)
+            if server_channels is None:
+                self._server_channels[channel.server_id] = {channel.id: channel}  # type: ignore
+            else:
+                server_channels[channel.id] = channel  # type: ignore
+        elif isinstance(channel, (DMChannel, GroupChannel)):
             _put1(self._private_channels, channel.id, channel, self._private_channels_max_size)
 
+    def _unindex_channel(self, channel: Channel, /) -> None:
+        from .channel import BaseServerChannel
+
+        self._channel_names.remove(channel.id)
+        if isinstance(channel, BaseServerChannel):
+            server_channels = self._server_channels.get(channel.server_id)
+            if server_channels is not None:
+                server_channels.pop(channel.id, None)
+                if not server_channels:
+                    del self._server_channels[channel.server_id]
+        else:
+            self._private_channels.pop(channel.id, None)
+
+    def _remove_channel(self, channel_id: str, /) -> typing.Optional[Channel]:
+        channel = self._channels.pop(channel_id, None)
+        if channel is not None:
+            self._unindex_channel(channel)
+        return channel
+
     def delete_channel(self, channel_id: str, ctx: BaseCacheContext, /) -> None:
-        self._channels.pop(channel_id, None)
+        if self._remove_channel(channel_id) is not None and self._stats is not None:
+            self._stats.record_delete('channels', ctx)
 
     def get_private_channels_mapping(self) -> Mapping[str, typing.Union[DMChannel, GroupChannel]]:
         return self._private_channels
 
+    def get_server_channels_mapping_of(
+        self, server_id: str, ctx: BaseCacheContext, /
+    ) -> typing.Optional[Mapping[str, ServerChannel]]:
+        return self._server_channels.get(server_id)
+
+    def delete_server_channels_of(self, server_id: str, ctx: BaseCacheContext, /) -> None:
+        channels = self._server_channels.pop(server_id, None)
+        if channels is None:
+            return
+        for channel_id in channels.keys():
+            self._channels.pop(channel_id, None)
+            self._channel_names.remove(channel_id)
+        if self._stats is not None:
+            self._stats.record_delete('channels', ctx, len(channels))
+
+    def get_channels_by_name(
+        self,
+        name: str,
+        ctx: BaseCacheContext,
+        /,
+        *,
+        server_id: typing.Optional[str] = None,
+        prefix: bool = False,
+    ) -> Sequence[Channel]:
+        if not self._name_indexes:
+            return super().get_channels_by_name(name, ctx, server_id=server_id, prefix=prefix)
+
+        channels = self._channels
+        names = self._channel_names
+        result = []
+        for channel_id in names.get(name, prefix=prefix):
+            channel = channels.get(channel_id)
+            if channel is None:
+                names.remove(channel_id)
+            elif server_id is None or getattr(channel, 'server_id', None) == server_id:
+                result.append(channel)
+        return result
+
     ####################
     # Channel Messages #
     ####################
     def get_message(self, channel_id: str, message_id: str, ctx: BaseCacheContext, /) -> typing.Optional[Message]:
+        message = None
         messages = self._messages.get(channel_id)
         if messages:
-            return messages.get(message_id)
-        return None
+            message = messages.get(message_id)
+            if message is not None and self._messages_ttl is not None:
+                deadline = self._messages_expiry.get((channel_id, message_id))
+                if deadline is not None:
+                    now = monotonic()
+                    if deadline <= now:
+                        self._expire_messages(now)
+                        message = None
+        if self._stats is not None:
+            self._stats.record_get('messages', ctx, message is not None)
+        return message
 
     def get_messages_mapping_of(
         self, channel_id: str, ctx: BaseCacheContext, /
     ) -> typing.Optional[Mapping[str, Message]]:
         return self._messages.get(channel_id)
 
+    def _index_message(self, message: Message, /) -> None:
+        author_id = message.author_id
+        keys = self._messages_by_author.get(author_id)
+        if keys is None:
+            self._messages_by_author[author_id] = {(message.channel_id, message.id): None}
+        else:
+            keys[(message.channel_id, message.id)] = None
+
+    def _unindex_message(self, message: Message, /) -> None:
+        author_id = message.author_id
+        keys = self._messages_by_author.get(author_id)
+        if keys is not None:
+            keys.pop((message.channel_id, message.id), None)
+            if not keys:
+                del self._messages_by_author[author_id]
+
+    def _unindex_message_channel(self, channel_id: str, /) -> None:
+        server_id = self._message_channel_servers.pop(channel_id, None)
+        if server_id is None:
+            return
+        channel_ids = self._message_channels_by_server.get(server_id)
+        if channel_ids is not None:
+            channel_ids.pop(channel_id, None)
+            if not channel_ids:
+                del self._message_channels_by_server[server_id]
+
     def store_message(self, message: Message, ctx: BaseCacheContext, /) -> None:
+        from .channel import BaseServerChannel
         from .server import Member
 
+        stats = self._stats
+        if stats is not None:
+            stats.record_store('messages', ctx)
+
+        server_id = None
+
         author = message._author
         if isinstance(author, Member):
+            server_id = author.server_id
             self.store_server_member(author, ctx)
             message._author = author.id
         elif isinstance(author, User):
             self.store_user(author, ctx)
             message._author = author.id
 
-        d = self._messages.get(message.channel_id)
+        channel_id = message.channel_id
+        max_size = self._messages_max_size
+
+        d = self._messages.get(channel_id)
         if d is None:
-            if self._messages_max_size == 0:
+            if max_size == 0:
                 return
-            self._messages[message.channel_id] = {message.id: message}
+            d = self._messages[channel_id] = {}
+            timeline = self._message_timelines[channel_id] = _MessageTimeline()
+
+            if server_id is None:
+                channel = self._channels.get(channel_id)
+                if isinstance(channel, BaseServerChannel):
+                    server_id = channel.server_id
+            if server_id is not None:
+                self._message_channel_servers[channel_id] = server_id
+                channel_ids = self._message_channels_by_server.get(server_id)
+                if channel_ids is None:
+                    self._message_channels_by_server[server_id] = {channel_id: None}
+                else:
+                    channel_ids[channel_id] = None
         else:
-            _put1(d, message.id, message, self._messages_max_size)
-
-    def delete_message(self, channel_id: str, message_id: str, ctx: BaseCacheContext, /) -> None:
+            timeline = self._message_timelines[channel_id]
+            if max_size > 0 and message.id not in d:
+                while len(d) >= max_size:
+                    self._remove_message(channel_id, next(iter(d)), evicted=True)
+                    if stats is not None:
+                        stats.record_eviction('messages')
+
+        d[message.id] = message
+        self._index_message(message)
+        timeline.add(message.id, live=ctx.type is CacheContextType.message_create_event)
+
+        ttl = self._messages_ttl
+        if ttl is not None:
+            now = monotonic()
+            _touch(self._messages_expiry, (message.channel_id, message.id), now + ttl)
+            self._expire_messages(now)
+
+    def _remove_message(self, channel_id: str, message_id: str, /, *, evicted: bool) -> typing.Optional[Message]:
+        message = None
         messages = self._messages.get(channel_id)
         if messages:
-            messages.pop(message_id, None)
+            message = messages.pop(message_id, None)
+            if message is not None:
+                self._unindex_message(message)
+                timeline = self._message_timelines[channel_id]
+                if evicted:
+                    timeline.evict(message_id)
+                else:
+                    timeline.discard(message_id)
+        if self._messages_ttl is not None:
+            self._messages_expiry.pop((channel_id, message_id), None)
+        return message
+
+    def delete_message(self, channel_id: str, message_id: str, ctx: BaseCacheContext, /) -> None:
+        if self._remove_message(channel_id, message_id, evicted=False) is not None and self._stats is not None:
+            self._stats.record_delete('messages', ctx)
 
     def delete_messages_of(self, channel_id: str, ctx: BaseCacheContext, /) -> None:
-        self._messages.pop(channel_id, None)
+        messages = self._messages.pop(channel_id, None)
+        if messages is None:
+            return
+        del self._message_timelines[channel_id]
+        for message in messages.values():
+            self._unindex_message(message)
+        self._unindex_message_channel(channel_id)
+        if self._stats is not None:
+            self._stats.record_delete('messages', ctx, len(messages))
+
+    def get_messages_by_author(self, author_id: str, ctx: BaseCacheContext, /) -> Sequence[Message]:
+        keys = self._messages_by_author.get(author_id)
+        if keys is None:
+            return []
+
+        ret = []
+        for channel_id, message_id in keys.keys():
+            messages = self._messages.get(channel_id)
+            if messages is not None:
+                message = messages.get(message_id)
+                if message is not None:
+                    ret.append(message)
+        return ret
+
+    def delete_messages_by_author(self, author_id: str, ctx: BaseCacheContext, /) -> None:
+        keys = self._messages_by_author.get(author_id)
+        if keys is None:
+            return
+        for channel_id, message_id in list(keys.keys()):
+            self.delete_message(channel_id, message_id, ctx)
+        self._messages_by_author.pop(author_id, None)
+
+    def get_messages_in_server(self, server_id: str, ctx: BaseCacheContext, /) -> Sequence[Message]:
+        channel_ids = self._message_channels_by_server.get(server_id)
+        if channel_ids is None:
+            return []
+
+        ret = []
+        for channel_id in channel_ids.keys():
+            messages = self._messages.get(channel_id)
+            if messages is not None:
+                ret.extend(messages.values())
+        return ret
+
+    def delete_messages_in_server(self, server_id: str, ctx: BaseCacheContext, /) -> None:
+        channel_ids = self._message_channels_by_server.get(server_id)
+        if channel_ids is None:
+            return
+        for channel_id in list(channel_ids.keys()):
+            self.delete_messages_of(channel_id, ctx)
+
+    def get_messages_range(
+        self,
+        channel_id: str,
+        ctx: BaseCacheContext,
+        /,
+        *,
+        before: typing.Optional[str] = None,
+        after: typing.Optional[str] = None,
+        limit: int = 50,
+        oldest_first: bool = False,
+        partial: bool = False,
+    ) -> typing.Optional[list[Message]]:
+        if self._messages_ttl is not None:
+            self._expire_messages(monotonic())
+
+        result = [] if partial else None
+        timeline = self._message_timelines.get(channel_id)
+        if timeline is not None:
+            message_ids = timeline.query(before, after, limit, oldest_first, partial)
+            if message_ids is not None:
+                messages = self._messages[channel_id]
+                if not oldest_first:
+                    message_ids.reverse()
+                result = [messages[message_id] for message_id in message_ids]
+
+        if self._stats is not None:
+            self._stats.record_get('messages', ctx, bool(result) if partial else result is not None)
+        return result
+
+    def store_messages_range(
+        self,
+        channel_id: str,
+        messages: list[Message],
+        ctx: BaseCacheContext,
+        /,
+        *,
+        before: typing.Optional[str] = None,
+        after: typing.Optional[str] = None,
+        limit: int = 50,
+        oldest_first: bool = False,
+    ) -> None:
+        for message in messages:
+            self.store_message(message, ctx)
+
+        d = self._messages.get(channel_id)
+        if d is None:
+            return
+
+        message_ids = sorted(message.id for message in messages)
+        if any(message_id not in d for message_id in message_ids):
+            # Some of messages were trimmed right away
+            return
+
+        # Bounds are exclusive, but can be included in range if they are cached.
+        # Missing `after` means the channel start, while missing `before` means the present.
+        start = '' if after is None else after if after in d else None
+        end = before if before is not None and before in d else None
+
+        if message_ids:
+            lo = message_ids[0]
+            hi = message_ids[-1]
+        else:
+            lo = hi = None
+
+        # If less messages were retrieved than requested, nothing else is between bounds
+        exhausted = len(message_ids) < limit
+        if oldest_first:
+            if start is not None:
+                lo = start
+            if exhausted and end is not None:
+                hi = end
+        else:
+            if end is not None:
+                hi = end
+            if exhausted and start is not None:
+                lo = start
+
+        if lo is not None and hi is not None and lo <= hi:
+            self._message_timelines[channel_id].cover(lo, hi)
+
+    def reset_live_message_ranges(self, ctx: BaseCacheContext, /) -> None:
+        for timeline in self._message_timelines.values():
+            timeline.live = None
 
     ###############
     # Read States #
     ###############
     def get_read_state(self, channel_id: str, ctx: BaseCacheContext, /) -> typing.Optional[ReadState]:
-        return self._read_states.get(channel_id)
+        read_state = self._read_states.get(channel_id)
+        if self._stats is not None:
+            self._stats.record_get('read_states', ctx, read_state is not None)
+        return read_state
 
     def get_read_states_mapping(self) -> Mapping[str, ReadState]:
         return self._read_states
 
     def store_read_state(self, read_state: ReadState, ctx: BaseCacheContext, /) -> None:
-        _put1(
-            self._read_states,
-            read_state.channel_id,
-            read_state,
-            self._read_states_max_size,
-        )
+        stats = self._stats
+        if stats is not None:
+            stats.record_store('read_states', ctx)
+
+        read_states = self._read_states
+        max_size = self._read_states_max_size
+        if max_size == 0:
+            return
+        if max_size > 0 and read_state.channel_id not in read_states:
+            while len(read_states) >= max_size:
+                self._remove_read_state(next(iter(read_states)))
+                if stats is not None:
+                    stats.record_eviction('read_states')
+        read_states[read_state.channel_id] = read_state
+
+    def _remove_read_state(self, channel_id: str, /) -> typing.Optional[ReadState]:
+        return self._read_states.pop(channel_id, None)
 
     def delete_read_state(self, channel_id: str, ctx: BaseCacheContext, /) -> None:
-        self._read_states.pop(channel_id, None)
+        if self._remove_read_state(channel_id) is not None and self._stats is not None:
+            self._stats.record_delete('read_states', ctx)
 
     ##########
     # Emojis #
     ##########
 
     def get_emoji(self, emoji_id: str, ctx: BaseCacheContext, /) -> typing.Optional[Emoji]:
-        return self._emojis.get(emoji_id)
+        emoji = self._emojis.get(emoji_id)
+        if self._stats is not None:
+            self._stats.record_get('emojis', ctx, emoji is not None)
+        return emoji
 
     def get_emojis_mapping(self) -> Mapping[str, Emoji]:
         return self._emojis
@@ -1882,7 +3366,42 @@ class MapCache(Cache):
     def delete_server_emojis_of(self, server_id: str, ctx: BaseCacheContext, /) -> None:
         self._server_emojis.pop(server_id, None)
 
+    def get_emojis_by_name(
+        self,
+        name: str,
+        ctx: BaseCacheContext,
+        /,
+        *,
+        server_id: typing.Optional[str] = None,
+        prefix: bool = False,
+    ) -> Sequence[Emoji]:
+        if not self._name_indexes:
+            return super().get_emojis_by_name(name, ctx, server_id=server_id, prefix=prefix)
+
+        emojis = self._emojis
+        names = self._emoji_names
+        result = []
+        for emoji_id in names.get(name, prefix=prefix):
+            emoji = emojis.get(emoji_id)
+            if emoji is None:
+                names.remove(emoji_id)
+            elif server_id is None or getattr(emoji, 'server_id', None) == server_id:
+                result.append(emoji)
+        return result
+
     def store_emoji(self, emoji: Emoji, ctx: BaseCacheContext, /) -> None:
+        stats = self._stats
+        if stats is not None:
+            stats.record_store('emojis', ctx)
+
+        emojis = self._emojis
+        max_size = self._emojis_max_size
+        if max_size > 0 and emoji.id not in emojis:
+            while len(emojis) >= max_size:
+                self._remove_emoji(next(iter(emojis)), None)
+                if stats is not None:
+                    stats.record_eviction('emojis')
+
         if isinstance(emoji, ServerEmoji):
             server_id = emoji.server_id
             if _put0(self._server_emojis, server_id, self._server_emojis_max_size):
@@ -1892,10 +3411,14 @@ class MapCache(Cache):
                     s[emoji.id] = emoji
                 else:
                     se[server_id] = {emoji.id: emoji}
-        _put1(self._emojis, emoji.id, emoji, self._emojis_max_size)
+        if max_size != 0:
+            emojis[emoji.id] = emoji
+        if self._name_indexes:
+            self._emoji_names.set(emoji.id, (emoji.name,))
 
-    def delete_emoji(self, emoji_id: str, server_id: typing.Optional[str], ctx: BaseCacheContext, /) -> None:
+    def _remove_emoji(self, emoji_id: str, server_id: typing.Optional[str], /) -> typing.Optional[Emoji]:
         emoji = self._emojis.pop(emoji_id, None)
+        self._emoji_names.remove(emoji_id)
 
         server_ids: tuple[str, ...] = ()
         if isinstance(emoji, ServerEmoji):
@@ -1907,18 +3430,29 @@ class MapCache(Cache):
         for server_id in server_ids:
             server_emojis = self._server_emojis.get(server_id, {})
             server_emojis.pop(emoji_id, None)
+        return emoji
+
+    def delete_emoji(self, emoji_id: str, server_id: typing.Optional[str], ctx: BaseCacheContext, /) -> None:
+        if self._remove_emoji(emoji_id, server_id) is not None and self._stats is not None:
+            self._stats.record_delete('emojis', ctx)
 
     ###########
     # Servers #
     ###########
 
     def get_server(self, server_id: str, ctx: BaseCacheContext, /) -> typing.Optional[Server]:
-        return self._servers.get(server_id)
+        server = self._servers.get(server_id)
+        if self._stats is not None:
+            self._stats.record_get('servers', ctx, server is not None)
+        return server
 
     def get_servers_mapping(self) -> Mapping[str, Server]:
         return self._servers
 
     def store_server(self, server: Server, ctx: BaseCacheContext, /) -> None:
+        stats = self._stats
+        if stats is not None:
+            stats.record_store('servers', ctx)
         if server.id not in self._server_emojis:
             _put1(self._server_emojis, server.id, {}, self._server_emojis_max_size)
 
@@ -1926,20 +3460,68 @@ class MapCache(Cache):
             _put0(self._server_members, server.id, self._server_members_max_size)
             and server.id not in self._server_members
         ):
-            self._server_members[server.id] = {}
-        _put1(self._servers, server.id, server, self._servers_max_size)
+            self._server_members[server.id] = self._new_server_members(server.id, {}, _UNDEFINED)
+
+        servers = self._servers
+        max_size = self._servers_max_size
+        if max_size == 0:
+            return
+        if max_size > 0 and server.id not in servers:
+            while len(servers) >= max_size:
+                self._remove_server(next(iter(servers)))
+                if stats is not None:
+                    stats.record_eviction('servers')
+        servers[server.id] = server
+
+        if self._name_indexes:
+            # Roles are updated along with server, so rebuild the index entirely
+            names: _NameIndex[str] = _NameIndex()
+            for role in server.roles.values():
+                names.set(role.id, (role.name,))
+            self._role_names[server.id] = names
+
+    def _remove_server(self, server_id: str, /) -> typing.Optional[Server]:
+        self._role_names.pop(server_id, None)
+        return self._servers.pop(server_id, None)
 
     def delete_server(self, server_id: str, ctx: BaseCacheContext, /) -> typing.Optional[Server]:
-        return self._servers.pop(server_id, None)
+        server = self._remove_server(server_id)
+        if server is not None and self._stats is not None:
+            self._stats.record_delete('servers', ctx)
+        return server
+
+    def get_roles_by_name(
+        self, server_id: str, name: str, ctx: BaseCacheContext, /, *, prefix: bool = False
+    ) -> Sequence[Role]:
+        if not self._name_indexes:
+            return super().get_roles_by_name(server_id, name, ctx, prefix=prefix)
+
+        server = self._servers.get(server_id)
+        names = self._role_names.get(server_id)
+        if server is None or names is None:
+            return []
+
+        roles = server.roles
+        return [roles[role_id] for role_id in names.get(name, prefix=prefix) if role_id in roles]
 
     ##################
     # Server Members #
     ##################
     def get_server_member(self, server_id: str, user_id: str, ctx: BaseCacheContext, /) -> typing.Optional[Member]:
+        member = None
         d = self._server_members.get(server_id)
-        if d is None:
-            return None
-        return d.get(user_id)
+        if d is not None:
+            member = d.get(user_id)
+            if member is not None and self._server_members_ttl is not None:
+                deadline = self._server_members_expiry.get((server_id, user_id))
+                if deadline is not None:
+                    now = monotonic()
+                    if deadline <= now:
+                        self._expire_server_members(now)
+                        member = None
+        if self._stats is not None:
+            self._stats.record_get('server_members', ctx, member is not None)
+        return member
 
     def get_server_members_mapping_of(
         self, server_id: str, ctx: BaseCacheContext, /
@@ -1953,11 +3535,27 @@ class MapCache(Cache):
         ctx: BaseCacheContext,
         /,
     ) -> None:
+        if self._stats is not None:
+            self._stats.record_store('server_members', ctx, len(members))
+
         d = self._server_members.get(server_id)
         if d is None:
-            self._server_members[server_id] = members
+            self._server_members[server_id] = self._new_server_members(server_id, members, ctx)
         else:
+            if self._compact_members:
+                self._store_member_users(members.values(), ctx)
             d.update(members)
+        if self._name_indexes:
+            self._index_member_nicks(server_id, members.values())
+
+        ttl = self._server_members_ttl
+        if ttl is not None:
+            now = monotonic()
+            expiry = self._server_members_expiry
+            deadline = now + ttl
+            for user_id in members.keys():
+                _touch(expiry, (server_id, user_id), deadline)
+            self._expire_server_members(now)
 
     def overwrite_server_members(
         self,
@@ -1966,9 +3564,44 @@ class MapCache(Cache):
         ctx: BaseCacheContext,
         /,
     ) -> None:
-        self._server_members[server_id] = members
+        if self._stats is not None:
+            self._stats.record_store('server_members', ctx, len(members))
+
+        self._server_members[server_id] = self._new_server_members(server_id, members, ctx)
+        if self._name_indexes:
+            self._server_member_nicks.pop(server_id, None)
+            self._index_member_nicks(server_id, members.values())
+
+        ttl = self._server_members_ttl
+        if ttl is not None:
+            now = monotonic()
+            expiry = self._server_members_expiry
+            deadline = now + ttl
+            for user_id in members.keys():
+                _touch(expiry, (server_id, user_id), deadline)
+            self._expire_server_members(now)
+
+    def _store_member_users(self, members: Iterable[Member], ctx: BaseCacheContext, /) -> None:
+        # Compact storage keeps only user IDs
+        users = {member._user.id: member._user for member in members if isinstance(member._user, User)}
+        if users:
+            self.bulk_store_users(users, ctx)
+
+    def _new_server_members(
+        self, server_id: str, members: dict[str, Member], ctx: BaseCacheContext, /
+    ) -> MutableMapping[str, Member]:
+        if not self._compact_members:
+            return members
+        self._store_member_users(members.values(), ctx)
+        compact = _CompactMemberMap(server_id)
+        compact.update(members)
+        return compact
 
     def store_server_member(self, member: Member, ctx: BaseCacheContext, /) -> None:
+        stats = self._stats
+        if stats is not None:
+            stats.record_store('server_members', ctx)
+
         if isinstance(member._user, User):
             self.store_user(member._user, ctx)
             member._user = member._user.id
@@ -1976,48 +3609,189 @@ class MapCache(Cache):
         if d is None:
             if self._server_members_max_size == 0:
                 return
-            self._server_members[member.server_id] = {member.id: member}
+            self._server_members[member.server_id] = self._new_server_members(
+                member.server_id, {member.id: member}, ctx
+            )
         else:
-            _put1(d, member.id, member, self._server_members_max_size)
-
-    def delete_server_member(self, server_id: str, user_id: str, ctx: BaseCacheContext, /) -> None:
+            max_size = self._server_members_max_size
+            if max_size == 0:
+                return
+            if max_size > 0 and member.id not in d:
+                while len(d) >= max_size:
+                    self._remove_server_member(member.server_id, next(iter(d)))
+                    if stats is not None:
+                        stats.record_eviction('server_members')
+            d[member.id] = member
+        if self._name_indexes:
+            self._index_member_nicks(member.server_id, (member,))
+
+        ttl = self._server_members_ttl
+        if ttl is not None:
+            now = monotonic()
+            _touch(self._server_members_expiry, (member.server_id, member.id), now + ttl)
+            self._expire_server_members(now)
+
+    def _remove_server_member(self, server_id: str, user_id: str, /) -> typing.Optional[Member]:
+        member = None
         members = self._server_members.get(server_id)
         if members:
-            members.pop(user_id, None)
+            member = members.pop(user_id, None)
+        nicks = self._server_member_nicks.get(server_id)
+        if nicks is not None:
+            nicks.remove(user_id)
+        if self._server_members_ttl is not None:
+            self._server_members_expiry.pop((server_id, user_id), None)
+        return member
+
+    def delete_server_member(self, server_id: str, user_id: str, ctx: BaseCacheContext, /) -> None:
+        if self._remove_server_member(server_id, user_id) is not None and self._stats is not None:
+            self._stats.record_delete('server_members', ctx)
 
     def delete_server_members_of(self, server_id: str, ctx: BaseCacheContext, /) -> None:
-        self._server_members.pop(server_id, None)
+        members = self._server_members.pop(server_id, None)
+        self._server_member_nicks.pop(server_id, None)
+        if members and self._stats is not None:
+            self._stats.record_delete('server_members', ctx, len(members))
+
+    def _index_member_nicks(self, server_id: str, members: Iterable[Member], /) -> None:
+        nicks = self._server_member_nicks.get(server_id)
+        if nicks is None:
+            nicks = self._server_member_nicks[server_id] = _NameIndex()
+        for member in members:
+            nicks.set(member.id, (member.nick,))
+
+    def get_server_members_by_name(
+        self, server_id: str, name: str, ctx: BaseCacheContext, /, *, prefix: bool = False
+    ) -> Sequence[Member]:
+        if not self._name_indexes:
+            return super().get_server_members_by_name(server_id, name, ctx, prefix=prefix)
+
+        members = self._server_members.get(server_id)
+        if not members:
+            return []
+
+        result: dict[str, Member] = {}
+        nicks = self._server_member_nicks.get(server_id)
+        if nicks is not None:
+            for user_id in nicks.get(name, prefix=prefix):
+                member = members.get(user_id)
+                if member is None:
+                    nicks.remove(user_id)
+                else:
+                    result[user_id] = member
+
+        # Names are indexed per user, and then filtered by membership
+        for user_id in self._user_names.get(name, prefix=prefix):
+            if user_id not in result:
+                member = members.get(user_id)
+                if member is not None:
+                    result[user_id] = member
+        return list(result.values())
 
     #########
     # Users #
     #########
 
     def get_user(self, user_id: str, ctx: BaseCacheContext, /) -> typing.Optional[User]:
-        return self._users.get(user_id)
+        user = self._users.get(user_id)
+        if user is not None and self._users_ttl is not None:
+            deadline = self._users_expiry.get(user_id)
+            if deadline is not None:
+                now = monotonic()
+                if deadline <= now:
+                    self._expire_users(now)
+                    user = None
+        if self._stats is not None:
+            self._stats.record_get('users', ctx, user is not None)
+        return user
 
     def get_users_mapping(self) -> Mapping[str, User]:
         return self._users
 
     def store_user(self, user: User, ctx: BaseCacheContext, /) -> None:
-        _put1(self._users, user.id, user, self._users_max_size)
+        stats = self._stats
+        if stats is not None:
+            stats.record_store('users', ctx)
+
+        users = self._users
+        max_size = self._users_max_size
+        if max_size == 0:
+            return
+        if max_size > 0 and user.id not in users:
+            while len(users) >= max_size:
+                self._remove_user(next(iter(users)))
+                if stats is not None:
+                    stats.record_eviction('users')
+        users[user.id] = user
+        if self._name_indexes:
+            self._user_names.set(user.id, (user.name, user.display_name))
+
+        ttl = self._users_ttl
+        if ttl is not None:
+            now = monotonic()
+            _touch(self._users_expiry, user.id, now + ttl)
+            self._expire_users(now)
+
+    def _remove_user(self, user_id: str, /) -> typing.Optional[User]:
+        self._user_names.remove(user_id)
+        if self._users_ttl is not None:
+            self._users_expiry.pop(user_id, None)
+        return self._users.pop(user_id, None)
 
     def bulk_store_users(self, users: Mapping[str, User], ctx: BaseCacheContext, /) -> None:
+        if self._stats is not None:
+            self._stats.record_store('users', ctx, len(users))
+
         self._users.update(users)
+        if self._name_indexes:
+            names = self._user_names
+            for user_id, user in users.items():
+                names.set(user_id, (user.name, user.display_name))
+
+        ttl = self._users_ttl
+        if ttl is not None:
+            now = monotonic()
+            expiry = self._users_expiry
+            deadline = now + ttl
+            for user_id in users.keys():
+                _touch(expiry, user_id, deadline)
+            self._expire_users(now)
+
+    def get_users_by_name(self, name: str, ctx: BaseCacheContext, /, *, prefix: bool = False) -> Sequence[User]:
+        if not self._name_indexes:
+            return super().get_users_by_name(name, ctx, prefix=prefix)
+
+        users = self._users
+        names = self._user_names
+        result = []
+        for user_id in names.get(name, prefix=prefix):
+            user = users.get(user_id)
+            if user is None:
+                names.remove(user_id)
+            else:
+                result.append(user)
+        return result
 
     ############################
     # Private Channels by User #
     ############################
     def get_private_channel_by_user(self, user_id: str, ctx: BaseCacheContext, /) -> typing.Optional[str]:
-        return self._private_channels_by_user.get(user_id)
+        channel_id = self._private_channels_by_user.get(user_id)
+        if self._stats is not None:
+            self._stats.record_get('private_channels_by_user', ctx, channel_id is not None)
+        return channel_id
 
     def get_private_channels_by_users_mapping(self) -> Mapping[str, str]:
         return self._private_channels_by_user
 
     def store_private_channel_by_user(self, channel: DMChannel, ctx: BaseCacheContext, /) -> None:
+        if self._stats is not None:
+            self._stats.record_store('private_channels_by_user', ctx)
         _put1(self._private_channels_by_user, channel.recipient_id, channel.id, self._private_channels_by_user_max_size)
 
     def delete_private_channel_by_user(self, user_id: str, ctx: BaseCacheContext, /) -> None:
-        self._private_channels_by_user.pop(user_id, None)
+        if self._private_channels_by_user.pop(user_id, None) is not None and self._stats is not None:
+            self._stats.record_delete('private_channels_by_user', ctx)
 
     ########################
     # Channel Voice States #
@@ -2025,21 +3799,917 @@ class MapCache(Cache):
     def get_channel_voice_state(
         self, channel_id: str, ctx: BaseCacheContext, /
     ) -> typing.Optional[ChannelVoiceStateContainer]:
-        return self._channel_voice_states.get(channel_id)
+        container = self._channel_voice_states.get(channel_id)
+        if self._stats is not None:
+            self._stats.record_get('channel_voice_states', ctx, container is not None)
+        return container
 
     def get_channel_voice_states_mapping(self) -> Mapping[str, ChannelVoiceStateContainer]:
         return self._channel_voice_states
 
     def store_channel_voice_state(self, container: ChannelVoiceStateContainer, ctx: BaseCacheContext, /) -> None:
+        if self._stats is not None:
+            self._stats.record_store('channel_voice_states', ctx)
         _put1(self._channel_voice_states, container.channel_id, container, self._channel_voice_states_max_size)
 
     def bulk_store_channel_voice_states(
         self, containers: dict[str, ChannelVoiceStateContainer], ctx: BaseCacheContext, /
     ) -> None:
+        if self._stats is not None:
+            self._stats.record_store('channel_voice_states', ctx, len(containers))
         self._channel_voice_states.update(containers)
 
     def delete_channel_voice_state(self, channel_id: str, ctx: BaseCacheContext, /) -> None:
-        self._channel_voice_states.pop(channel_id, None)
+        if self._channel_voice_states.pop(channel_id, None) is not None and self._stats is not None:
+            self._stats.record_delete('channel_voice_states', ctx)
+
+
+CacheEntityType = typing.Literal[
+    'channels',
+    'emojis',
+    'messages',
+    'read_states',
+    'servers',
+    'server_members',
+    'users',
+    'private_channels_by_user',
+    'channel_voice_states',
+]
+
+_ATOMIC_TYPES: tuple[type, ...] = (str, bytes, int, float, bool, type(None))
+_SLOTS_OF: dict[type, tuple[str, ...]] = {}
+
+
+def _slots_of(cls: type, /) -> tuple[str, ...]:
+    try:
+        return _SLOTS_OF[cls]
+    except KeyError:
+        pass
+
+    slots = []
+    for base in cls.__mro__:
+        base_slots = base.__dict__.get('__slots__', ())
+        if isinstance(base_slots, str):
+            base_slots = (base_slots,)
+        for slot in base_slots:
+            # Skip shared state, and weak references
+            if slot not in ('state', '__weakref__') and slot not in slots:
+                slots.append(slot)
+    ret = _SLOTS_OF[cls] = tuple(slots)
+    return ret
+
+
+def _estimate_size(obj: typing.Any, depth: int = 4, /) -> int:
+    """Estimates the memory used by an object and objects it owns, in bytes.
+
+    This is not meant to be exact, and stops at ``depth`` levels of nesting.
+    """
+    size = getsizeof(obj)
+    if depth == 0 or isinstance(obj, _ATOMIC_TYPES) or isinstance(obj, Enum):
+        return size
+
+    depth -= 1
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            size += _estimate_size(k, depth) + _estimate_size(v, depth)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for v in obj:
+            size += _estimate_size(v, depth)
+    else:
+        for slot in _slots_of(type(obj)):
+            try:
+                v = getattr(obj, slot)
+            except AttributeError:
+                continue
+            size += _estimate_size(v, depth)
+    return size
+
+
+@define(slots=True)
+class CacheMemoryUsage:
+    """Represents estimated memory usage of single entity type in cache."""
+
+    count: int = field(repr=True, kw_only=True)
+    """:class:`int`: How many entries are accounted."""
+
+    size: int = field(repr=True, kw_only=True)
+    """:class:`int`: The estimated size of all entries, in bytes."""
+
+    budget: typing.Optional[int] = field(repr=True, kw_only=True)
+    """Optional[:class:`int`]: The memory budget for this entity type, in bytes, if any."""
+
+
+@define(slots=True)
+class CacheMemoryReport:
+    """Represents estimated memory usage of cache."""
+
+    size: int = field(repr=True, kw_only=True)
+    """:class:`int`: The estimated size of all entries, in bytes."""
+
+    budget: typing.Optional[int] = field(repr=True, kw_only=True)
+    """Optional[:class:`int`]: The total memory budget, in bytes, if any."""
+
+    types: dict[CacheEntityType, CacheMemoryUsage] = field(repr=True, kw_only=True)
+    """Dict[:class:`.CacheEntityType`, :class:`.CacheMemoryUsage`]: The memory usage broken down by entity type."""
+
+
+@define(slots=True)
+class CacheStatsCounters:
+    """Represents counters of cache operations."""
+
+    hits: int = field(default=0, repr=True, kw_only=True)
+    """:class:`int`: How many lookups found an entry."""
+
+    misses: int = field(default=0, repr=True, kw_only=True)
+    """:class:`int`: How many lookups did not find an entry."""
+
+    stores: int = field(default=0, repr=True, kw_only=True)
+    """:class:`int`: How many entries were stored."""
+
+    evictions: int = field(default=0, repr=True, kw_only=True)
+    """:class:`int`: How many entries were removed by cache itself, due to expiry, size limits or memory budgets."""
+
+    deletes: int = field(default=0, repr=True, kw_only=True)
+    """:class:`int`: How many entries were deleted."""
+
+    @property
+    def gets(self) -> int:
+        """:class:`int`: How many lookups were done."""
+        return self.hits + self.misses
+
+    @property
+    def hit_ratio(self) -> float:
+        """:class:`float`: The ratio of lookups that found an entry, from ``0.0`` to ``1.0``."""
+        gets = self.hits + self.misses
+        return self.hits / gets if gets else 0.0
+
+    def _add(self, other: CacheStatsCounters, /) -> None:
+        self.hits += other.hits
+        self.misses += other.misses
+        self.stores += other.stores
+        self.evictions += other.evictions
+        self.deletes += other.deletes
+
+
+@define(slots=True)
+class CacheStatsSnapshot:
+    """Represents point-in-time statistics of cache operations."""
+
+    types: dict[CacheEntityType, CacheStatsCounters] = field(repr=True, kw_only=True)
+    """Dict[:class:`.CacheEntityType`, :class:`.CacheStatsCounters`]: The counters for each entity type."""
+
+    contexts: dict[CacheEntityType, dict[CacheContextType, CacheStatsCounters]] = field(repr=True, kw_only=True)
+    """Dict[:class:`.CacheEntityType`, Dict[:class:`.CacheContextType`, :class:`.CacheStatsCounters`]]: The counters for each entity type, broken down by context type.
+
+    Evictions are always counted under :attr:`.CacheContextType.undefined`.
+    """
+
+    misses_by_caller: dict[CacheEntityType, dict[str, int]] = field(repr=True, kw_only=True)
+    """Dict[:class:`.CacheEntityType`, Dict[:class:`str`, :class:`int`]]: The misses for each entity type, broken down by name of cache context class.
+
+    This tells apart callers that share context type, such as :class:`.MessageCacheContext` and command converters.
+    """
+
+    @property
+    def total(self) -> CacheStatsCounters:
+        """:class:`.CacheStatsCounters`: The counters summed across all entity types."""
+        ret = CacheStatsCounters()
+        for counters in self.types.values():
+            ret._add(counters)
+        return ret
+
+
+class CacheStats:
+    """Collects statistics of cache operations.
+
+    Collecting is cheap, as only counters are incremented, and is meant to be left enabled in production.
+    Use :meth:`.snapshot` to get the numbers.
+    """
+
+    __slots__ = ('_counters', '_misses_by_caller')
+
+    def __init__(self) -> None:
+        self._counters: dict[CacheEntityType, dict[CacheContextType, CacheStatsCounters]] = {}
+        self._misses_by_caller: dict[CacheEntityType, dict[type[BaseCacheContext], int]] = {}
+
+    def _counters_of(self, type: CacheEntityType, context_type: CacheContextType, /) -> CacheStatsCounters:
+        counters = self._counters.get(type)
+        if counters is None:
+            counters = self._counters[type] = {}
+        ret = counters.get(context_type)
+        if ret is None:
+            ret = counters[context_type] = CacheStatsCounters()
+        return ret
+
+    def record_get(self, type: CacheEntityType, ctx: BaseCacheContext, hit: bool, /) -> None:
+        """Records a lookup.
+
+        Parameters
+        ----------
+        type: :class:`.CacheEntityType`
+            The type of entity that was looked up.
+        ctx: :class:`.BaseCacheContext`
+            The context.
+        hit: :class:`bool`
+            Whether the entry was found.
+        """
+        counters = self._counters_of(type, ctx.type)
+        if hit:
+            counters.hits += 1
+            return
+
+        counters.misses += 1
+        callers = self._misses_by_caller.get(type)
+        if callers is None:
+            callers = self._misses_by_caller[type] = {}
+        caller = ctx.__class__
+        callers[caller] = callers.get(caller, 0) + 1
+
+    def record_store(self, type: CacheEntityType, ctx: BaseCacheContext, count: int = 1, /) -> None:
+        """Records storing entries.
+
+        Parameters
+        ----------
+        type: :class:`.CacheEntityType`
+            The type of stored entities.
+        ctx: :class:`.BaseCacheContext`
+            The context.
+        count: :class:`int`
+            How many entries were stored. Defaults to ``1``.
+        """
+        self._counters_of(type, ctx.type).stores += count
+
+    def record_delete(self, type: CacheEntityType, ctx: BaseCacheContext, count: int = 1, /) -> None:
+        """Records deleting entries.
+
+        Parameters
+        ----------
+        type: :class:`.CacheEntityType`
+            The type of deleted entities.
+        ctx: :class:`.BaseCacheContext`
+            The context.
+        count: :class:`int`
+            How many entries were deleted. Defaults to ``1``.
+        """
+        self._counters_of(type, ctx.type).deletes += count
+
+    def record_eviction(self, type: CacheEntityType, count: int = 1, /) -> None:
+        """Records entries removed by cache itself.
+
+        Parameters
+        ----------
+        type: :class:`.CacheEntityType`
+            The type of evicted entities.
+        count: :class:`int`
+            How many entries were evicted. Defaults to ``1``.
+        """
+        self._counters_of(type, CacheContextType.undefined).evictions += count
+
+    def reset(self) -> None:
+        """Resets all counters."""
+        self._counters.clear()
+        self._misses_by_caller.clear()
+
+    def snapshot(self) -> CacheStatsSnapshot:
+        """:class:`.CacheStatsSnapshot`: Returns copy of current statistics."""
+        types: dict[CacheEntityType, CacheStatsCounters] = {}
+        contexts: dict[CacheEntityType, dict[CacheContextType, CacheStatsCounters]] = {}
+
+        for type, counters in self._counters.items():
+            total = types[type] = CacheStatsCounters()
+            copied = contexts[type] = {}
+            for context_type, current in counters.items():
+                entry = copied[context_type] = CacheStatsCounters()
+                entry._add(current)
+                total._add(current)
+
+        return CacheStatsSnapshot(
+            types=types,
+            contexts=contexts,
+            misses_by_caller={
+                type: {caller.__name__: count for caller, count in callers.items()}
+                for type, callers in self._misses_by_caller.items()
+            },
+        )
+
+
+_DEFAULT_EVICTION_ORDER: tuple[CacheEntityType, ...] = (
+    'messages',
+    'users',
+    'server_members',
+    'read_states',
+    'emojis',
+    'channels',
+    'servers',
+)
+
+
+class BudgetedMapCache(MapCache):
+    """Implementation of :class:`.MapCache` that limits memory used by cached objects.
+
+    Sizes of objects are estimated when they are stored. Once the budget is exceeded,
+    oldest entries are evicted, starting from entity types that come first in ``eviction_order``.
+
+    .. note::
+        Sizes are estimates, and do not account objects shared between entries.
+
+    Parameters
+    ----------
+    max_memory: :class:`int`
+        The total memory budget, in bytes. Negative value means no limit. Defaults to ``-1``.
+    memory_budgets: Optional[Dict[:class:`.CacheEntityType`, :class:`int`]]
+        The per-type memory budgets, in bytes.
+    eviction_order: Optional[Sequence[:class:`.CacheEntityType`]]
+        The order in which entity types are evicted when total budget is exceeded.
+        Defaults to messages, users, server members, read states, emojis, channels and servers.
+        Only these types are accounted, so budgets and eviction order cannot contain other ones.
+    **kwargs
+        The parameters passed to :class:`.MapCache`.
+    """
+
+    __slots__ = (
+        '_eviction_order',
+        '_max_memory',
+        '_memory',
+        '_memory_budgets',
+        '_memory_sizes',
+        '_memory_usage',
+    )
+
+    def __init__(
+        self,
+        *,
+        max_memory: int = -1,
+        memory_budgets: typing.Optional[dict[CacheEntityType, int]] = None,
+        eviction_order: typing.Optional[Sequence[CacheEntityType]] = None,
+        **kwargs: typing.Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self._max_memory: int = max_memory
+        self._memory_budgets: dict[CacheEntityType, int] = memory_budgets or {}
+        self._eviction_order: tuple[CacheEntityType, ...] = (
+            _DEFAULT_EVICTION_ORDER if eviction_order is None else tuple(eviction_order)
+        )
+
+        for entity_type in (*self._memory_budgets, *self._eviction_order):
+            if entity_type not in _DEFAULT_EVICTION_ORDER:
+                raise TypeError(f'Cannot budget memory of {entity_type!r}')
+        self._memory: int = 0
+        # Insertion order is order of last store, so first entries are evicted first
+        self._memory_sizes: dict[CacheEntityType, dict[typing.Any, int]] = {t: {} for t in _DEFAULT_EVICTION_ORDER}
+        self._memory_usage: dict[CacheEntityType, int] = dict.fromkeys(_DEFAULT_EVICTION_ORDER, 0)
+
+    @property
+    def memory(self) -> int:
+        """:class:`int`: The estimated memory used by cached objects, in bytes."""
+        return self._memory
+
+    def memory_report(self) -> CacheMemoryReport:
+        """:class:`.CacheMemoryReport`: Returns the estimated memory usage broken down by entity type."""
+        return CacheMemoryReport(
+            size=self._memory,
+            budget=self._max_memory if self._max_memory >= 0 else None,
+            types={
+                t: CacheMemoryUsage(
+                    count=len(sizes),
+                    size=self._memory_usage[t],
+                    budget=self._memory_budgets.get(t),
+                )
+                for t, sizes in self._memory_sizes.items()
+            },
+        )
+
+    def _account(self, type: CacheEntityType, key: typing.Any, obj: typing.Any, /) -> None:
+        sizes = self._memory_sizes[type]
+        size = _estimate_size(obj)
+        delta = size - sizes.pop(key, 0)
+        sizes[key] = size
+        self._memory += delta
+        self._memory_usage[type] += delta
+
+        budget = self._memory_budgets.get(type)
+        if budget is not None and budget >= 0:
+            self._evict_from(type, budget)
+
+        max_memory = self._max_memory
+        if max_memory >= 0 and self._memory > max_memory:
+            for t in self._eviction_order:
+                self._evict_from(t, None)
+                if self._memory <= max_memory:
+                    break
+
+    def _unaccount(self, type: CacheEntityType, key: typing.Any, /) -> None:
+        size = self._memory_sizes[type].pop(key, 0)
+        self._memory -= size
+        self._memory_usage[type] -= size
+
+    def _evict_from(self, type: CacheEntityType, budget: typing.Optional[int], /) -> None:
+        sizes = self._memory_sizes[type]
+        usage = self._memory_usage
+        max_memory = self._max_memory
+
+        while sizes:
+            if budget is not None:
+                if usage[type] <= budget:
+                    break
+            elif self._memory <= max_memory:
+                break
+
+            key = next(iter(sizes))
+            size = sizes.pop(key)
+            self._memory -= size
+            usage[type] -= size
+            self._evict(type, key)
+
+    def _expire_messages(self, now: float, /) -> list[tuple[str, str]]:
+        keys = super()._expire_messages(now)
+        for key in keys:
+            self._unaccount('messages', key)
+        return keys
+
+    def _expire_server_members(self, now: float, /) -> list[tuple[str, str]]:
+        keys = super()._expire_server_members(now)
+        for key in keys:
+            self._unaccount('server_members', key)
+        return keys
+
+    def _expire_users(self, now: float, /) -> list[str]:
+        keys = super()._expire_users(now)
+        for key in keys:
+            self._unaccount('users', key)
+        return keys
+
+    def _evict(self, type: CacheEntityType, key: typing.Any, /) -> None:
+        # Removal helpers do not record deletes, so eviction is not counted as one
+        if type == 'messages':
+            self._remove_message(key[0], key[1], evicted=True)
+        elif type == 'server_members':
+            self._remove_server_member(key[0], key[1])
+        elif type == 'users':
+            self._remove_user(key)
+        elif type == 'read_states':
+            self._remove_read_state(key)
+        elif type == 'emojis':
+            self._remove_emoji(key, None)
+        elif type == 'channels':
+            self._remove_channel(key)
+        elif type == 'servers':
+            self._remove_server(key)
+
+        if self._stats is not None:
+            self._stats.record_eviction(type)
+
+    # Removal helpers are called for deletes, evictions and entries trimmed by *_max_size count limits
+    def _remove_channel(self, channel_id: str, /) -> typing.Optional[Channel]:
+        self._unaccount('channels', channel_id)
+        return super()._remove_channel(channel_id)
+
+    def _remove_message(self, channel_id: str, message_id: str, /, *, evicted: bool) -> typing.Optional[Message]:
+        self._unaccount('messages', (channel_id, message_id))
+        return super()._remove_message(channel_id, message_id, evicted=evicted)
+
+    def _remove_read_state(self, channel_id: str, /) -> typing.Optional[ReadState]:
+        self._unaccount('read_states', channel_id)
+        return super()._remove_read_state(channel_id)
+
+    def _remove_emoji(self, emoji_id: str, server_id: typing.Optional[str], /) -> typing.Optional[Emoji]:
+        self._unaccount('emojis', emoji_id)
+        return super()._remove_emoji(emoji_id, server_id)
+
+    def _remove_server(self, server_id: str, /) -> typing.Optional[Server]:
+        self._unaccount('servers', server_id)
+        return super()._remove_server(server_id)
+
+    def _remove_server_member(self, server_id: str, user_id: str, /) -> typing.Optional[Member]:
+        self._unaccount('server_members', (server_id, user_id))
+        return super()._remove_server_member(server_id, user_id)
+
+    def _remove_user(self, user_id: str, /) -> typing.Optional[User]:
+        self._unaccount('users', user_id)
+        return super()._remove_user(user_id)
+
+    ############
+    # Channels #
+    ############
+    def store_channel(self, channel: Channel, ctx: BaseCacheContext, /) -> None:
+        super().store_channel(channel, ctx)
+        if channel.id in self._channels:
+            self._account('channels', channel.id, channel)
+
+    def delete_server_channels_of(self, server_id: str, ctx: BaseCacheContext, /) -> None:
+        channels = self._server_channels.get(server_id)
+        super().delete_server_channels_of(server_id, ctx)
+        if channels:
+            for channel_id in channels.keys():
+                self._unaccount('channels', channel_id)
+
+    ####################
+    # Channel Messages #
+    ####################
+    def store_message(self, message: Message, ctx: BaseCacheContext, /) -> None:
+        super().store_message(message, ctx)
+        messages = self._messages.get(message.channel_id)
+        if messages is not None and message.id in messages:
+            self._account('messages', (message.channel_id, message.id), message)
+
+    def delete_messages_of(self, channel_id: str, ctx: BaseCacheContext, /) -> None:
+        messages = self._messages.get(channel_id)
+        super().delete_messages_of(channel_id, ctx)
+        if messages:
+            for message_id in messages.keys():
+                self._unaccount('messages', (channel_id, message_id))
+
+    ###############
+    # Read States #
+    ###############
+    def store_read_state(self, read_state: ReadState, ctx: BaseCacheContext, /) -> None:
+        super().store_read_state(read_state, ctx)
+        if read_state.channel_id in self._read_states:
+            self._account('read_states', read_state.channel_id, read_state)
+
+    ##########
+    # Emojis #
+    ##########
+    def delete_server_emojis_of(self, server_id: str, ctx: BaseCacheContext, /) -> None:
+        emojis = self._server_emojis.get(server_id)
+        super().delete_server_emojis_of(server_id, ctx)
+        if emojis:
+            for emoji_id in emojis.keys():
+                self._unaccount('emojis', emoji_id)
+
+    def store_emoji(self, emoji: Emoji, ctx: BaseCacheContext, /) -> None:
+        super().store_emoji(emoji, ctx)
+        if emoji.id in self._emojis:
+            self._account('emojis', emoji.id, emoji)
+
+    ###########
+    # Servers #
+    ###########
+    def store_server(self, server: Server, ctx: BaseCacheContext, /) -> None:
+        super().store_server(server, ctx)
+        if server.id in self._servers:
+            self._account('servers', server.id, server)
+
+    ##################
+    # Server Members #
+    ##################
+    def bulk_store_server_members(
+        self,
+        server_id: str,
+        members: dict[str, Member],
+        ctx: BaseCacheContext,
+        /,
+    ) -> None:
+        super().bulk_store_server_members(server_id, members, ctx)
+        for user_id, member in members.items():
+            self._account('server_members', (server_id, user_id), member)
+
+    def overwrite_server_members(
+        self,
+        server_id: str,
+        members: dict[str, Member],
+        ctx: BaseCacheContext,
+        /,
+    ) -> None:
+        old = self._server_members.get(server_id)
+        super().overwrite_server_members(server_id, members, ctx)
+        if old:
+            for user_id in old.keys():
+                self._unaccount('server_members', (server_id, user_id))
+        for user_id, member in members.items():
+            self._account('server_members', (server_id, user_id), member)
+
+    def store_server_member(self, member: Member, ctx: BaseCacheContext, /) -> None:
+        super().store_server_member(member, ctx)
+        members = self._server_members.get(member.server_id)
+        if members is not None and member.id in members:
+            self._account('server_members', (member.server_id, member.id), member)
+
+    def delete_server_members_of(self, server_id: str, ctx: BaseCacheContext, /) -> None:
+        members = self._server_members.get(server_id)
+        super().delete_server_members_of(server_id, ctx)
+        if members:
+            for user_id in members.keys():
+                self._unaccount('server_members', (server_id, user_id))
+
+    #########
+    # Users #
+    #########
+    def store_user(self, user: User, ctx: BaseCacheContext, /) -> None:
+        super().store_user(user, ctx)
+        if user.id in self._users:
+            self._account('users', user.id, user)
+
+    def bulk_store_users(self, users: Mapping[str, User], ctx: BaseCacheContext, /) -> None:
+        super().bulk_store_users(users, ctx)
+        for user_id, user in users.items():
+            self._account('users', user_id, user)
+
+
+CacheKey = typing.Union[str, tuple[str, str]]
+
+
+class AsyncCache(ABC):
+    """An ABC that represents cache living outside of event loop, such as cache daemon or remote key-value store.
+
+    Unlike :class:`.Cache`, all operations are coroutines and work on batches of objects, so implementations
+    can pipeline them over network. Objects are addressed by :class:`.CacheEntityType` and key:
+
+    - ``messages`` are keyed by tuple of channel and message IDs;
+    - ``server_members`` are keyed by tuple of server and user IDs;
+    - ``private_channels_by_user`` are keyed by user ID, take :class:`.DMChannel` on store and return channel ID;
+    - everything else is keyed by object's ID (or channel ID for ``read_states`` and ``channel_voice_states``).
+
+    .. warning::
+        Asynchronous cache is only updated by events and is not available as :attr:`.State.cache`.
+        Everything that reads cache synchronously finds nothing when only asynchronous cache is used,
+        including :meth:`.Client.get_user` and other ``get_*`` methods, :attr:`.Server.channels`,
+        :attr:`.Message.author` of messages received without author object, command converters, and
+        :meth:`.HTTPClient.get_messages` with ``cache_first=True``.
+
+    .. note::
+        Use :class:`.SyncCacheAdapter` to use existing :class:`.Cache` as :class:`.AsyncCache`.
+        Passing it to :class:`.Client` is same as passing wrapped cache.
+    """
+
+    __slots__ = ()
+
+    async def start(self) -> None:
+        """|coro|
+
+        Called when the client is starting up, before the shard connects.
+        """
+        pass
+
+    async def close(self) -> None:
+        """|coro|
+
+        Called when the client is closing.
+        """
+        pass
+
+    @abstractmethod
+    async def get_many(
+        self, type: CacheEntityType, keys: Sequence[CacheKey], ctx: BaseCacheContext, /
+    ) -> list[typing.Optional[typing.Any]]:
+        """|coro|
+
+        Retrieves multiple objects of same type.
+
+        Parameters
+        ----------
+        type: :class:`.CacheEntityType`
+            The type of objects.
+        keys: Sequence[Union[:class:`str`, Tuple[:class:`str`, :class:`str`]]]
+            The keys of objects.
+        ctx: :class:`.BaseCacheContext`
+            The context.
+
+        Returns
+        -------
+        List[Optional[Any]]
+            The objects, in same order as keys. Missing objects are ``None``.
+        """
+        ...
+
+    @abstractmethod
+    async def store_many(self, type: CacheEntityType, values: Sequence[typing.Any], ctx: BaseCacheContext, /) -> None:
+        """|coro|
+
+        Stores multiple objects of same type.
+
+        Parameters
+        ----------
+        type: :class:`.CacheEntityType`
+            The type of objects.
+        values: Sequence[Any]
+            The objects to store.
+        ctx: :class:`.BaseCacheContext`
+            The context.
+        """
+        ...
+
+    @abstractmethod
+    async def delete_many(self, type: CacheEntityType, keys: Sequence[CacheKey], ctx: BaseCacheContext, /) -> None:
+        """|coro|
+
+        Deletes multiple objects of same type.
+
+        Parameters
+        ----------
+        type: :class:`.CacheEntityType`
+            The type of objects.
+        keys: Sequence[Union[:class:`str`, Tuple[:class:`str`, :class:`str`]]]
+            The keys of objects.
+        ctx: :class:`.BaseCacheContext`
+            The context.
+        """
+        ...
+
+    @abstractmethod
+    async def delete_messages_of(self, channel_id: str, ctx: BaseCacheContext, /) -> None:
+        """|coro|
+
+        Deletes all messages from a channel.
+
+        Parameters
+        ----------
+        channel_id: :class:`str`
+            The channel's ID.
+        ctx: :class:`.BaseCacheContext`
+            The context.
+        """
+        ...
+
+    @abstractmethod
+    async def delete_messages_by_author(self, author_id: str, ctx: BaseCacheContext, /) -> None:
+        """|coro|
+
+        Deletes all messages sent by a user.
+
+        Parameters
+        ----------
+        author_id: :class:`str`
+            The author's ID.
+        ctx: :class:`.BaseCacheContext`
+            The context.
+        """
+        ...
+
+    @abstractmethod
+    async def purge_server(self, server_id: str, ctx: BaseCacheContext, /) -> None:
+        """|coro|
+
+        Deletes a server along with its channels, emojis, members, messages, read states and voice states.
+
+        Parameters
+        ----------
+        server_id: :class:`str`
+            The server's ID.
+        ctx: :class:`.BaseCacheContext`
+            The context.
+        """
+        ...
+
+    async def reset_live_message_ranges(self, ctx: BaseCacheContext, /) -> None:
+        """|coro|
+
+        Called when messages might have been missed, such as after reconnecting.
+        See :meth:`.Cache.reset_live_message_ranges` for details.
+        """
+        pass
+
+    async def get(self, type: CacheEntityType, key: CacheKey, ctx: BaseCacheContext, /) -> typing.Optional[typing.Any]:
+        """|coro|
+
+        Retrieves a single object. This is shortcut for :meth:`.get_many`.
+        """
+        return (await self.get_many(type, (key,), ctx))[0]
+
+    async def store(self, type: CacheEntityType, value: typing.Any, ctx: BaseCacheContext, /) -> None:
+        """|coro|
+
+        Stores a single object. This is shortcut for :meth:`.store_many`.
+        """
+        await self.store_many(type, (value,), ctx)
+
+    async def delete(self, type: CacheEntityType, key: CacheKey, ctx: BaseCacheContext, /) -> None:
+        """|coro|
+
+        Deletes a single object. This is shortcut for :meth:`.delete_many`.
+        """
+        await self.delete_many(type, (key,), ctx)
+
+
+class SyncCacheAdapter(AsyncCache):
+    """Implementation of :class:`.AsyncCache` ABC that wraps a synchronous :class:`.Cache`.
+
+    Each operation calls corresponding method of wrapped cache without suspending.
+    :class:`.Client` unwraps it and uses wrapped cache as :attr:`.State.cache`.
+
+    Parameters
+    ----------
+    cache: :class:`.Cache`
+        The cache to wrap.
+    """
+
+    __slots__ = ('cache',)
+
+    def __init__(self, cache: Cache, /) -> None:
+        self.cache: Cache = cache
+
+    async def start(self) -> None:
+        await self.cache.start()
+
+    async def close(self) -> None:
+        await self.cache.close()
+
+    def _get(self, type: CacheEntityType, key: typing.Any, ctx: BaseCacheContext, /) -> typing.Optional[typing.Any]:
+        cache = self.cache
+        if type == 'channels':
+            return cache.get_channel(key, ctx)
+        elif type == 'emojis':
+            return cache.get_emoji(key, ctx)
+        elif type == 'messages':
+            return cache.get_message(key[0], key[1], ctx)
+        elif type == 'read_states':
+            return cache.get_read_state(key, ctx)
+        elif type == 'servers':
+            return cache.get_server(key, ctx)
+        elif type == 'server_members':
+            return cache.get_server_member(key[0], key[1], ctx)
+        elif type == 'users':
+            return cache.get_user(key, ctx)
+        elif type == 'private_channels_by_user':
+            return cache.get_private_channel_by_user(key, ctx)
+        elif type == 'channel_voice_states':
+            return cache.get_channel_voice_state(key, ctx)
+        raise TypeError(f'Unknown cache entity type: {type!r}')
+
+    def _store(self, type: CacheEntityType, value: typing.Any, ctx: BaseCacheContext, /) -> None:
+        cache = self.cache
+        if type == 'channels':
+            cache.store_channel(value, ctx)
+        elif type == 'emojis':
+            cache.store_emoji(value, ctx)
+        elif type == 'messages':
+            cache.store_message(value, ctx)
+        elif type == 'read_states':
+            cache.store_read_state(value, ctx)
+        elif type == 'servers':
+            cache.store_server(value, ctx)
+        elif type == 'server_members':
+            cache.store_server_member(value, ctx)
+        elif type == 'users':
+            cache.store_user(value, ctx)
+        elif type == 'private_channels_by_user':
+            cache.store_private_channel_by_user(value, ctx)
+        elif type == 'channel_voice_states':
+            cache.store_channel_voice_state(value, ctx)
+        else:
+            raise TypeError(f'Unknown cache entity type: {type!r}')
+
+    def _delete(self, type: CacheEntityType, key: typing.Any, ctx: BaseCacheContext, /) -> None:
+        cache = self.cache
+        if type == 'channels':
+            cache.delete_channel(key, ctx)
+        elif type == 'emojis':
+            cache.delete_emoji(key, None, ctx)
+        elif type == 'messages':
+            cache.delete_message(key[0], key[1], ctx)
+        elif type == 'read_states':
+            cache.delete_read_state(key, ctx)
+        elif type == 'servers':
+            cache.delete_server(key, ctx)
+        elif type == 'server_members':
+            cache.delete_server_member(key[0], key[1], ctx)
+        elif type == 'private_channels_by_user':
+            cache.delete_private_channel_by_user(key, ctx)
+        elif type == 'channel_voice_states':
+            cache.delete_channel_voice_state(key, ctx)
+        else:
+            raise TypeError(f'Cannot delete {type!r} from cache')
+
+    async def get_many(
+        self, type: CacheEntityType, keys: Sequence[CacheKey], ctx: BaseCacheContext, /
+    ) -> list[typing.Optional[typing.Any]]:
+        return [self._get(type, key, ctx) for key in keys]
+
+    async def store_many(self, type: CacheEntityType, values: Sequence[typing.Any], ctx: BaseCacheContext, /) -> None:
+        if type == 'channel_voice_states':
+            self.cache.bulk_store_channel_voice_states({container.channel_id: container for container in values}, ctx)
+            return
+        # Objects are stored one by one, as bulk methods of Cache bypass size limits
+        for value in values:
+            self._store(type, value, ctx)
+
+    async def delete_many(self, type: CacheEntityType, keys: Sequence[CacheKey], ctx: BaseCacheContext, /) -> None:
+        for key in keys:
+            self._delete(type, key, ctx)
+
+    async def get(self, type: CacheEntityType, key: CacheKey, ctx: BaseCacheContext, /) -> typing.Optional[typing.Any]:
+        return self._get(type, key, ctx)
+
+    async def store(self, type: CacheEntityType, value: typing.Any, ctx: BaseCacheContext, /) -> None:
+        self._store(type, value, ctx)
+
+    async def delete(self, type: CacheEntityType, key: CacheKey, ctx: BaseCacheContext, /) -> None:
+        self._delete(type, key, ctx)
+
+    async def delete_messages_of(self, channel_id: str, ctx: BaseCacheContext, /) -> None:
+        self.cache.delete_messages_of(channel_id, ctx)
+
+    async def delete_messages_by_author(self, author_id: str, ctx: BaseCacheContext, /) -> None:
+        self.cache.delete_messages_by_author(author_id, ctx)
+
+    async def reset_live_message_ranges(self, ctx: BaseCacheContext, /) -> None:
+        self.cache.reset_live_message_ranges(ctx)
+
+    async def purge_server(self, server_id: str, ctx: BaseCacheContext, /) -> None:
+        from .events import _purge_server
+
+        cache = self.cache
+        _purge_server(cache, server_id, cache.get_server(server_id, ctx), ctx)
 
 
 # re-export internal functions as well for future usage
@@ -2146,5 +4816,31 @@ __all__ = (
     'EmptyCache',
     '_put0',
     '_put1',
+    '_touch',
+    '_pop_expired',
+    '_name_matches',
+    '_SNAPSHOT_VERSION',
+    '_attrs_fields_of',
+    '_restore_attrs',
+    '_snapshot_state',
+    '_SnapshotPickler',
+    '_SnapshotUnpickler',
+    '_NameIndex',
+    '_range_start',
+    '_MessageTimeline',
+    '_EPOCH',
+    '_MICROSECOND',
+    '_CompactMemberMap',
     'MapCache',
+    'CacheEntityType',
+    '_estimate_size',
+    'CacheMemoryUsage',
+    'CacheMemoryReport',
+    'CacheStatsCounters',
+    'CacheStatsSnapshot',
+    'CacheStats',
+    'BudgetedMapCache',
+    'CacheKey',
+    'AsyncCache',
+    'SyncCacheAdapter',
 )
@@ -25,6 +25,7 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+import asyncio
 import io
 import logging
 import typing
@@ -39,7 +40,10 @@ from .core import __version__ as version
 from .errors import HTTPException
 
 if typing.TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from .enums import AssetMetadataType
+    from .retry import RetryPolicy
     from .state import State
 
     from typing_extensions import Self
@@ -380,6 +384,29 @@ async def resolve_resource(state: State, resolvable: ResolvableResource, /, *, t
         return ''
 
 
+async def resolve_resources(state: State, resolvables: Iterable[ResolvableResource], /, *, tag: Tag) -> list[str]:
+    """Resolve multiple resources, uploading them concurrently.
+
+    The number of concurrent uploads is limited by :attr:`.CDNClient.max_concurrent_uploads`.
+
+    Parameters
+    ----------
+    state: :class:`.State`
+        The state.
+    resolvables: Iterable[:class:`ResolvableResource`]
+        The objects that should be resolved.
+
+    Returns
+    -------
+    List[:class:`str`]
+        The uploaded file IDs, in same order as resources. If any upload fails, remaining ones are cancelled.
+    """
+    resolvables = list(resolvables)
+    if all(isinstance(resolvable, str) for resolvable in resolvables):
+        return resolvables  # type: ignore
+    return await utils._gather(*(resolve_resource(state, resolvable, tag=tag) for resolvable in resolvables))
+
+
 class CDNClient:
     """Represents an HTTP client sending HTTP requests to the Revolt Autumn API.
 
@@ -393,7 +420,10 @@ class CDNClient:
 
     __slots__ = (
         '_base',
+        '_max_concurrent_uploads',
+        '_retry_policy',
         '_session',
+        '_upload_semaphore',
         'state',
         'user_agent',
     )
@@ -402,6 +432,8 @@ class CDNClient:
         self,
         *,
         base: typing.Optional[str] = None,
+        max_concurrent_uploads: int = 4,
+        retry_policy: typing.Optional[RetryPolicy] = None,
         session: typing.Union[utils.MaybeAwaitableFunc[[CDNClient], aiohttp.ClientSession], aiohttp.ClientSession],
         state: State,
         user_agent: typing.Optional[str] = None,
@@ -410,6 +442,9 @@ class CDNClient:
             base = 'https://autumn.revolt.chat'
 
         self._base = base.rstrip('/')
+        self._max_concurrent_uploads: int = max_concurrent_uploads
+        self._upload_semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrent_uploads)
+        self._retry_policy: typing.Optional[RetryPolicy] = retry_policy
         self._session: typing.Union[
             utils.MaybeAwaitableFunc[[CDNClient], aiohttp.ClientSession], aiohttp.ClientSession
         ] = session
@@ -426,6 +461,24 @@ class CDNClient:
         """:class:`bool`: Whether the token belongs to bot account."""
         return self.state.http.bot
 
+    @property
+    def max_concurrent_uploads(self) -> int:
+        """:class:`int`: The maximum number of files uploaded at once. Defaults to 4."""
+        return self._max_concurrent_uploads
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        """:class:`.RetryPolicy`: The policy deciding whether and when failed requests are retried.
+        Defaults to policy of :class:`.HTTPClient`.
+        """
+        if self._retry_policy is None:
+            return self.state.http.retry_policy
+        return self._retry_policy
+
+    @retry_policy.setter
+    def retry_policy(self, value: typing.Optional[RetryPolicy]) -> None:
+        self._retry_policy = value
+
     @property
     def token(self) -> str:
         """:class:`str`: The token in use. May be empty if not started."""
@@ -463,12 +516,50 @@ class CDNClient:
 
         _L.debug('Sending request to %s', route)
 
-        response = await session.request(
-            method,
-            url,
-            headers=headers,
-            **kwargs,
-        )
+        retry_policy = self.retry_policy
+        # Form data can be sent only once
+        retryable = not isinstance(kwargs.get('data'), aiohttp.FormData)
+        retries = 0
+
+        while True:
+            try:
+                response = await session.request(
+                    method,
+                    url,
+                    headers=headers,
+                    **kwargs,
+                )
+            except OSError as exc:
+                if retryable and exc.errno in (54, 10054):  # Connection reset by peer
+                    delay = retry_policy.compute_delay(
+                        retries,
+                        'connection_reset',
+                        method=method,
+                        path=route,
+                        idempotent=method != 'POST',
+                    )
+                    if delay is not None:
+                        retries += 1
+                        await asyncio.sleep(delay)
+                        continue
+                raise
+
+            if retryable and response.status in (429, 502, 525):
+                delay = retry_policy.compute_delay(
+                    retries,
+                    str(response.status),  # type: ignore
+                    method=method,
+                    path=route,
+                    idempotent=method != 'POST',
+                )
+                if delay is not None:
+                    _L.debug('%s %s has returned %s, retrying in %.3f seconds', method, route, response.status, delay)
+                    response.close()
+                    retries += 1
+                    await asyncio.sleep(delay)
+                    continue
+            break
+
         if response.status >= 400:
             data = await utils._json_or_text(response)
             if isinstance(data, dict) and isinstance(data.get('error'), dict):
@@ -482,6 +573,8 @@ class CDNClient:
             from .http import _STATUS_TO_ERRORS
 
             raise _STATUS_TO_ERRORS.get(response.status, HTTPException)(response, data)
+
+        retry_policy.on_success()
         return response
 
     def url_for(
@@ -516,8 +609,9 @@ class CDNClient:
         tag: Tag,
         data: aiohttp.FormData,
     ) -> str:
-        response = await self.request('POST', f'/{quote(tag)}', data=data)
-        rd = await response.json(loads=utils.from_json)
+        async with self._upload_semaphore:
+            response = await self.request('POST', f'/{quote(tag)}', data=data)
+            rd = utils.from_json(await response.read())
         response.close()
         return rd['id']
 
@@ -536,5 +630,6 @@ __all__ = (
     'Upload',
     'ResolvableResource',
     'resolve_resource',
+    'resolve_resources',
     'CDNClient',
 )
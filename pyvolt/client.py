@@ -33,7 +33,7 @@ import typing
 import aiohttp
 
 from . import cache as caching, utils
-from .cache import Cache, MapCache
+from .cache import AsyncCache, Cache, MapCache, SyncCacheAdapter
 from .cdn import CDNClient
 from .channel import SavedMessagesChannel, DMChannel, GroupChannel, Channel
 from .core import (
@@ -118,8 +118,12 @@ if typing.TYPE_CHECKING:
 _L = logging.getLogger(__name__)
 
 
-def _session_factory(_) -> aiohttp.ClientSession:
-    return aiohttp.ClientSession()
+def _session_factory(client: typing.Union[CDNClient, HTTPClient, Shard], /) -> aiohttp.ClientSession:
+    # The factory is shared by CDN client and shard, which are not instrumented
+    instrumentation = getattr(client, 'instrumentation', None)
+    if instrumentation is None:
+        return aiohttp.ClientSession()
+    return aiohttp.ClientSession(trace_configs=instrumentation.trace_configs())
 
 
 class ClientEventHandler(EventHandler):
@@ -664,7 +668,8 @@ class Client:
         token: str = '',
         bot: bool = True,
         cache: typing.Union[
-            Callable[[Client, State], UndefinedOr[typing.Optional[Cache]]], UndefinedOr[typing.Optional[Cache]]
+            Callable[[Client, State], UndefinedOr[typing.Optional[typing.Union[Cache, AsyncCache]]]],
+            UndefinedOr[typing.Optional[typing.Union[Cache, AsyncCache]]],
         ] = UNDEFINED,
         cdn_base: typing.Optional[str] = None,
         cdn_client: typing.Optional[Callable[[Client, State], CDNClient]] = None,
@@ -682,7 +687,8 @@ class Client:
         token: str = '',
         bot: bool = True,
         cache: typing.Union[
-            Callable[[Client, State], UndefinedOr[typing.Optional[Cache]]], UndefinedOr[typing.Optional[Cache]]
+            Callable[[Client, State], UndefinedOr[typing.Optional[typing.Union[Cache, AsyncCache]]]],
+            UndefinedOr[typing.Optional[typing.Union[Cache, AsyncCache]]],
         ] = UNDEFINED,
         cdn_base: typing.Optional[str] = None,
         cdn_client: typing.Optional[Callable[[Client, State], CDNClient]] = None,
@@ -722,6 +728,13 @@ class Client:
             else:
                 cr = cache
             c = cr if cr is not UNDEFINED else MapCache()
+            if isinstance(c, SyncCacheAdapter):
+                # Wrapped cache is accessed directly, so it stays available to synchronous lookups
+                c = c.cache
+            elif isinstance(c, AsyncCache):
+                # Events update asynchronous cache in abefore_dispatch() and aprocess()
+                state.setup(async_cache=c)
+                c = None
 
             if parser:
                 state.setup(parser=parser(self, state))
@@ -820,6 +833,10 @@ class Client:
                 _L.exception('on_user_error (task: %s) raised an exception', name)
 
     async def _dispatch(self, types: list[type[BaseEvent]], event: BaseEvent, name: str, /) -> None:
+        http = self._state._http
+        if http is not None and http.response_cache is not None:
+            event.invalidate_responses(http.response_cache)
+
         event.before_dispatch()
         await event.abefore_dispatch()
 
@@ -1550,6 +1567,15 @@ class Client:
         Starts up the client.
         """
         self.closed = False
+
+        cache = self._state.cache
+        if cache is not None:
+            await cache.start()
+
+        async_cache = self._state.async_cache
+        if async_cache is not None:
+            await async_cache.start()
+
         await self._state.shard.connect()
 
     async def close(self, *, http: bool = True, cleanup_websocket: bool = True) -> None:
@@ -1564,6 +1590,14 @@ class Client:
         if cleanup_websocket:
             await self.shard.cleanup()
 
+        cache = self._state.cache
+        if cache is not None:
+            await cache.close()
+
+        async_cache = self._state.async_cache
+        if async_cache is not None:
+            await async_cache.close()
+
         if http:
             await self.http.cleanup()
 
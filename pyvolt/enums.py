@@ -42,6 +42,8 @@ def _create_value_cls(name: str, comparable: bool, /):
     cls = namedtuple('_EnumValue_' + name, 'name value')
     cls.__repr__ = lambda self: f'<{name}.{self.name}: {self.value!r}>'  # type: ignore
     cls.__str__ = lambda self: f'{name}.{self.name}'  # type: ignore
+    # Value classes are not importable, so pickle them as lookups on actual enum class
+    cls.__reduce__ = lambda self: (self._actual_enum_cls_, (self.value,))  # type: ignore
     if comparable:
         cls.__le__ = lambda self, other: isinstance(other, self.__class__) and self.value <= other.value  # type: ignore
         cls.__ge__ = lambda self, other: isinstance(other, self.__class__) and self.value >= other.value  # type: ignore
@@ -562,6 +564,16 @@ class ReportedContentType(Enum):
     user = 'User'
 
 
+class RequestLane(Enum):
+    """The lane HTTP requests are queued in when bucket is ratelimited."""
+
+    interactive = 0
+    """Requests that someone waits for, such as command replies. These are released first."""
+
+    background = 1
+    """Bulk and maintenance requests, which use capacity left by interactive ones."""
+
+
 __all__ = (
     'EnumMeta',
     'Enum',
@@ -593,4 +605,5 @@ __all__ = (
     'RelationshipStatus',
     'ReportStatus',
     'ReportedContentType',
+    'RequestLane',
 )
@@ -33,7 +33,7 @@ from typing import cast as _cast
 
 from attrs import Factory, define, field
 
-from . import cache as caching, utils
+from . import cache as caching, routes, utils
 from .channel import (
     PartialChannel,
     SavedMessagesChannel,
@@ -70,7 +70,9 @@ if typing.TYPE_CHECKING:
 
     from .authentication import Session
     from .client import Client
+    from .emoji import Emoji
     from .flags import UserFlags
+    from .http import ResponseCache
     from .message import PartialMessage, MessageAppendData, Message
     from .safety_reports import CreatedReport
     from .settings import UserSettings
@@ -80,6 +82,41 @@ if typing.TYPE_CHECKING:
 
 _new_user_flags = UserFlags.__new__
 
+T = typing.TypeVar('T')
+
+SkipBeforeSnapshotIn = typing.Literal[
+    'ChannelUpdateEvent',
+    'MessageUpdateEvent',
+    'ServerUpdateEvent',
+    'ServerMemberUpdateEvent',
+    'RawServerRoleUpdateEvent',
+    'UserUpdateEvent',
+    'UserPlatformWipeEvent',
+    'UserVoiceStateUpdateEvent',
+]
+
+
+def _purge_server(
+    cache: caching.Cache, server_id: str, server: typing.Optional[Server], ctx: caching.BaseCacheContext, /
+) -> None:
+    channels = cache.get_server_channels_mapping_of(server_id, ctx)
+
+    channel_ids: dict[str, None] = dict.fromkeys(server.channel_ids) if server is not None else {}
+    if channels is not None:
+        channel_ids.update(dict.fromkeys(channels.keys()))
+
+    cache.delete_server_emojis_of(server_id, ctx)
+    cache.delete_server_members_of(server_id, ctx)
+    cache.delete_messages_in_server(server_id, ctx)
+
+    for channel_id in channel_ids.keys():
+        cache.delete_read_state(channel_id, ctx)
+        cache.delete_channel_voice_state(channel_id, ctx)
+        cache.delete_messages_of(channel_id, ctx)
+
+    cache.delete_server_channels_of(server_id, ctx)
+    cache.delete_server(server_id, ctx)
+
 
 @define(slots=True)
 class BaseEvent:
@@ -127,6 +164,16 @@ class BaseEvent:
         """Called before handlers are invoked."""
         pass
 
+    def invalidate_responses(self, cache: ResponseCache, /) -> None:
+        """Called before :meth:`.before_dispatch` to remove HTTP responses made stale by this event.
+
+        Parameters
+        ----------
+        cache: :class:`.ResponseCache`
+            The response cache to remove responses from.
+        """
+        pass
+
     async def aprocess(self) -> typing.Any:
         """|coro|
 
@@ -146,6 +193,32 @@ class ShardEvent(BaseEvent):
     shard: Shard = field(repr=True, kw_only=True)
     """:class:`.Shard`: The shard the event arrived on."""
 
+    def _snapshot(self, before: T, /) -> tuple[typing.Optional[T], T]:
+        # Returns the object as it was before and the object to update. If event is in
+        # State.skip_before_snapshot_in, the cached object is updated in place and no snapshot is made.
+        if self.__class__.__name__ in self.shard.state.skip_before_snapshot_in:
+            return None, before
+        return before, copy(before)
+
+    # Asynchronous cache updates, run only when State.async_cache is set.
+    # Synchronous cache is updated directly in before_dispatch() and process().
+    async def _abefore_dispatch(self, cache: caching.AsyncCache, /) -> None:
+        pass
+
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        return False
+
+    async def abefore_dispatch(self) -> None:
+        cache = self.shard.state.async_cache
+        if cache is not None:
+            await self._abefore_dispatch(cache)
+
+    async def aprocess(self) -> bool:
+        cache = self.shard.state.async_cache
+        if cache is None:
+            return False
+        return await self._aprocess(cache)
+
 
 @define(slots=True)
 class ReadyEvent(ShardEvent):
@@ -201,6 +274,16 @@ class ReadyEvent(ShardEvent):
         state._me = self.me
         state._settings = self.user_settings
 
+    def _get_cache_context(self) -> typing.Union[caching.UndefinedCacheContext, caching.ReadyEventCacheContext]:
+        return (
+            caching.ReadyEventCacheContext(
+                type=caching.CacheContextType.ready_event,
+                event=self,
+            )
+            if 'ReadyEvent' in self.shard.state.provide_cache_context_in
+            else caching._READY_EVENT
+        )
+
     def process(self) -> bool:
         state = self.shard.state
         cache = state.cache
@@ -208,14 +291,23 @@ class ReadyEvent(ShardEvent):
         if not cache:
             return False
 
-        ctx = (
-            caching.ReadyEventCacheContext(
-                type=caching.CacheContextType.ready_event,
-                event=self,
-            )
-            if 'ReadyEvent' in state.provide_cache_context_in
-            else caching._READY_EVENT
-        )
+        ctx = self._get_cache_context()
+
+        # Messages sent while disconnected were missed
+        cache.reset_live_message_ranges(ctx)
+
+        # Drop servers and channels we lost access to while disconnected, or since cache snapshot was taken
+        server_ids = {s.id for s in self.servers}
+        for server_id, server in list(cache.get_servers_mapping().items()):
+            if server_id not in server_ids:
+                _purge_server(cache, server_id, server, ctx)
+
+        channel_ids = {channel.id for channel in self.channels}
+        for channel_id in [channel_id for channel_id in cache.get_channels_mapping() if channel_id not in channel_ids]:
+            cache.delete_channel(channel_id, ctx)
+            cache.delete_messages_of(channel_id, ctx)
+            cache.delete_read_state(channel_id, ctx)
+            cache.delete_channel_voice_state(channel_id, ctx)
 
         for u in self.users:
             cache.store_user(u, ctx)
@@ -243,6 +335,33 @@ class ReadyEvent(ShardEvent):
 
         return True
 
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        state = self.shard.state
+        ctx = self._get_cache_context()
+
+        # Messages sent while disconnected were missed
+        await cache.reset_live_message_ranges(ctx)
+
+        # Unlike process(), this does not drop servers and channels missing in Ready,
+        # as asynchronous caches are usually shared with other shards or processes.
+        await cache.store_many('users', self.users, ctx)
+        await cache.store_many('servers', self.servers, ctx)
+        await cache.store_many('channels', self.channels, ctx)
+        await cache.store_many(
+            'private_channels_by_user',
+            [channel for channel in self.channels if isinstance(channel, DMChannel)],
+            ctx,
+        )
+        for channel in self.channels:
+            if isinstance(channel, SavedMessagesChannel):
+                state._saved_notes = channel
+        await cache.store_many('server_members', self.members, ctx)
+        await cache.store_many('emojis', self.emojis, ctx)
+        await cache.store_many('read_states', self.read_states, ctx)
+        await cache.store_many('channel_voice_states', self.voice_states, ctx)
+
+        return True
+
 
 @define(slots=True)
 class BaseChannelCreateEvent(ShardEvent):
@@ -260,6 +379,18 @@ class PrivateChannelCreateEvent(BaseChannelCreateEvent):
     channel: PrivateChannel = field(repr=True, kw_only=True)
     """:class:`.PrivateChannel`: The joined DM or group channel."""
 
+    def _get_cache_context(
+        self,
+    ) -> typing.Union[caching.UndefinedCacheContext, caching.PrivateChannelCreateEventCacheContext]:
+        return (
+            caching.PrivateChannelCreateEventCacheContext(
+                type=caching.CacheContextType.private_channel_create_event,
+                event=self,
+            )
+            if 'PrivateChannelCreate' in self.shard.state.provide_cache_context_in
+            else caching._PRIVATE_CHANNEL_CREATE_EVENT
+        )
+
     def process(self) -> bool:
         state = self.shard.state
         cache = state.cache
@@ -267,22 +398,41 @@ class PrivateChannelCreateEvent(BaseChannelCreateEvent):
         if cache is None:
             return False
 
-        ctx = (
-            caching.PrivateChannelCreateEventCacheContext(
-                type=caching.CacheContextType.private_channel_create_event,
-                event=self,
-            )
-            if 'PrivateChannelCreate' in state.provide_cache_context_in
-            else caching._PRIVATE_CHANNEL_CREATE_EVENT
-        )
+        ctx = self._get_cache_context()
 
         channel = self.channel
         cache.store_channel(channel, ctx)
 
-        read_state: typing.Optional[ReadState] = None
+        if isinstance(channel, DMChannel):
+            cache.store_private_channel_by_user(channel, ctx)
+
+        read_state = self._create_read_state()
+        if read_state is not None:
+            cache.store_read_state(read_state, ctx)
+
+        return True
+
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        ctx = self._get_cache_context()
+
+        channel = self.channel
+        await cache.store('channels', channel, ctx)
+
+        if isinstance(channel, DMChannel):
+            await cache.store('private_channels_by_user', channel, ctx)
+
+        read_state = self._create_read_state()
+        if read_state is not None:
+            await cache.store('read_states', read_state, ctx)
+
+        return True
+
+    def _create_read_state(self) -> typing.Optional[ReadState]:
+        state = self.shard.state
+        channel = self.channel
 
         if isinstance(channel, SavedMessagesChannel):
-            read_state = ReadState(
+            return ReadState(
                 state=state,
                 channel_id=channel.id,
                 user_id=channel.user_id,
@@ -292,19 +442,14 @@ class PrivateChannelCreateEvent(BaseChannelCreateEvent):
         elif isinstance(channel, DMChannel):
             me = state.me
             if me is not None:
-                read_state = ReadState(
+                return ReadState(
                     state=state,
                     channel_id=channel.id,
                     user_id=me.id,
                     last_acked_message_id=None,
                     mentioned_in=[],
                 )
-            cache.store_private_channel_by_user(channel, ctx)
-
-        if read_state is not None:
-            cache.store_read_state(read_state, ctx)
-
-        return True
+        return None
 
 
 @define(slots=True)
@@ -316,6 +461,18 @@ class ServerChannelCreateEvent(BaseChannelCreateEvent):
     channel: ServerChannel = field(repr=True, kw_only=True)
     """:class:`.ServerChannel`: The created server channel."""
 
+    def _get_cache_context(
+        self,
+    ) -> typing.Union[caching.UndefinedCacheContext, caching.ServerChannelCreateEventCacheContext]:
+        return (
+            caching.ServerChannelCreateEventCacheContext(
+                type=caching.CacheContextType.server_channel_create_event,
+                event=self,
+            )
+            if 'ServerChannelCreate' in self.shard.state.provide_cache_context_in
+            else caching._SERVER_CHANNEL_CREATE_EVENT
+        )
+
     def process(self) -> bool:
         state = self.shard.state
         cache = state.cache
@@ -323,35 +480,44 @@ class ServerChannelCreateEvent(BaseChannelCreateEvent):
         if cache is None:
             return False
 
-        channel = self.channel
-        ctx = (
-            caching.ServerChannelCreateEventCacheContext(
-                type=caching.CacheContextType.server_channel_create_event,
-                event=self,
-            )
-            if 'ServerChannelCreate' in state.provide_cache_context_in
-            else caching._SERVER_CHANNEL_CREATE_EVENT
-        )
+        ctx = self._get_cache_context()
+
+        read_state = self._create_read_state()
+
+        cache.store_channel(self.channel, ctx)
+
+        if read_state is not None:
+            cache.store_read_state(read_state, ctx)
+
+        return True
+
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        ctx = self._get_cache_context()
+
+        read_state = self._create_read_state()
+
+        await cache.store('channels', self.channel, ctx)
 
-        read_state: typing.Optional[ReadState] = None
+        if read_state is not None:
+            await cache.store('read_states', read_state, ctx)
+
+        return True
+
+    def _create_read_state(self) -> typing.Optional[ReadState]:
+        state = self.shard.state
+        channel = self.channel
 
         if isinstance(channel, TextChannel) and channel.last_message_id is None:
             me = state.me
             if me is not None:
-                read_state = ReadState(
+                return ReadState(
                     state=state,
                     channel_id=channel.id,
                     user_id=me.id,
                     last_acked_message_id=None,
                     mentioned_in=[],
                 )
-
-        cache.store_channel(self.channel, ctx)
-
-        if read_state is not None:
-            cache.store_read_state(read_state, ctx)
-
-        return True
+        return None
 
 
 ChannelCreateEvent = typing.Union[PrivateChannelCreateEvent, ServerChannelCreateEvent]
@@ -367,7 +533,10 @@ class ChannelUpdateEvent(ShardEvent):
     """:class:`.PartialChannel`: The fields that were updated."""
 
     before: typing.Optional[Channel] = field(repr=True, kw_only=True)
-    """Optional[:class:`.Channel`]: The channel as it was before being updated, if available."""
+    """Optional[:class:`.Channel`]: The channel as it was before being updated, if available.
+    
+    This is always ``None`` if event is in :attr:`.State.skip_before_snapshot_in`.
+    """
 
     after: typing.Optional[Channel] = field(repr=True, kw_only=True)
     """Optional[:class:`.Channel`]: The channel as it was updated, if available."""
@@ -392,19 +561,24 @@ class ChannelUpdateEvent(ShardEvent):
     )
     """Union[:class:`.UndefinedCacheContextType`, :class:`.ChannelUpdateEventCacheContext`]: The cache context used."""
 
-    def before_dispatch(self) -> None:
-        cache = self.shard.state.cache
-        if not cache:
-            return
-        before = cache.get_channel(self.channel.id, self.cache_context)
-        self.before = before
+    def _update(self, before: typing.Optional[Channel], /) -> None:
         if not before:
+            self.before = before
             return
 
-        after = copy(before)
+        self.before, after = self._snapshot(before)
         after.locally_update(self.channel)
         self.after = after
 
+    def before_dispatch(self) -> None:
+        cache = self.shard.state.cache
+        if not cache:
+            return
+        self._update(cache.get_channel(self.channel.id, self.cache_context))
+
+    async def _abefore_dispatch(self, cache: caching.AsyncCache, /) -> None:
+        self._update(await cache.get('channels', self.channel.id, self.cache_context))
+
     def process(self) -> bool:
         cache = self.shard.state.cache
         if not cache or not self.after:
@@ -412,6 +586,12 @@ class ChannelUpdateEvent(ShardEvent):
         cache.store_channel(self.after, self.cache_context)
         return True
 
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        if not self.after:
+            return False
+        await cache.store('channels', self.after, self.cache_context)
+        return True
+
 
 @define(slots=True)
 class ChannelDeleteEvent(ShardEvent):
@@ -451,6 +631,9 @@ class ChannelDeleteEvent(ShardEvent):
             return
         self.channel = cache.get_channel(self.channel_id, self.cache_context)
 
+    async def _abefore_dispatch(self, cache: caching.AsyncCache, /) -> None:
+        self.channel = await cache.get('channels', self.channel_id, self.cache_context)
+
     def process(self) -> bool:
         cache = self.shard.state.cache
         if not cache:
@@ -472,6 +655,22 @@ class ChannelDeleteEvent(ShardEvent):
         cache.delete_messages_of(self.channel_id, self.cache_context)
         return True
 
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        await cache.delete('channels', self.channel_id, self.cache_context)
+        if isinstance(self.channel, BaseServerChannel):
+            server = await cache.get('servers', self.channel.server_id, self.cache_context)
+            if server:
+                try:
+                    server.internal_channels[1].remove(self.channel.id)
+                except ValueError:
+                    pass
+                else:
+                    await cache.store('servers', server, self.cache_context)
+        elif isinstance(self.channel, DMChannel):
+            await cache.delete('private_channels_by_user', self.channel.recipient_id, self.cache_context)
+        await cache.delete_messages_of(self.channel_id, self.cache_context)
+        return True
+
 
 @define(slots=True)
 class GroupRecipientAddEvent(ShardEvent):
@@ -517,6 +716,12 @@ class GroupRecipientAddEvent(ShardEvent):
             return
         self.group = group
 
+    async def _abefore_dispatch(self, cache: caching.AsyncCache, /) -> None:
+        group = await cache.get('channels', self.channel_id, self.cache_context)
+        if not isinstance(group, GroupChannel):
+            return
+        self.group = group
+
     def process(self) -> bool:
         cache = self.shard.state.cache
         if not cache:
@@ -530,6 +735,15 @@ class GroupRecipientAddEvent(ShardEvent):
 
         return True
 
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        if not self.group:
+            return False
+
+        self.group._join(self.user_id)
+        await cache.store('channels', self.group, self.cache_context)
+
+        return True
+
 
 @define(slots=True)
 class GroupRecipientRemoveEvent(ShardEvent):
@@ -575,6 +789,12 @@ class GroupRecipientRemoveEvent(ShardEvent):
             return
         self.group = group
 
+    async def _abefore_dispatch(self, cache: caching.AsyncCache, /) -> None:
+        group = await cache.get('channels', self.channel_id, self.cache_context)
+        if not isinstance(group, GroupChannel):
+            return
+        self.group = group
+
     def process(self) -> bool:
         cache = self.shard.state.cache
         if not cache:
@@ -588,6 +808,15 @@ class GroupRecipientRemoveEvent(ShardEvent):
 
         return True
 
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        if not self.group:
+            return False
+
+        self.group._leave(self.user_id)
+        await cache.store('channels', self.group, self.cache_context)
+
+        return True
+
 
 @define(slots=True)
 class ChannelStartTypingEvent(ShardEvent):
@@ -630,6 +859,16 @@ class MessageAckEvent(ShardEvent):
     user_id: str = field(repr=True, kw_only=True)
     """:class:`str`: The connected user's ID."""
 
+    def _get_cache_context(self) -> typing.Union[caching.UndefinedCacheContext, caching.MessageAckEventCacheContext]:
+        return (
+            caching.MessageAckEventCacheContext(
+                type=caching.CacheContextType.message_ack_event,
+                event=self,
+            )
+            if 'MessageAck' in self.shard.state.provide_cache_context_in
+            else caching._MESSAGE_ACK_EVENT
+        )
+
     def process(self) -> bool:
         state = self.shard.state
         cache = state.cache
@@ -637,28 +876,34 @@ class MessageAckEvent(ShardEvent):
         if not cache:
             return False
 
-        ctx = (
-            caching.MessageAckEventCacheContext(
-                type=caching.CacheContextType.message_ack_event,
-                event=self,
-            )
-            if 'MessageAck' in state.provide_cache_context_in
-            else caching._MESSAGE_ACK_EVENT
-        )
+        ctx = self._get_cache_context()
 
         read_state = cache.get_read_state(self.channel_id, ctx)
         if read_state:
-            # opposite effect cannot be done
-            if read_state.last_acked_message_id and self.message_id >= read_state.last_acked_message_id:
-                acked_message_id = read_state.last_acked_message_id
+            self._ack(read_state)
+            cache.store_read_state(read_state, ctx)
 
-                read_state.mentioned_in = [m for m in read_state.mentioned_in if m >= acked_message_id]
+        return True
 
-            read_state.last_acked_message_id = self.message_id
-            cache.store_read_state(read_state, ctx)
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        ctx = self._get_cache_context()
+
+        read_state = await cache.get('read_states', self.channel_id, ctx)
+        if read_state:
+            self._ack(read_state)
+            await cache.store('read_states', read_state, ctx)
 
         return True
 
+    def _ack(self, read_state: ReadState, /) -> None:
+        # opposite effect cannot be done
+        if read_state.last_acked_message_id and self.message_id >= read_state.last_acked_message_id:
+            acked_message_id = read_state.last_acked_message_id
+
+            read_state.mentioned_in = [m for m in read_state.mentioned_in if m >= acked_message_id]
+
+        read_state.last_acked_message_id = self.message_id
+
 
 @define(slots=True)
 class MessageCreateEvent(ShardEvent):
@@ -669,6 +914,16 @@ class MessageCreateEvent(ShardEvent):
     message: Message = field(repr=True, kw_only=True)
     """:class:`.Message`: The message sent."""
 
+    def _get_cache_context(self) -> typing.Union[caching.UndefinedCacheContext, caching.MessageCreateEventCacheContext]:
+        return (
+            caching.MessageCreateEventCacheContext(
+                type=caching.CacheContextType.message_create_event,
+                event=self,
+            )
+            if 'MessageCreate' in self.shard.state.provide_cache_context_in
+            else caching._MESSAGE_CREATE_EVENT
+        )
+
     def process(self) -> bool:
         state = self.shard.state
         cache = state.cache
@@ -676,14 +931,7 @@ class MessageCreateEvent(ShardEvent):
         if not cache:
             return False
 
-        ctx = (
-            caching.MessageCreateEventCacheContext(
-                type=caching.CacheContextType.message_create_event,
-                event=self,
-            )
-            if 'MessageCreate' in state.provide_cache_context_in
-            else caching._MESSAGE_CREATE_EVENT
-        )
+        ctx = self._get_cache_context()
 
         author = self.message._author
         if isinstance(author, Member):
@@ -729,6 +977,43 @@ class MessageCreateEvent(ShardEvent):
 
         return True
 
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        ctx = self._get_cache_context()
+
+        message = self.message
+        author = message._author
+        if isinstance(author, Member):
+            if isinstance(author._user, User):
+                await cache.store('users', author._user, ctx)
+            await cache.store('server_members', author, ctx)
+        elif isinstance(author, User):
+            await cache.store('users', author, ctx)
+
+        # Objects are not shared with asynchronous cache, so updated channel must be stored back
+        channel = await cache.get('channels', message.channel_id, ctx)
+        if isinstance(channel, (DMChannel, GroupChannel, TextChannel)):
+            channel.last_message_id = message.id
+            await cache.store('channels', channel, ctx)
+
+        read_state = await cache.get('read_states', message.channel_id, ctx)
+        if read_state:
+            flags = message.flags
+            mentioned = read_state.user_id in message.mention_ids or flags.mention_everyone or flags.mention_online
+
+            role_mention_ids = message.role_mention_ids
+            if not mentioned and role_mention_ids and isinstance(channel, BaseServerChannel):
+                me = await cache.get('server_members', (channel.server_id, read_state.user_id), ctx)
+                if me is not None:
+                    mentioned = any(role_id in role_mention_ids for role_id in me.roles)
+
+            if mentioned and message.id not in read_state.mentioned_in:
+                read_state.mentioned_in.append(message.id)
+                await cache.store('read_states', read_state, ctx)
+
+        await cache.store('messages', message, ctx)
+
+        return True
+
     def call_object_handlers_hook(self, client: Client, /) -> utils.MaybeAwaitable[None]:
         if hasattr(client, 'on_message'):
             return client.on_message(self.message)
@@ -744,7 +1029,10 @@ class MessageUpdateEvent(ShardEvent):
     """:class:`.PartialMessage`: The fields that were updated."""
 
     before: typing.Optional[Message] = field(repr=True, kw_only=True)
-    """Optional[:class:`.Message`]: The message as it was before being updated, if available."""
+    """Optional[:class:`.Message`]: The message as it was before being updated, if available.
+    
+    This is always ``None`` if event is in :attr:`.State.skip_before_snapshot_in`.
+    """
 
     after: typing.Optional[Message] = field(repr=True, kw_only=True)
     """Optional[:class:`.Message`]: The message as it was updated, if available."""
@@ -769,18 +1057,22 @@ class MessageUpdateEvent(ShardEvent):
     )
     """Union[:class:`.UndefinedCacheContext`, :class:`.MessageUpdateEventCacheContext`]: The cache context used."""
 
+    def _update(self, before: typing.Optional[Message], /) -> None:
+        if not before:
+            return
+        self.before, after = self._snapshot(before)
+        after.locally_update(self.message)
+        self.after = after
+
     def before_dispatch(self) -> None:
         cache = self.shard.state.cache
 
         if not cache:
             return
-        before = cache.get_message(self.message.channel_id, self.message.id, self.cache_context)
-        if not before:
-            return
-        self.before = before
-        after = copy(before)
-        after.locally_update(self.message)
-        self.after = after
+        self._update(cache.get_message(self.message.channel_id, self.message.id, self.cache_context))
+
+    async def _abefore_dispatch(self, cache: caching.AsyncCache, /) -> None:
+        self._update(await cache.get('messages', (self.message.channel_id, self.message.id), self.cache_context))
 
     def process(self) -> bool:
         cache = self.shard.state.cache
@@ -790,6 +1082,12 @@ class MessageUpdateEvent(ShardEvent):
         cache.store_message(self.after, self.cache_context)
         return True
 
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        if not self.after:
+            return False
+        await cache.store('messages', self.after, self.cache_context)
+        return True
+
 
 @define(slots=True)
 class MessageAppendEvent(ShardEvent):
@@ -830,6 +1128,9 @@ class MessageAppendEvent(ShardEvent):
             return
         self.message = cache.get_message(self.data.channel_id, self.data.id, self.cache_context)
 
+    async def _abefore_dispatch(self, cache: caching.AsyncCache, /) -> None:
+        self.message = await cache.get('messages', (self.data.channel_id, self.data.id), self.cache_context)
+
     def process(self) -> bool:
         cache = self.shard.state.cache
 
@@ -840,6 +1141,14 @@ class MessageAppendEvent(ShardEvent):
         cache.store_message(self.message, self.cache_context)
         return True
 
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        if not self.message:
+            return False
+
+        self.message.locally_append(self.data)
+        await cache.store('messages', self.message, self.cache_context)
+        return True
+
 
 @define(slots=True)
 class MessageDeleteEvent(ShardEvent):
@@ -883,6 +1192,9 @@ class MessageDeleteEvent(ShardEvent):
             return
         self.message = cache.get_message(self.channel_id, self.message_id, self.cache_context)
 
+    async def _abefore_dispatch(self, cache: caching.AsyncCache, /) -> None:
+        self.message = await cache.get('messages', (self.channel_id, self.message_id), self.cache_context)
+
     def process(self) -> bool:
         cache = self.shard.state.cache
 
@@ -891,6 +1203,10 @@ class MessageDeleteEvent(ShardEvent):
         cache.delete_message(self.channel_id, self.message_id, self.cache_context)
         return True
 
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        await cache.delete('messages', (self.channel_id, self.message_id), self.cache_context)
+        return True
+
 
 @define(slots=True)
 class MessageReactEvent(ShardEvent):
@@ -940,6 +1256,9 @@ class MessageReactEvent(ShardEvent):
             return
         self.message = cache.get_message(self.channel_id, self.message_id, self.cache_context)
 
+    async def _abefore_dispatch(self, cache: caching.AsyncCache, /) -> None:
+        self.message = await cache.get('messages', (self.channel_id, self.message_id), self.cache_context)
+
     def process(self) -> bool:
         cache = self.shard.state.cache
 
@@ -949,6 +1268,13 @@ class MessageReactEvent(ShardEvent):
         cache.store_message(self.message, self.cache_context)
         return True
 
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        if not self.message:
+            return False
+        self.message.locally_react(self.user_id, self.emoji)
+        await cache.store('messages', self.message, self.cache_context)
+        return True
+
 
 @define(slots=True)
 class MessageUnreactEvent(ShardEvent):
@@ -998,6 +1324,9 @@ class MessageUnreactEvent(ShardEvent):
             return
         self.message = cache.get_message(self.channel_id, self.message_id, self.cache_context)
 
+    async def _abefore_dispatch(self, cache: caching.AsyncCache, /) -> None:
+        self.message = await cache.get('messages', (self.channel_id, self.message_id), self.cache_context)
+
     def process(self) -> bool:
         cache = self.shard.state.cache
 
@@ -1007,6 +1336,13 @@ class MessageUnreactEvent(ShardEvent):
         cache.store_message(self.message, self.cache_context)
         return True
 
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        if not self.message:
+            return False
+        self.message.locally_unreact(self.user_id, self.emoji)
+        await cache.store('messages', self.message, self.cache_context)
+        return True
+
 
 @define(slots=True)
 class MessageClearReactionEvent(ShardEvent):
@@ -1053,6 +1389,9 @@ class MessageClearReactionEvent(ShardEvent):
             return
         self.message = cache.get_message(self.channel_id, self.message_id, self.cache_context)
 
+    async def _abefore_dispatch(self, cache: caching.AsyncCache, /) -> None:
+        self.message = await cache.get('messages', (self.channel_id, self.message_id), self.cache_context)
+
     def process(self) -> bool:
         cache = self.shard.state.cache
 
@@ -1062,6 +1401,13 @@ class MessageClearReactionEvent(ShardEvent):
         cache.store_message(self.message, self.cache_context)
         return True
 
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        if not self.message:
+            return False
+        self.message.locally_clear_reactions(self.emoji)
+        await cache.store('messages', self.message, self.cache_context)
+        return True
+
 
 @define(slots=True)
 class MessageDeleteBulkEvent(ShardEvent):
@@ -1113,6 +1459,12 @@ class MessageDeleteBulkEvent(ShardEvent):
             if message:
                 self.messages.append(message)
 
+    async def _abefore_dispatch(self, cache: caching.AsyncCache, /) -> None:
+        keys = [(self.channel_id, message_id) for message_id in self.message_ids]
+        for message in await cache.get_many('messages', keys, self.cache_context):
+            if message:
+                self.messages.append(message)
+
     def process(self) -> bool:
         cache = self.shard.state.cache
 
@@ -1124,6 +1476,12 @@ class MessageDeleteBulkEvent(ShardEvent):
 
         return True
 
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        keys = [(self.channel_id, message_id) for message_id in self.message_ids]
+        await cache.delete_many('messages', keys, self.cache_context)
+
+        return True
+
 
 @define(slots=True)
 class ServerCreateEvent(ShardEvent):
@@ -1143,6 +1501,16 @@ class ServerCreateEvent(ShardEvent):
     voice_states: list[ChannelVoiceStateContainer] = field(repr=True, kw_only=True)
     """List[:class:`.ChannelVoiceStateContainer`]: The voice states of the text/voice channels in the server."""
 
+    def _get_cache_context(self) -> typing.Union[caching.UndefinedCacheContext, caching.ServerCreateEventCacheContext]:
+        return (
+            caching.ServerCreateEventCacheContext(
+                type=caching.CacheContextType.server_create_event,
+                event=self,
+            )
+            if 'ServerCreateEvent' in self.shard.state.provide_cache_context_in
+            else caching._SERVER_CREATE_EVENT
+        )
+
     def process(self) -> bool:
         state = self.shard.state
         cache = state.cache
@@ -1150,35 +1518,15 @@ class ServerCreateEvent(ShardEvent):
         if not cache:
             return False
 
-        ctx = (
-            caching.ServerCreateEventCacheContext(
-                type=caching.CacheContextType.server_create_event,
-                event=self,
-            )
-            if 'ServerCreateEvent' in state.provide_cache_context_in
-            else caching._SERVER_CREATE_EVENT
-        )
+        ctx = self._get_cache_context()
 
         for channel in self.server.prepare_cached():
             cache.store_channel(channel, ctx)
         cache.store_server(self.server, ctx)
 
-        if state.me:
-            cache.store_server_member(
-                Member(
-                    state=state,
-                    server_id=self.server.id,
-                    _user=state.me.id,
-                    joined_at=self.joined_at,
-                    nick=None,
-                    internal_server_avatar=None,
-                    roles=[],
-                    timed_out_until=None,
-                    can_publish=True,
-                    can_receive=True,
-                ),
-                ctx,
-            )
+        me = self._create_own_member()
+        if me is not None:
+            cache.store_server_member(me, ctx)
 
         for emoji in self.emojis:
             cache.store_emoji(emoji, ctx)
@@ -1187,6 +1535,39 @@ class ServerCreateEvent(ShardEvent):
 
         return True
 
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        ctx = self._get_cache_context()
+
+        await cache.store_many('channels', self.server.prepare_cached(), ctx)
+        await cache.store('servers', self.server, ctx)
+
+        me = self._create_own_member()
+        if me is not None:
+            await cache.store('server_members', me, ctx)
+
+        await cache.store_many('emojis', self.emojis, ctx)
+        await cache.store_many('channel_voice_states', self.voice_states, ctx)
+
+        return True
+
+    def _create_own_member(self) -> typing.Optional[Member]:
+        state = self.shard.state
+        if not state.me:
+            return None
+
+        return Member(
+            state=state,
+            server_id=self.server.id,
+            _user=state.me.id,
+            joined_at=self.joined_at,
+            nick=None,
+            internal_server_avatar=None,
+            roles=[],
+            timed_out_until=None,
+            can_publish=True,
+            can_receive=True,
+        )
+
 
 @define(slots=True)
 class ServerEmojiCreateEvent(ShardEvent):
@@ -1197,25 +1578,37 @@ class ServerEmojiCreateEvent(ShardEvent):
     emoji: ServerEmoji = field(repr=True, kw_only=True)
     """:class:`.ServerEmoji`: The created emoji."""
 
-    def process(self) -> bool:
-        state = self.shard.state
-        cache = state.cache
-
-        if not cache:
-            return False
+    def invalidate_responses(self, cache: ResponseCache, /) -> None:
+        cache.invalidate(routes.SERVERS_EMOJI_LIST.compile(server_id=self.emoji.server_id).build())
 
-        ctx = (
+    def _get_cache_context(
+        self,
+    ) -> typing.Union[caching.UndefinedCacheContext, caching.ServerEmojiCreateEventCacheContext]:
+        return (
             caching.ServerEmojiCreateEventCacheContext(
                 type=caching.CacheContextType.server_emoji_create_event,
                 event=self,
             )
-            if 'ServerEmojiCreateEvent' in state.provide_cache_context_in
+            if 'ServerEmojiCreateEvent' in self.shard.state.provide_cache_context_in
             else caching._SERVER_EMOJI_CREATE_EVENT
         )
 
+    def process(self) -> bool:
+        state = self.shard.state
+        cache = state.cache
+
+        if not cache:
+            return False
+
+        ctx = self._get_cache_context()
+
         cache.store_emoji(self.emoji, ctx)
         return True
 
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        await cache.store('emojis', self.emoji, self._get_cache_context())
+        return True
+
 
 @define(slots=True)
 class ServerEmojiDeleteEvent(ShardEvent):
@@ -1252,12 +1645,23 @@ class ServerEmojiDeleteEvent(ShardEvent):
     )
     """Union[:class:`.UndefinedCacheContext`, :class:`.ServerEmojiDeleteEventCacheContext`]: The cache context used."""
 
+    def invalidate_responses(self, cache: ResponseCache, /) -> None:
+        if self.server_id is None:
+            cache.invalidate_route(routes.SERVERS_EMOJI_LIST)
+        else:
+            cache.invalidate(routes.SERVERS_EMOJI_LIST.compile(server_id=self.server_id).build())
+
     def before_dispatch(self) -> None:
         cache = self.shard.state.cache
         if not cache:
             return
 
-        emoji = cache.get_emoji(self.emoji_id, self.cache_context)
+        self._found(cache.get_emoji(self.emoji_id, self.cache_context))
+
+    async def _abefore_dispatch(self, cache: caching.AsyncCache, /) -> None:
+        self._found(await cache.get('emojis', self.emoji_id, self.cache_context))
+
+    def _found(self, emoji: typing.Optional[Emoji], /) -> None:
         if isinstance(emoji, ServerEmoji):
             self.emoji = emoji
             self.server_id = emoji.server_id
@@ -1269,6 +1673,10 @@ class ServerEmojiDeleteEvent(ShardEvent):
         cache.delete_emoji(self.emoji_id, self.server_id, self.cache_context)
         return True
 
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        await cache.delete('emojis', self.emoji_id, self.cache_context)
+        return True
+
 
 @define(slots=True)
 class ServerUpdateEvent(ShardEvent):
@@ -1280,7 +1688,10 @@ class ServerUpdateEvent(ShardEvent):
     """:class:`.PartialServer`: The fields that were updated."""
 
     before: typing.Optional[Server] = field(repr=True, kw_only=True)
-    """Optional[:class:`.Server`]: The server as it was before being updated, if available."""
+    """Optional[:class:`.Server`]: The server as it was before being updated, if available.
+    
+    This is always ``None`` if event is in :attr:`.State.skip_before_snapshot_in`.
+    """
 
     after: typing.Optional[Server] = field(repr=True, kw_only=True)
     """Optional[:class:`.Server`]: The server as it was updated, if available."""
@@ -1305,19 +1716,24 @@ class ServerUpdateEvent(ShardEvent):
     )
     """Union[:class:`.UndefinedCacheContext`, :class:`.ServerUpdateEventCacheContext`]: The cache context used."""
 
-    def before_dispatch(self) -> None:
-        cache = self.shard.state.cache
-        if not cache:
-            return
-        before = cache.get_server(self.server.id, self.cache_context)
-        self.before = before
+    def _update(self, before: typing.Optional[Server], /) -> None:
         if not before:
+            self.before = before
             return
 
-        after = copy(before)
+        self.before, after = self._snapshot(before)
         after.locally_update(self.server)
         self.after = after
 
+    def before_dispatch(self) -> None:
+        cache = self.shard.state.cache
+        if not cache:
+            return
+        self._update(cache.get_server(self.server.id, self.cache_context))
+
+    async def _abefore_dispatch(self, cache: caching.AsyncCache, /) -> None:
+        self._update(await cache.get('servers', self.server.id, self.cache_context))
+
     def process(self) -> bool:
         cache = self.shard.state.cache
         if not cache or not self.after:
@@ -1325,6 +1741,12 @@ class ServerUpdateEvent(ShardEvent):
         cache.store_server(self.after, self.cache_context)
         return True
 
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        if not self.after:
+            return False
+        await cache.store('servers', self.after, self.cache_context)
+        return True
+
 
 @define(slots=True)
 class ServerDeleteEvent(ShardEvent):
@@ -1358,27 +1780,29 @@ class ServerDeleteEvent(ShardEvent):
     )
     """Union[:class:`.UndefinedCacheContext`, :class:`.ServerDeleteEventCacheContext`]: The cache context used."""
 
+    def invalidate_responses(self, cache: ResponseCache, /) -> None:
+        cache.invalidate(routes.SERVERS_BAN_LIST.compile(server_id=self.server_id).build())
+        cache.invalidate(routes.SERVERS_EMOJI_LIST.compile(server_id=self.server_id).build())
+
     def before_dispatch(self) -> None:
         cache = self.shard.state.cache
         if not cache:
             return
         self.server = cache.get_server(self.server_id, self.cache_context)
 
+    async def _abefore_dispatch(self, cache: caching.AsyncCache, /) -> None:
+        self.server = await cache.get('servers', self.server_id, self.cache_context)
+
     def process(self) -> bool:
         cache = self.shard.state.cache
         if not cache:
             return False
 
-        cache.delete_server_emojis_of(self.server_id, self.cache_context)
-        cache.delete_server_members_of(self.server_id, self.cache_context)
-        cache.delete_server(self.server_id, self.cache_context)
-
-        if self.server is not None:
-            for channel_id in self.server.internal_channels[1]:
-                assert isinstance(channel_id, str)
-                cache.delete_read_state(channel_id, self.cache_context)
-                cache.delete_channel_voice_state(channel_id, self.cache_context)
+        _purge_server(cache, self.server_id, self.server, self.cache_context)
+        return True
 
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        await cache.purge_server(self.server_id, self.cache_context)
         return True
 
 
@@ -1391,6 +1815,18 @@ class ServerMemberJoinEvent(ShardEvent):
     member: Member = field(repr=True, kw_only=True)
     """:class:`.Member`: The joined member."""
 
+    def _get_cache_context(
+        self,
+    ) -> typing.Union[caching.UndefinedCacheContext, caching.ServerMemberJoinEventCacheContext]:
+        return (
+            caching.ServerMemberJoinEventCacheContext(
+                type=caching.CacheContextType.server_member_join_event,
+                event=self,
+            )
+            if 'ServerMemberJoinEvent' in self.shard.state.provide_cache_context_in
+            else caching._SERVER_MEMBER_JOIN_EVENT
+        )
+
     def process(self) -> bool:
         state = self.shard.state
         cache = state.cache
@@ -1398,18 +1834,15 @@ class ServerMemberJoinEvent(ShardEvent):
         if not cache:
             return False
 
-        ctx = (
-            caching.ServerMemberJoinEventCacheContext(
-                type=caching.CacheContextType.server_member_join_event,
-                event=self,
-            )
-            if 'ServerMemberJoinEvent' in state.provide_cache_context_in
-            else caching._SERVER_MEMBER_JOIN_EVENT
-        )
+        ctx = self._get_cache_context()
 
         cache.store_server_member(self.member, ctx)
         return True
 
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        await cache.store('server_members', self.member, self._get_cache_context())
+        return True
+
 
 @define(slots=True)
 class ServerMemberUpdateEvent(ShardEvent):
@@ -1421,7 +1854,10 @@ class ServerMemberUpdateEvent(ShardEvent):
     """:class:`.PartialMember`: The fields that were updated."""
 
     before: typing.Optional[Member] = field(repr=True, kw_only=True)
-    """Optional[:class:`.Member`]: The member as it was before being updated, if available."""
+    """Optional[:class:`.Member`]: The member as it was before being updated, if available.
+    
+    This is always ``None`` if event is in :attr:`.State.skip_before_snapshot_in`.
+    """
 
     after: typing.Optional[Member] = field(repr=True, kw_only=True)
     """Optional[:class:`.Member`]: The member as it was updated, if available."""
@@ -1446,19 +1882,24 @@ class ServerMemberUpdateEvent(ShardEvent):
     )
     """Union[:class:`.UndefinedCacheContext`, :class:`.ServerMemberUpdateEventCacheContext`]: The cache context used."""
 
-    def before_dispatch(self) -> None:
-        cache = self.shard.state.cache
-        if not cache:
-            return
-        before = cache.get_server_member(self.member.server_id, self.member.id, self.cache_context)
-        self.before = before
+    def _update(self, before: typing.Optional[Member], /) -> None:
         if not before:
+            self.before = before
             return
 
-        after = copy(before)
+        self.before, after = self._snapshot(before)
         after.locally_update(self.member)
         self.after = after
 
+    def before_dispatch(self) -> None:
+        cache = self.shard.state.cache
+        if not cache:
+            return
+        self._update(cache.get_server_member(self.member.server_id, self.member.id, self.cache_context))
+
+    async def _abefore_dispatch(self, cache: caching.AsyncCache, /) -> None:
+        self._update(await cache.get('server_members', (self.member.server_id, self.member.id), self.cache_context))
+
     def process(self) -> bool:
         cache = self.shard.state.cache
         if not cache or not self.after:
@@ -1466,6 +1907,12 @@ class ServerMemberUpdateEvent(ShardEvent):
         cache.store_server_member(self.after, self.cache_context)
         return True
 
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        if not self.after:
+            return False
+        await cache.store('server_members', self.after, self.cache_context)
+        return True
+
 
 @define(slots=True)
 class ServerMemberRemoveEvent(ShardEvent):
@@ -1505,12 +1952,19 @@ class ServerMemberRemoveEvent(ShardEvent):
     )
     """Union[:class:`.UndefinedCacheContext`, :class:`.ServerMemberRemoveEventCacheContext`]: The cache context used."""
 
+    def invalidate_responses(self, cache: ResponseCache, /) -> None:
+        if self.reason is MemberRemovalIntention.ban:
+            cache.invalidate(routes.SERVERS_BAN_LIST.compile(server_id=self.server_id).build())
+
     def before_dispatch(self) -> None:
         cache = self.shard.state.cache
         if not cache:
             return
         self.member = cache.get_server_member(self.server_id, self.user_id, self.cache_context)
 
+    async def _abefore_dispatch(self, cache: caching.AsyncCache, /) -> None:
+        self.member = await cache.get('server_members', (self.server_id, self.user_id), self.cache_context)
+
     def process(self) -> bool:
         state = self.shard.state
         cache = state.cache
@@ -1522,14 +1976,19 @@ class ServerMemberRemoveEvent(ShardEvent):
 
         cache.delete_server_member(self.server_id, self.user_id, self.cache_context)
         if is_me:
-            cache.delete_server_emojis_of(self.server_id, self.cache_context)
-            cache.delete_server_members_of(self.server_id, self.cache_context)
-            server = cache.delete_server(self.server_id, self.cache_context)
+            server = cache.get_server(self.server_id, self.cache_context)
+            _purge_server(cache, self.server_id, server, self.cache_context)
 
-            if server is not None:
-                for channel_id in server.internal_channels[1]:
-                    assert isinstance(channel_id, str)
-                    cache.delete_channel_voice_state(channel_id, self.cache_context)
+        return True
+
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        state = self.shard.state
+
+        me = state.me
+
+        await cache.delete('server_members', (self.server_id, self.user_id), self.cache_context)
+        if me and me.id == self.user_id:
+            await cache.purge_server(self.server_id, self.cache_context)
 
         return True
 
@@ -1544,7 +2003,10 @@ class RawServerRoleUpdateEvent(ShardEvent):
     """:class:`.PartialRole`: The fields that got updated."""
 
     old_role: typing.Optional[Role] = field(repr=True, kw_only=True)
-    """Optional[:class:`.Role`]: The role as it was before being updated, if available."""
+    """Optional[:class:`.Role`]: The role as it was before being updated, if available.
+    
+    This is always ``None`` if event is in :attr:`.State.skip_before_snapshot_in`.
+    """
 
     new_role: typing.Optional[Role] = field(repr=True, kw_only=True)
     """Optional[:class:`.Role`]: The role as it was created or updated, if available."""
@@ -1572,6 +2034,11 @@ class RawServerRoleUpdateEvent(ShardEvent):
     )
     """Union[:class:`.UndefinedCacheContext`, :class:`.RawServerRoleUpdateEventCacheContext`]: The cache context used."""
 
+    def invalidate_responses(self, cache: ResponseCache, /) -> None:
+        cache.invalidate(
+            routes.SERVERS_ROLES_FETCH.compile(server_id=self.role.server_id, role_id=self.role.id).build()
+        )
+
     def before_dispatch(self) -> None:
         self.new_role = self.role.into_full()
 
@@ -1579,14 +2046,20 @@ class RawServerRoleUpdateEvent(ShardEvent):
         if not cache:
             return
 
-        self.server = cache.get_server(self.role.server_id, self.cache_context)
+        self._update(cache.get_server(self.role.server_id, self.cache_context))
 
-        if self.server is None:
+    async def _abefore_dispatch(self, cache: caching.AsyncCache, /) -> None:
+        self._update(await cache.get('servers', self.role.server_id, self.cache_context))
+
+    def _update(self, server: typing.Optional[Server], /) -> None:
+        self.server = server
+
+        if server is None:
             return
 
-        old = self.old_role = self.server.roles.get(self.role.id)
+        old = self.old_role = server.roles.get(self.role.id)
         if old is not None:
-            new = copy(old)
+            self.old_role, new = self._snapshot(old)
             new.locally_update(self.role)
             self.new_role = new
 
@@ -1599,6 +2072,14 @@ class RawServerRoleUpdateEvent(ShardEvent):
         cache.store_server(self.server, self.cache_context)
         return True
 
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        if self.server is None:
+            return False
+
+        self.server.upsert_role(self.new_role or self.role)
+        await cache.store('servers', self.server, self.cache_context)
+        return True
+
 
 @define(slots=True)
 class ServerRoleDeleteEvent(ShardEvent):
@@ -1638,6 +2119,9 @@ class ServerRoleDeleteEvent(ShardEvent):
     )
     """Union[:class:`.UndefinedCacheContext`, :class:`.ServerRoleDeleteEventCacheContext`]: The cache context used."""
 
+    def invalidate_responses(self, cache: ResponseCache, /) -> None:
+        cache.invalidate(routes.SERVERS_ROLES_FETCH.compile(server_id=self.server_id, role_id=self.role_id).build())
+
     def before_dispatch(self) -> None:
         cache = self.shard.state.cache
         if not cache:
@@ -1646,6 +2130,11 @@ class ServerRoleDeleteEvent(ShardEvent):
         if self.server:
             self.role = self.server.roles.get(self.role_id)
 
+    async def _abefore_dispatch(self, cache: caching.AsyncCache, /) -> None:
+        self.server = await cache.get('servers', self.server_id, self.cache_context)
+        if self.server:
+            self.role = self.server.roles.get(self.role_id)
+
     def process(self) -> bool:
         cache = self.shard.state.cache
         if not cache or not self.server:
@@ -1656,6 +2145,15 @@ class ServerRoleDeleteEvent(ShardEvent):
         cache.store_server(self.server, self.cache_context)
         return True
 
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        if not self.server:
+            return False
+
+        self.server.roles.pop(self.role_id, None)
+
+        await cache.store('servers', self.server, self.cache_context)
+        return True
+
 
 @define(slots=True)
 class ReportCreateEvent(ShardEvent):
@@ -1681,7 +2179,10 @@ class UserUpdateEvent(ShardEvent):
     """:class:`.PartialUser`: The fields that were updated."""
 
     before: typing.Optional[User] = field(repr=True, kw_only=True)
-    """:class:`.User`: The user as it was before being updated, if available."""
+    """:class:`.User`: The user as it was before being updated, if available.
+    
+    This is always ``None`` if event is in :attr:`.State.skip_before_snapshot_in`.
+    """
 
     after: typing.Optional[User] = field(repr=True, kw_only=True)
     """:class:`.User`: The user as it was updated, if available."""
@@ -1706,19 +2207,24 @@ class UserUpdateEvent(ShardEvent):
     )
     """Union[:class:`.UndefinedCacheContext`, :class:`.UserUpdateEventCacheContext`]: The cache context used."""
 
-    def before_dispatch(self) -> None:
-        cache = self.shard.state.cache
-        if not cache:
-            return
-        before = cache.get_user(self.user.id, self.cache_context)
-        self.before = before
+    def _update(self, before: typing.Optional[User], /) -> None:
         if not before:
+            self.before = before
             return
 
-        after = copy(before)
+        self.before, after = self._snapshot(before)
         after.locally_update(self.user)
         self.after = after
 
+    def before_dispatch(self) -> None:
+        cache = self.shard.state.cache
+        if not cache:
+            return
+        self._update(cache.get_user(self.user.id, self.cache_context))
+
+    async def _abefore_dispatch(self, cache: caching.AsyncCache, /) -> None:
+        self._update(await cache.get('users', self.user.id, self.cache_context))
+
     def process(self) -> bool:
         cache = self.shard.state.cache
         if not cache or not self.after:
@@ -1726,6 +2232,12 @@ class UserUpdateEvent(ShardEvent):
         cache.store_user(self.after, self.cache_context)
         return True
 
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        if not self.after:
+            return False
+        await cache.store('users', self.after, self.cache_context)
+        return True
+
 
 @define(slots=True)
 class UserRelationshipUpdateEvent(ShardEvent):
@@ -1774,10 +2286,16 @@ class UserRelationshipUpdateEvent(ShardEvent):
         cache = self.shard.state.cache
         if not cache:
             return
-        self.old_user = cache.get_user(self.new_user.id, self.cache_context)
+        self._update(cache.get_user(self.new_user.id, self.cache_context))
+
+    async def _abefore_dispatch(self, cache: caching.AsyncCache, /) -> None:
+        self._update(await cache.get('users', self.new_user.id, self.cache_context))
 
-        if self.old_user:
-            self.before = self.old_user.relationship
+    def _update(self, old_user: typing.Optional[User], /) -> None:
+        self.old_user = old_user
+
+        if old_user:
+            self.before = old_user.relationship
 
     def process(self) -> bool:
         me = self.shard.state.me
@@ -1801,6 +2319,10 @@ class UserRelationshipUpdateEvent(ShardEvent):
         cache.store_user(self.new_user, self.cache_context)
         return True
 
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        await cache.store('users', self.new_user, self.cache_context)
+        return True
+
 
 @define(slots=True)
 class UserSettingsUpdateEvent(ShardEvent):
@@ -1854,7 +2376,10 @@ class UserPlatformWipeEvent(ShardEvent):
     """:class:`int`: The user's flags raw value, explaining reason of the wipe."""
 
     before: typing.Optional[User] = field(repr=True, kw_only=True)
-    """Optional[:class:`.User`]: The user as it would exist before, if available."""
+    """Optional[:class:`.User`]: The user as it would exist before, if available.
+    
+    This is always ``None`` if event is in :attr:`.State.skip_before_snapshot_in`.
+    """
 
     after: typing.Optional[User] = field(repr=True, kw_only=True)
     """Optional[:class:`.User`]: The wiped user, if available."""
@@ -1891,11 +2416,16 @@ class UserPlatformWipeEvent(ShardEvent):
         if not cache:
             return
 
-        self.before = cache.get_user(self.user_id, self.cache_context)
+        self._update(cache.get_user(self.user_id, self.cache_context))
+
+    async def _abefore_dispatch(self, cache: caching.AsyncCache, /) -> None:
+        self._update(await cache.get('users', self.user_id, self.cache_context))
+
+    def _update(self, before: typing.Optional[User], /) -> None:
+        self.before = before
 
-        before = self.before
         if before is not None:
-            after = copy(before)
+            self.before, after = self._snapshot(before)
             after.name = 'Removed User'
             after.display_name = None
             after.internal_avatar = None
@@ -1906,9 +2436,18 @@ class UserPlatformWipeEvent(ShardEvent):
 
     def process(self) -> bool:
         cache = self.shard.state.cache
-        if not cache or not self.after:
+        if not cache:
             return False
-        cache.store_user(self.after, self.cache_context)
+
+        cache.delete_messages_by_author(self.user_id, self.cache_context)
+        if self.after is not None:
+            cache.store_user(self.after, self.cache_context)
+        return True
+
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        await cache.delete_messages_by_author(self.user_id, self.cache_context)
+        if self.after is not None:
+            await cache.store('users', self.after, self.cache_context)
         return True
 
 
@@ -2007,6 +2546,18 @@ class VoiceChannelJoinEvent(ShardEvent):
     state: UserVoiceState = field(repr=True, kw_only=True)
     """:class:`.UserVoiceState`: The user's voice state."""
 
+    def _get_cache_context(
+        self,
+    ) -> typing.Union[caching.UndefinedCacheContext, caching.VoiceChannelJoinEventCacheContext]:
+        return (
+            caching.VoiceChannelJoinEventCacheContext(
+                type=caching.CacheContextType.voice_channel_join_event,
+                event=self,
+            )
+            if 'VoiceChannelJoinEvent' in self.shard.state.provide_cache_context_in
+            else caching._VOICE_CHANNEL_JOIN_EVENT
+        )
+
     def process(self) -> bool:
         state = self.shard.state
         cache = state.cache
@@ -2014,27 +2565,30 @@ class VoiceChannelJoinEvent(ShardEvent):
         if not cache:
             return False
 
-        ctx = (
-            caching.VoiceChannelJoinEventCacheContext(
-                type=caching.CacheContextType.voice_channel_join_event,
-                event=self,
-            )
-            if 'VoiceChannelJoinEvent' in state.provide_cache_context_in
-            else caching._VOICE_CHANNEL_JOIN_EVENT
-        )
+        ctx = self._get_cache_context()
 
-        cs = cache.get_channel_voice_state(self.channel_id, ctx)
-        if cs is not None:
-            cs.locally_add(self.state)
-        else:
-            cs = ChannelVoiceStateContainer(
-                channel_id=self.channel_id,
-                participants={self.state.user_id: self.state},
-            )
+        cs = self._join(cache.get_channel_voice_state(self.channel_id, ctx))
         cache.store_channel_voice_state(cs, ctx)
 
         return True
 
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        ctx = self._get_cache_context()
+
+        cs = self._join(await cache.get('channel_voice_states', self.channel_id, ctx))
+        await cache.store('channel_voice_states', cs, ctx)
+
+        return True
+
+    def _join(self, cs: typing.Optional[ChannelVoiceStateContainer], /) -> ChannelVoiceStateContainer:
+        if cs is not None:
+            cs.locally_add(self.state)
+            return cs
+        return ChannelVoiceStateContainer(
+            channel_id=self.channel_id,
+            participants={self.state.user_id: self.state},
+        )
+
 
 @define(slots=True)
 class VoiceChannelLeaveEvent(ShardEvent):
@@ -2078,11 +2632,17 @@ class VoiceChannelLeaveEvent(ShardEvent):
         cache = self.shard.state.cache
         if not cache:
             return
-        self.container = cache.get_channel_voice_state(self.channel_id, self.cache_context)
+        self._update(cache.get_channel_voice_state(self.channel_id, self.cache_context))
 
-        if self.container is None:
+    async def _abefore_dispatch(self, cache: caching.AsyncCache, /) -> None:
+        self._update(await cache.get('channel_voice_states', self.channel_id, self.cache_context))
+
+    def _update(self, container: typing.Optional[ChannelVoiceStateContainer], /) -> None:
+        self.container = container
+
+        if container is None:
             return
-        self.state = self.container.participants.get(self.user_id)
+        self.state = container.participants.get(self.user_id)
 
     def process(self) -> bool:
         cache = self.shard.state.cache
@@ -2095,6 +2655,16 @@ class VoiceChannelLeaveEvent(ShardEvent):
 
         return True
 
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        if not self.container:
+            return False
+
+        container = self.container
+        container.locally_remove(self.user_id)
+        await cache.store('channel_voice_states', container, self.cache_context)
+
+        return True
+
 
 @define(slots=True)
 class VoiceChannelMoveEvent(ShardEvent):
@@ -2146,35 +2716,51 @@ class VoiceChannelMoveEvent(ShardEvent):
         self.old_container = cache.get_channel_voice_state(self.from_, self.cache_context)
         self.new_container = cache.get_channel_voice_state(self.to, self.cache_context)
 
-    def process(self) -> bool:
-        cache = self.shard.state.cache
+    async def _abefore_dispatch(self, cache: caching.AsyncCache, /) -> None:
+        self.old_container, self.new_container = await cache.get_many(
+            'channel_voice_states', (self.from_, self.to), self.cache_context
+        )
 
-        if cache is None or self.old_container is None:
+    def _move(self) -> bool:
+        if self.old_container is None:
             return False
 
-        if self.new_container is None:
-            state = self.old_container.locally_remove(self.user_id)
-            if state is None:
-                # If we somehow get here then something went wrong
-                return False
+        state = self.old_container.locally_remove(self.user_id)
+        if state is None:
+            # If we somehow get here then something went wrong
+            return False
 
-            container = ChannelVoiceStateContainer(
+        if self.new_container is None:
+            self.new_container = ChannelVoiceStateContainer(
                 channel_id=self.to,
                 participants={self.user_id: state},
             )
-            cache.store_channel_voice_state(container, self.cache_context)
-            self.new_container = container
         else:
-            state = self.old_container.locally_remove(self.user_id)
-            if state is None:
-                # ditto
-                return False
-
             self.new_container.locally_add(state)
-            cache.store_channel_voice_state(self.new_container, self.cache_context)
 
         return True
 
+    def process(self) -> bool:
+        cache = self.shard.state.cache
+
+        if cache is None or not self._move():
+            return False
+
+        cache.store_channel_voice_state(self.new_container, self.cache_context)  # type: ignore
+        return True
+
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        if not self._move():
+            return False
+
+        # Old container is not shared with asynchronous cache, so it must be stored too
+        await cache.store_many(
+            'channel_voice_states',
+            (self.old_container, self.new_container),
+            self.cache_context,
+        )
+        return True
+
 
 @define(slots=True)
 class UserVoiceStateUpdateEvent(ShardEvent):
@@ -2192,7 +2778,10 @@ class UserVoiceStateUpdateEvent(ShardEvent):
     """:class:`.PartialUserVoiceState`: The fields that were updated."""
 
     before: typing.Optional[UserVoiceState] = field(repr=True, kw_only=True)
-    """Optional[:class:`.UserVoiceState`]: The user's voice state as it was before being updated, if available."""
+    """Optional[:class:`.UserVoiceState`]: The user's voice state as it was before being updated, if available.
+    
+    This is always ``None`` if event is in :attr:`.State.skip_before_snapshot_in`.
+    """
 
     after: typing.Optional[UserVoiceState] = field(repr=True, kw_only=True)
     """Optional[:class:`.UserVoiceState`]: The user's voice state as it was updated, if available."""
@@ -2223,7 +2812,12 @@ class UserVoiceStateUpdateEvent(ShardEvent):
         if not cache:
             return
 
-        container = cache.get_channel_voice_state(self.channel_id, self.cache_context)
+        self._update(cache.get_channel_voice_state(self.channel_id, self.cache_context))
+
+    async def _abefore_dispatch(self, cache: caching.AsyncCache, /) -> None:
+        self._update(await cache.get('channel_voice_states', self.channel_id, self.cache_context))
+
+    def _update(self, container: typing.Optional[ChannelVoiceStateContainer], /) -> None:
         if not container:
             return
 
@@ -2233,7 +2827,7 @@ class UserVoiceStateUpdateEvent(ShardEvent):
         self.before = before
 
         if before:
-            after = copy(before)
+            self.before, after = self._snapshot(before)
             after.locally_update(self.state)
             self.after = after
 
@@ -2246,6 +2840,13 @@ class UserVoiceStateUpdateEvent(ShardEvent):
         cache.store_channel_voice_state(self.container, self.cache_context)
         return True
 
+    async def _aprocess(self, cache: caching.AsyncCache, /) -> bool:
+        if not self.container:
+            return False
+
+        await cache.store('channel_voice_states', self.container, self.cache_context)
+        return True
+
 
 @define(slots=True)
 class AuthenticatedEvent(ShardEvent):
@@ -2272,6 +2873,7 @@ class AfterConnectEvent(ShardEvent):
 
 
 __all__ = (
+    'SkipBeforeSnapshotIn',
     'BaseEvent',
     'ShardEvent',
     'ReadyEvent',
@@ -118,6 +118,20 @@ class VoiceChannelConverterCacheContext(BaseServerChannelConverterCacheContext):
     """Represents a cache context that was created in :meth:`VoiceChannelConverter.convert`."""
 
 
+@define(slots=True)
+class RoleConverterCacheContext(CommandsCacheContext):
+    """Represents a cache context that was created in :meth:`RoleConverter.convert`."""
+
+    argument: str = field(repr=True, hash=True, kw_only=True, eq=True)
+    """:class:`str`: The argument."""
+
+    context: Context[Bot] = field(repr=True, hash=True, kw_only=True, eq=True)
+    """:class:`Context`: The context."""
+
+    server: Server = field(repr=True, hash=True, kw_only=True, eq=True)
+    """:class:`.Server`: The server the lookup was done in."""
+
+
 @define(slots=True)
 class EmojiConverterCacheContext(CommandsCacheContext):
     """Represents a cache context that was created in :meth:`EmojiConverter.convert`."""
@@ -139,5 +153,6 @@ __all__ = (
     'ServerChannelConverterCacheContext',
     'TextChannelConverterCacheContext',
     'VoiceChannelConverterCacheContext',
+    'RoleConverterCacheContext',
     'EmojiConverterCacheContext',
 )
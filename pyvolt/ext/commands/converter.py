@@ -40,6 +40,7 @@ from .cache import (
     ServerChannelConverterCacheContext,
     TextChannelConverterCacheContext,
     VoiceChannelConverterCacheContext,
+    RoleConverterCacheContext,
     EmojiConverterCacheContext,
 )
 from .errors import (
@@ -198,7 +199,7 @@ class MemberConverter(IDConverter[pyvolt.Member]):
             predicate = lambda m, /: m.name == username and m.discriminator == discriminator
         else:
             lookup = argument
-            predicate = lambda m, /: m.name == argument or m.global_name == argument or m.nick == argument
+            predicate = lambda m, /: m.name == argument or m.display_name == argument or m.nick == argument
 
         members = await server.state.http.query_members_by_name(server, lookup)
         cache_context = None
@@ -275,13 +276,12 @@ class MemberConverter(IDConverter[pyvolt.Member]):
                     server=server,
                 )
 
-                members = cache.get_server_members_mapping_of(server.id, cache_context) or {}
                 username, _, discriminator = argument.rpartition('#')
                 if not username:
                     discriminator, username = username, discriminator
 
                 if len(discriminator) == 4 and discriminator.isdigit():
-                    for member in members.values():
+                    for member in cache.get_server_members_by_name(server.id, username, cache_context):
                         user = member.get_user()
                         if user is None:
                             continue
@@ -290,7 +290,7 @@ class MemberConverter(IDConverter[pyvolt.Member]):
                             result = member
                             break
                 else:
-                    for member in members.values():
+                    for member in cache.get_server_members_by_name(server.id, argument, cache_context):
                         if member.nick == argument:
                             result = member
                             break
@@ -371,12 +371,18 @@ class UserConverter(IDConverter[pyvolt.User]):
             discriminator, username = username, discriminator
 
         if discriminator == '0' or (len(discriminator) == 4 and discriminator.isdigit()):
+            lookup = username
             predicate = lambda u, /: u.name == username and u.discriminator == discriminator
         else:
-            predicate = lambda u, /: u.name == argument or u.global_name == argument
+            lookup = argument
+            predicate = lambda u, /: u.name == argument or u.display_name == argument
 
-        users = cache.get_users_mapping()
-        for user in users.values():
+        cache_context = UserConverterCacheContext(
+            type=pyvolt.CacheContextType.custom,
+            argument=argument,
+            context=ctx,
+        )
+        for user in cache.get_users_by_name(lookup, cache_context):
             if predicate(user):
                 return user
         raise UserNotFound(argument=argument)
@@ -594,9 +600,15 @@ class ServerChannelConverter(IDConverter[pyvolt.ServerChannel]):
             if server is None:
                 if cache is None:
                     raise ChannelNotFound(argument=argument)
-                for channel in cache.get_channels_mapping().values():
+                cache_context = cache_context_type(
+                    type=pyvolt.CacheContextType.custom,
+                    argument=argument,
+                    context=ctx,
+                    server_id='',
+                )
+                for channel in cache.get_channels_by_name(argument, cache_context):
                     if isinstance(channel, type) and channel.name == argument:
-                        return None, channel
+                        return cache_context, channel
             elif cache is None:
                 # I'm unsure how we can get here...
                 channels = server.channels
@@ -605,9 +617,15 @@ class ServerChannelConverter(IDConverter[pyvolt.ServerChannel]):
                         return None, channel
                 raise ChannelNotFound(argument=argument)
             else:
-                for channel in cache.get_channels_mapping().values():
+                cache_context = cache_context_type(
+                    type=pyvolt.CacheContextType.custom,
+                    argument=argument,
+                    context=ctx,
+                    server_id=server.id,
+                )
+                for channel in cache.get_channels_by_name(argument, cache_context, server_id=server.id):
                     if isinstance(channel, type) and channel.name == argument:
-                        return None, channel
+                        return cache_context, channel
         elif cache is None:
             raise ChannelNotFound(argument=argument)
         else:
@@ -755,7 +773,18 @@ class RoleConverter(IDConverter[pyvolt.Role]):
 
         match = self._get_id_match(argument) or RE_MENTION_ROLE.match(argument)
         if match is None:
-            for role in pyvolt.sort_member_roles(list(server.roles), safe=True, server_roles=server.roles):
+            cache = ctx.bot.state.cache
+            if cache is None:
+                roles = server.roles
+            else:
+                cache_context = RoleConverterCacheContext(
+                    type=pyvolt.CacheContextType.custom,
+                    argument=argument,
+                    context=ctx,
+                    server=server,
+                )
+                roles = {role.id: role for role in cache.get_roles_by_name(server.id, argument, cache_context)}
+            for role in pyvolt.sort_member_roles(list(roles), safe=True, server_roles=roles):
                 if role.name == argument:
                     return role
             raise RoleNotFound(argument=argument)
@@ -836,25 +865,28 @@ class EmojiConverter(IDConverter[pyvolt.Emoji]):
                         else cache_context
                     )
 
-                    emojis = cache.get_server_emojis_mapping_of(server.id, cache_context)
-                    if emojis is not None:
-                        for emoji in emojis.values():
-                            if emoji.name == argument:
-                                result = emoji
-                                break
-                    if result is None:
-                        for emoji in cache.get_emojis_mapping().values():
-                            if emoji.name == argument:
-                                result = emoji
-                                break
+                    for emoji in cache.get_emojis_by_name(argument, cache_context, server_id=server.id):
+                        if emoji.name == argument:
+                            result = emoji
+                            break
                 elif cache is None:
                     # No cache at all...
                     raise EmojiNotFound(argument=argument)
 
-                for emoji in cache.get_emojis_mapping().values():
-                    if emoji.name == argument:
-                        result = emoji
-                        break
+                if result is None:
+                    cache_context = (
+                        EmojiConverterCacheContext(
+                            type=pyvolt.CacheContextType.custom,
+                            context=ctx,
+                            argument=argument,
+                        )
+                        if cache_context is None
+                        else cache_context
+                    )
+                    for emoji in cache.get_emojis_by_name(argument, cache_context):
+                        if emoji.name == argument:
+                            result = emoji
+                            break
 
         if result is not None:
             return result
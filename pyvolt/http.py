@@ -26,15 +26,20 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 import asyncio
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timedelta
+from heapq import heapify, heappop, heappush
 from inspect import isawaitable
 import logging
+from time import monotonic
 import typing
 
 import aiohttp
 from multidict import CIMultiDict
 
-from . import routes, utils
+from . import cache as caching, routes, utils
 from .authentication import (
     PartialAccount,
     MFATicket,
@@ -47,6 +52,7 @@ from .authentication import (
     MFAResponse,
     LoginResult,
 )
+from .bulk import BulkOperation
 from .channel import (
     BaseChannel,
     TextChannel,
@@ -57,7 +63,7 @@ from .channel import (
     ServerChannel,
     Channel,
 )
-from .cdn import ResolvableResource, resolve_resource
+from .cdn import ResolvableResource, resolve_resource, resolve_resources
 from .core import (
     UNDEFINED,
     UndefinedOr,
@@ -66,6 +72,7 @@ from .core import (
     __version__ as version,
 )
 from .emoji import BaseEmoji, ServerEmoji, Emoji, ResolvableEmoji, resolve_emoji
+from .enums import MessageSort, RequestLane
 from .errors import (
     HTTPException,
     NoEffect,
@@ -79,6 +86,7 @@ from .errors import (
 )
 from .flags import MessageFlags, Permissions, ServerFlags, UserBadges, UserFlags
 from .invite import BaseInvite, PublicInvite, ServerInvite, Invite
+from .iterators import MessageIterator
 from .message import (
     Reply,
     MessageMasquerade,
@@ -88,6 +96,7 @@ from .message import (
     Message,
 )
 from .permissions import PermissionOverride
+from .retry import ExponentialBackoff, RetryBudget, RetryPolicy
 from .server import (
     Category,
     SystemMessageChannels,
@@ -103,12 +112,13 @@ from .server import (
 
 
 if typing.TYPE_CHECKING:
-    from collections.abc import Callable, Sequence
+    from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable, Iterator, Sequence
 
     from . import raw
     from .bot import BaseBot, Bot, PublicBot
     from .channel import TextableChannel
-    from .enums import ChannelType, MessageSort, ContentReportReason, UserReportReason
+    from .cache import Cache
+    from .enums import ChannelType, ContentReportReason, UserReportReason
     from .instance import Instance
     from .read_state import ReadState
     from .settings import UserSettings
@@ -128,6 +138,8 @@ if typing.TYPE_CHECKING:
 DEFAULT_HTTP_USER_AGENT = f'pyvolt (https://github.com/MCausc78/pyvolt, {version})'
 
 
+T = typing.TypeVar('T')
+
 _L = logging.getLogger(__name__)
 _STATUS_TO_ERRORS = {
     401: Unauthorized,
@@ -225,39 +237,156 @@ class RateLimiter(ABC):
         ...
 
 
+_request_lane: ContextVar[tuple[RequestLane, typing.Optional[float]]] = ContextVar(
+    'pyvolt_request_lane', default=(RequestLane.interactive, None)
+)
+
+
+@contextmanager
+def request_lane(lane: RequestLane, /, *, timeout: typing.Optional[float] = None) -> Iterator[None]:
+    """Makes HTTP requests inside ``with`` block queue in provided lane when their bucket is ratelimited.
+
+    This is respected by :class:`.DefaultRateLimit`; requests made outside of this context manager
+    use :attr:`.RequestLane.interactive` lane.
+
+    Parameters
+    ----------
+    lane: :class:`.RequestLane`
+        The lane to queue requests in.
+    timeout: Optional[:class:`float`]
+        How long, in seconds, each request may wait for ratelimit, before :exc:`asyncio.TimeoutError`
+        is raised. Defaults to waiting indefinitely.
+    """
+    token = _request_lane.set((lane, timeout))
+    try:
+        yield
+    finally:
+        _request_lane.reset(token)
+
+
 class DefaultRateLimit(RateLimit):
+    """A token bucket, which releases queued requests as capacity becomes available.
+
+    Requests are released in order of their :class:`.RequestLane`, and then in order they were queued.
+    """
+
     __slots__ = (
         '_rate_limiter',
         'bucket',
         'remaining',
+        'limit',
         '_expires_at',
+        '_window',
+        '_waiters',
+        '_waiters_count',
+        '_timer',
     )
 
-    def __init__(self, rate_limiter: RateLimiter, bucket: str, /, *, remaining: int, reset_after: int) -> None:
+    def __init__(
+        self,
+        rate_limiter: RateLimiter,
+        bucket: str,
+        /,
+        *,
+        remaining: int,
+        reset_after: int,
+        limit: typing.Optional[int] = None,
+    ) -> None:
         self._rate_limiter: RateLimiter = rate_limiter
         self.bucket: str = bucket
         self.remaining: int = remaining
-        self._expires_at: datetime = utils.utcnow() + timedelta(milliseconds=reset_after)
+        self.limit: int = remaining + 1 if limit is None else max(limit, 1)
+        # In time.monotonic() seconds, so that wall clock changes do not affect sleeps
+        self._expires_at: float = monotonic() + reset_after / 1000
+        # The longest reset interval seen, used to guess next window when no responses arrive
+        self._window: float = reset_after / 1000
+        # Min-heap of (lane, order, future)
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._waiters_count: int = 0
+        self._timer: typing.Optional[asyncio.TimerHandle] = None
+
+    @property
+    def expires_at(self) -> float:
+        """:class:`float`: When the ratelimit expires, in :func:`time.monotonic` seconds."""
+        return self._expires_at
+
+    def _refill(self, now: float, /) -> None:
+        if now >= self._expires_at:
+            self.remaining = self.limit
+            self._expires_at = now + self._window
+
+    def _release(self) -> None:
+        waiters = self._waiters
+        while waiters and self.remaining > 0:
+            _, _, future = heappop(waiters)
+            if not future.done():
+                self.remaining -= 1
+                future.set_result(None)
+
+    def _schedule(self) -> None:
+        timer = self._timer
+        if timer is not None:
+            timer.cancel()
+            self._timer = None
+        if self._waiters:
+            delay = max(self._expires_at - monotonic(), 0)
+            self._timer = asyncio.get_running_loop().call_later(delay, self._on_timer)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._refill(monotonic())
+        self._release()
+        self._schedule()
 
     @utils.copy_doc(RateLimit.block)
     async def block(self) -> None:
-        self.remaining -= 1
-        if self.remaining <= 0:
-            now = utils.utcnow()
-
-            delay = (self._expires_at - now).total_seconds()
-            if delay > 0:
-                _L.info('Bucket %s is ratelimited locally for %.4f; sleeping', self.bucket, delay)
-                await asyncio.sleep(delay)
+        self._refill(monotonic())
+        if self.remaining > 0 and not self._waiters:
+            self.remaining -= 1
+            return
+
+        lane, timeout = _request_lane.get()
+        future = asyncio.get_running_loop().create_future()
+        self._waiters_count += 1
+        entry = (lane.value, self._waiters_count, future)
+        heappush(self._waiters, entry)
+
+        _L.info(
+            'Bucket %s is ratelimited locally for %.4f; queueing in %s lane',
+            self.bucket,
+            self._expires_at - monotonic(),
+            lane.name,
+        )
+
+        if self._timer is None:
+            self._schedule()
+
+        try:
+            if timeout is None:
+                await future
+            else:
+                await asyncio.wait_for(future, timeout)
+        except BaseException:
+            if future.done() and not future.cancelled():
+                # Released right before being cancelled, give the token to next waiter
+                self.remaining += 1
+                self._release()
             else:
-                _L.debug('Bucket %s expired.', self.bucket)
-                # Nothing to do here ┬─┬ノ( º _ ºノ)
-                # The ratelimit expired. No 429 :)
+                future.cancel()
+                waiters = self._waiters
+                try:
+                    waiters.remove(entry)
+                except ValueError:
+                    pass
+                else:
+                    heapify(waiters)
+            self._schedule()
+            raise
 
     @utils.copy_doc(RateLimit.is_expired)
     def is_expired(self) -> bool:
         """:class:`bool`: Whether the ratelimit is expired."""
-        return (self._expires_at - utils.utcnow()).total_seconds() <= 0
+        return self._expires_at <= monotonic()
 
     @utils.copy_doc(RateLimit.on_response)
     def on_response(self, route: routes.CompiledRoute, response: aiohttp.ClientResponse, /) -> None:
@@ -269,8 +398,29 @@ class DefaultRateLimit(RateLimit):
             self.bucket = bucket
 
         # (bucket, limit, remaining, reset-after)
-        self.remaining = int(headers['x-ratelimit-remaining'])
-        self._expires_at = utils.utcnow() + timedelta(milliseconds=int(headers['x-ratelimit-reset-after']))
+        now = monotonic()
+        remaining = int(headers['x-ratelimit-remaining'])
+        reset_after = int(headers['x-ratelimit-reset-after']) / 1000
+
+        limit = headers.get('x-ratelimit-limit')
+        if limit is not None:
+            self.limit = max(int(limit), 1)
+        elif remaining >= self.limit:
+            self.limit = remaining + 1
+
+        if now >= self._expires_at:
+            self.remaining = remaining
+        else:
+            # Responses may arrive out of order, and requests released locally may be still in flight
+            self.remaining = min(self.remaining, remaining)
+
+        self._expires_at = now + reset_after
+        if reset_after > self._window:
+            self._window = reset_after
+
+        if self._waiters:
+            self._release()
+            self._schedule()
 
 
 class DefaultRateLimitBlocker(RateLimitBlocker):
@@ -303,6 +453,8 @@ class _NoopRateLimitBlocker(RateLimitBlocker):
 
 class DefaultRateLimiter(RateLimiter):
     __slots__ = (
+        '_bucket_routes',
+        '_expiry_heap',
         '_no_concurrent_block',
         '_no_expired_ratelimit_remove',
         '_noop_blocker',
@@ -321,8 +473,13 @@ class DefaultRateLimiter(RateLimiter):
         self._no_expired_ratelimit_remove: bool = no_expired_ratelimit_remove
         self._noop_blocker: RateLimitBlocker = _NoopRateLimitBlocker()
         self._pending_requests: dict[str, RateLimitBlocker] = {}
-        self._ratelimits: dict[str, RateLimit] = {}
+        self._ratelimits: dict[str, DefaultRateLimit] = {}
         self._routes_to_bucket: dict[str, str] = {}
+        # Bucket -> ratelimit keys of routes using it
+        self._bucket_routes: dict[str, list[str]] = {}
+        # Min-heap of (expires_at, bucket). There is at most one entry per bucket, which is pushed back
+        # when popped if the ratelimit was extended meanwhile.
+        self._expiry_heap: list[tuple[float, str]] = []
 
     def get_ratelimit_key_for(self, route: routes.CompiledRoute, /) -> str:
         """Gets ratelimit key for this compiled route.
@@ -352,7 +509,7 @@ class DefaultRateLimiter(RateLimiter):
         except KeyError:
             return None
         else:
-            return self._ratelimits[bucket]
+            return self._ratelimits.get(bucket)
 
     @utils.copy_doc(RateLimiter.fetch_blocker_for)
     def fetch_blocker_for(self, route: routes.CompiledRoute, path: str, /) -> RateLimitBlocker:
@@ -385,45 +542,580 @@ class DefaultRateLimiter(RateLimiter):
         except KeyError:
             _L.debug('%s %s found initial bucket key: %s.', route.route.method, path, bucket)
 
+            limit = headers.get('x-ratelimit-limit')
             ratelimit = DefaultRateLimit(
                 self,
                 bucket,
                 remaining=remaining,
                 reset_after=reset_after,
+                limit=None if limit is None else int(limit),
             )
             self._ratelimits[ratelimit.bucket] = ratelimit
-            self._routes_to_bucket[self.get_ratelimit_key_for(route)] = bucket
+            self._set_route_bucket(self.get_ratelimit_key_for(route), bucket)
+            heappush(self._expiry_heap, (ratelimit.expires_at, bucket))
         else:
             ratelimit.on_response(route, response)
 
+    def _set_route_bucket(self, key: str, bucket: str, /) -> None:
+        self._routes_to_bucket[key] = bucket
+        keys = self._bucket_routes.get(bucket)
+        if keys is None:
+            self._bucket_routes[bucket] = [key]
+        elif key not in keys:
+            keys.append(key)
+
     @utils.copy_doc(RateLimiter.on_bucket_update)
     def on_bucket_update(
         self, response: aiohttp.ClientResponse, route: routes.CompiledRoute, old_bucket: str, new_bucket: str, /
     ) -> None:
-        self._ratelimits[new_bucket] = self._ratelimits.pop(old_bucket)
-        self._routes_to_bucket[self.get_ratelimit_key_for(route)] = new_bucket
+        ratelimit = self._ratelimits.pop(old_bucket)
+        self._ratelimits[new_bucket] = ratelimit
+
+        # Other routes will find their new bucket on next response
+        routes_to_bucket = self._routes_to_bucket
+        for key in self._bucket_routes.pop(old_bucket, ()):
+            if routes_to_bucket.get(key) == old_bucket:
+                del routes_to_bucket[key]
+
+        self._set_route_bucket(self.get_ratelimit_key_for(route), new_bucket)
+        heappush(self._expiry_heap, (ratelimit.expires_at, new_bucket))
 
     def try_remove_expired_ratelimits(self) -> None:
-        """Tries to remove expired ratelimits."""
-        if not len(self._ratelimits) or not len(self._routes_to_bucket):
-            return
+        """Tries to remove expired ratelimits.
 
-        buckets = []
+        Ratelimits that still have queued requests are kept until their queue drains.
+
+        This takes ``O(log n)`` time per removed, extended or kept ratelimit.
+        """
+        heap = self._expiry_heap
+        if not heap:
+            return
 
+        now = monotonic()
         ratelimits = self._ratelimits
-        for s in ratelimits.values():
-            if s.is_expired():
-                buckets.append(s.bucket)
+        routes_to_bucket = self._routes_to_bucket
+        busy: list[tuple[float, str]] = []
+
+        while heap and heap[0][0] <= now:
+            entry = heappop(heap)
+            bucket = entry[1]
+
+            ratelimit = ratelimits.get(bucket)
+            if ratelimit is None:
+                # The bucket was renamed
+                continue
+
+            expires_at = ratelimit.expires_at
+            if expires_at > now:
+                heappush(heap, (expires_at, bucket))
+                continue
+
+            if ratelimit._waiters or ratelimit._timer is not None:
+                # The bucket still releases queued requests. If it was removed, new requests would
+                # create another bucket for same routes and exceed the limit together with the queue.
+                busy.append(entry)
+                continue
+
+            del ratelimits[bucket]
+            for key in self._bucket_routes.pop(bucket, ()):
+                if routes_to_bucket.get(key) == bucket:
+                    del routes_to_bucket[key]
+
+        for entry in busy:
+            heappush(heap, entry)
+
+
+class ResponseCache(ABC):
+    """An ABC that represents cache of parsed JSON responses for ``GET`` requests.
+
+    Successful requests with other methods invalidate responses for their path and its parent path,
+    and gateway events invalidate responses they make stale using :meth:`.BaseEvent.invalidate_responses`.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def get(self, route: routes.CompiledRoute, key: typing.Any, /) -> UndefinedOr[typing.Any]:
+        """Retrieves a cached response.
 
-        if not buckets:
+        Parameters
+        ----------
+        route: :class:`~routes.CompiledRoute`
+            The route.
+        key: Any
+            The hashable key, built from route's path, query parameters and authentication options.
+
+        Returns
+        -------
+        UndefinedOr[Any]
+            The parsed JSON response, or :data:`.UNDEFINED` if it is not cached.
+        """
+        ...
+
+    @abstractmethod
+    def store(self, route: routes.CompiledRoute, key: typing.Any, value: typing.Any, /) -> None:
+        """Stores a response.
+
+        Parameters
+        ----------
+        route: :class:`~routes.CompiledRoute`
+            The route.
+        key: Any
+            The hashable key, built from route's path, query parameters and authentication options.
+        value: Any
+            The parsed JSON response.
+        """
+        ...
+
+    @abstractmethod
+    def invalidate(self, path: str, /) -> None:
+        """Removes cached responses for path, regardless of query parameters.
+
+        Parameters
+        ----------
+        path: :class:`str`
+            The path, as returned by :meth:`routes.CompiledRoute.build`.
+        """
+        ...
+
+    @abstractmethod
+    def invalidate_route(self, route: routes.Route, /) -> None:
+        """Removes cached responses for all paths of route.
+
+        Parameters
+        ----------
+        route: :class:`~routes.Route`
+            The route.
+        """
+        ...
+
+    def clear(self) -> None:
+        """Removes all cached responses."""
+        pass
+
+
+DEFAULT_RESPONSE_CACHE_TTLS: typing.Final[dict[routes.Route, float]] = {
+    routes.ROOT: 3600.0,
+    routes.BOTS_FETCH_PUBLIC: 300.0,
+    routes.INVITES_INVITE_FETCH: 60.0,
+    routes.SERVERS_BAN_LIST: 60.0,
+    routes.SERVERS_EMOJI_LIST: 300.0,
+    routes.SERVERS_ROLES_FETCH: 300.0,
+}
+
+
+class TTLResponseCache(ResponseCache):
+    """A :class:`.ResponseCache` that keeps responses for limited time, evicting least recently used ones when full.
+
+    Only routes that have a TTL are cached.
+
+    Parameters
+    ----------
+    ttls: Optional[Dict[:class:`~routes.Route`, :class:`float`]]
+        The mapping of routes to how long, in seconds, their responses are cached. Defaults to :data:`.DEFAULT_RESPONSE_CACHE_TTLS`.
+    max_size: :class:`int`
+        The maximum number of cached responses.
+
+    Attributes
+    ----------
+    hits: Dict[:class:`~routes.Route`, :class:`int`]
+        The number of requests per route served from cache.
+    misses: Dict[:class:`~routes.Route`, :class:`int`]
+        The number of requests per route that were not cached.
+    """
+
+    __slots__ = (
+        '_entries',
+        '_paths',
+        '_routes',
+        'hits',
+        'max_size',
+        'misses',
+        'ttls',
+    )
+
+    def __init__(self, *, ttls: typing.Optional[dict[routes.Route, float]] = None, max_size: int = 1000) -> None:
+        self.ttls: dict[routes.Route, float] = DEFAULT_RESPONSE_CACHE_TTLS.copy() if ttls is None else ttls
+        self.max_size: int = max_size
+        self.hits: dict[routes.Route, int] = {}
+        self.misses: dict[routes.Route, int] = {}
+        # Key -> (expires_at, path, route, value), in least recently used order
+        self._entries: OrderedDict[typing.Any, tuple[float, str, routes.Route, typing.Any]] = OrderedDict()
+        self._paths: dict[str, set[typing.Any]] = {}
+        self._routes: dict[routes.Route, set[str]] = {}
+
+    def hit_rate(self, route: typing.Optional[routes.Route] = None, /) -> float:
+        """Returns the ratio of requests served from cache, for single route or overall.
+
+        Parameters
+        ----------
+        route: Optional[:class:`~routes.Route`]
+            The route. If ``None``, the rate is calculated for all routes.
+
+        Returns
+        -------
+        :class:`float`
+            The hit rate, between ``0.0`` and ``1.0``.
+        """
+        if route is None:
+            hits = sum(self.hits.values())
+            misses = sum(self.misses.values())
+        else:
+            hits = self.hits.get(route, 0)
+            misses = self.misses.get(route, 0)
+        total = hits + misses
+        return hits / total if total else 0.0
+
+    def _remove(self, key: typing.Any, /) -> None:
+        _, path, route, _ = self._entries.pop(key)
+        keys = self._paths[path]
+        keys.discard(key)
+        if not keys:
+            del self._paths[path]
+            paths = self._routes[route]
+            paths.discard(path)
+            if not paths:
+                del self._routes[route]
+
+    @utils.copy_doc(ResponseCache.get)
+    def get(self, route: routes.CompiledRoute, key: typing.Any, /) -> UndefinedOr[typing.Any]:
+        template = route.route
+        if template not in self.ttls:
+            return UNDEFINED
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > monotonic():
+                self._entries.move_to_end(key)
+                self.hits[template] = self.hits.get(template, 0) + 1
+                return entry[3]
+            self._remove(key)
+
+        self.misses[template] = self.misses.get(template, 0) + 1
+        return UNDEFINED
+
+    @utils.copy_doc(ResponseCache.store)
+    def store(self, route: routes.CompiledRoute, key: typing.Any, value: typing.Any, /) -> None:
+        template = route.route
+        ttl = self.ttls.get(template)
+        if ttl is None or self.max_size <= 0:
             return
 
-        for bucket in buckets:
-            ratelimits.pop(bucket, None)
+        if key in self._entries:
+            self._remove(key)
+        elif len(self._entries) >= self.max_size:
+            self._remove(next(iter(self._entries)))
+
+        path = route.build()
+        self._entries[key] = (monotonic() + ttl, path, template, value)
+
+        keys = self._paths.get(path)
+        if keys is None:
+            self._paths[path] = {key}
+            paths = self._routes.get(template)
+            if paths is None:
+                self._routes[template] = {path}
+            else:
+                paths.add(path)
+        else:
+            keys.add(key)
+
+    @utils.copy_doc(ResponseCache.invalidate)
+    def invalidate(self, path: str, /) -> None:
+        for key in list(self._paths.get(path, ())):
+            self._remove(key)
+
+    @utils.copy_doc(ResponseCache.invalidate_route)
+    def invalidate_route(self, route: routes.Route, /) -> None:
+        for path in list(self._routes.get(route, ())):
+            self.invalidate(path)
+
+    @utils.copy_doc(ResponseCache.clear)
+    def clear(self) -> None:
+        self._entries.clear()
+        self._paths.clear()
+        self._routes.clear()
+
+
+class HTTPInstrumentation:
+    """Receives timings and sizes of HTTP requests performed by :class:`.HTTPClient`.
+
+    All hooks do nothing by default and are called synchronously, so they should not block.
+    Durations are in seconds and are measured with :func:`time.monotonic`.
+    """
+
+    __slots__ = ()
+
+    def trace_configs(self) -> list[aiohttp.TraceConfig]:
+        """Returns the aiohttp trace configs to pass when creating a session.
+
+        The default session factory of :class:`.Client` uses these, so instrumentation must be set
+        before first request is made.
+
+        Returns
+        -------
+        List[:class:`aiohttp.TraceConfig`]
+            The trace configs.
+        """
+        return []
 
-        keys = [k for k, v in self._routes_to_bucket.items() if v in buckets or v not in ratelimits]
-        for key in keys:
-            del self._routes_to_bucket[key]
+    def on_blocker_wait(self, route: routes.CompiledRoute, duration: float, /) -> None:
+        """Called after request waited on :class:`.RateLimitBlocker`, that is, for bucket of route to be discovered.
+
+        Parameters
+        ----------
+        route: :class:`~routes.CompiledRoute`
+            The route.
+        duration: :class:`float`
+            How long the request waited.
+        """
+        pass
+
+    def on_rate_limit_wait(self, route: routes.CompiledRoute, duration: float, /) -> None:
+        """Called after request waited in :meth:`.RateLimit.block`.
+
+        Parameters
+        ----------
+        route: :class:`~routes.CompiledRoute`
+            The route.
+        duration: :class:`float`
+            How long the request waited.
+        """
+        pass
+
+    def on_connection(self, route: routes.CompiledRoute, duration: float, /) -> None:
+        """Called after aiohttp acquired connection for request, including waiting for free connection
+        in pool, DNS resolution and TLS handshake.
+
+        This is called only if session was created with :meth:`.trace_configs`.
+
+        Parameters
+        ----------
+        route: :class:`~routes.CompiledRoute`
+            The route.
+        duration: :class:`float`
+            How long acquiring the connection took.
+        """
+        pass
+
+    def on_response(
+        self,
+        route: routes.CompiledRoute,
+        response: aiohttp.ClientResponse,
+        /,
+        *,
+        latency: float,
+        request_size: int,
+    ) -> None:
+        """Called when response headers are received, for every attempt.
+
+        Parameters
+        ----------
+        route: :class:`~routes.CompiledRoute`
+            The route.
+        response: :class:`aiohttp.ClientResponse`
+            The response.
+        latency: :class:`float`
+            The time between sending request and receiving response headers.
+        request_size: :class:`int`
+            The size of JSON request body in bytes. This is ``0`` if request had no JSON body.
+        """
+        pass
+
+    def on_retry(self, route: routes.CompiledRoute, reason: str, /) -> None:
+        """Called when request is about to be retried.
+
+        Parameters
+        ----------
+        route: :class:`~routes.CompiledRoute`
+            The route.
+        reason: :class:`str`
+            Why request is retried: ``'429'``, ``'502'``, ``'525'`` or ``'connection_reset'``.
+        """
+        pass
+
+
+class RouteMetrics:
+    """Represents aggregated metrics of requests to single route.
+
+    Attributes
+    ----------
+    requests: :class:`int`
+        The number of responses received, including ones that were retried.
+    latency: :class:`float`
+        The total time spent waiting for response headers.
+    max_latency: :class:`float`
+        The longest time spent waiting for response headers.
+    blocker_wait: :class:`float`
+        The total time spent waiting on :class:`.RateLimitBlocker`.
+    rate_limit_wait: :class:`float`
+        The total time spent waiting in :meth:`.RateLimit.block`.
+    connection_wait: :class:`float`
+        The total time spent acquiring connections.
+    request_bytes: :class:`int`
+        The total size of request bodies.
+    response_bytes: :class:`int`
+        The total size of response bodies, as reported by ``Content-Length`` header.
+    statuses: Dict[:class:`int`, :class:`int`]
+        The number of responses per HTTP status code.
+    retries: Dict[:class:`str`, :class:`int`]
+        The number of retries per reason.
+    """
+
+    __slots__ = (
+        'blocker_wait',
+        'connection_wait',
+        'latency',
+        'max_latency',
+        'rate_limit_wait',
+        'request_bytes',
+        'requests',
+        'response_bytes',
+        'retries',
+        'statuses',
+    )
+
+    def __init__(self) -> None:
+        self.requests: int = 0
+        self.latency: float = 0.0
+        self.max_latency: float = 0.0
+        self.blocker_wait: float = 0.0
+        self.rate_limit_wait: float = 0.0
+        self.connection_wait: float = 0.0
+        self.request_bytes: int = 0
+        self.response_bytes: int = 0
+        self.statuses: dict[int, int] = {}
+        self.retries: dict[str, int] = {}
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} requests={self.requests} average_latency={self.average_latency:.3f}>'
+
+    @property
+    def average_latency(self) -> float:
+        """:class:`float`: The average time spent waiting for response headers."""
+        return self.latency / self.requests if self.requests else 0.0
+
+    def to_dict(self) -> dict[str, typing.Any]:
+        """Dict[:class:`str`, Any]: Returns the metrics as JSON-serializable dictionary."""
+        return {
+            'requests': self.requests,
+            'latency': self.latency,
+            'average_latency': self.average_latency,
+            'max_latency': self.max_latency,
+            'blocker_wait': self.blocker_wait,
+            'rate_limit_wait': self.rate_limit_wait,
+            'connection_wait': self.connection_wait,
+            'request_bytes': self.request_bytes,
+            'response_bytes': self.response_bytes,
+            'statuses': {str(k): v for k, v in self.statuses.items()},
+            'retries': dict(self.retries),
+        }
+
+
+class HTTPMetrics(HTTPInstrumentation):
+    """A :class:`.HTTPInstrumentation` that aggregates metrics in memory, per route template.
+
+    Attributes
+    ----------
+    routes: Dict[:class:`~routes.Route`, :class:`.RouteMetrics`]
+        The metrics per route.
+    """
+
+    __slots__ = ('routes',)
+
+    def __init__(self) -> None:
+        self.routes: dict[routes.Route, RouteMetrics] = {}
+
+    def get(self, route: routes.Route, /) -> RouteMetrics:
+        """Returns the metrics for route, creating them if necessary.
+
+        Parameters
+        ----------
+        route: :class:`~routes.Route`
+            The route.
+
+        Returns
+        -------
+        :class:`.RouteMetrics`
+            The metrics.
+        """
+        try:
+            return self.routes[route]
+        except KeyError:
+            metrics = self.routes[route] = RouteMetrics()
+            return metrics
+
+    def export(self) -> dict[str, dict[str, typing.Any]]:
+        """Returns all metrics as JSON-serializable dictionary, keyed by ``'METHOD /path/{template}'``.
+
+        Returns
+        -------
+        Dict[:class:`str`, Dict[:class:`str`, Any]]
+            The metrics.
+        """
+        return {str(route): metrics.to_dict() for route, metrics in self.routes.items()}
+
+    def reset(self) -> None:
+        """Removes all collected metrics."""
+        self.routes.clear()
+
+    @utils.copy_doc(HTTPInstrumentation.trace_configs)
+    def trace_configs(self) -> list[aiohttp.TraceConfig]:
+        async def on_connection_queued_start(_session, context, _params, /) -> None:
+            context.connection_started_at = monotonic()
+
+        async def on_connection_create_start(_session, context, _params, /) -> None:
+            if not hasattr(context, 'connection_started_at'):
+                context.connection_started_at = monotonic()
+
+        async def on_connection_done(_session, context, _params, /) -> None:
+            route = context.trace_request_ctx
+            started_at = getattr(context, 'connection_started_at', None)
+            if isinstance(route, routes.CompiledRoute) and started_at is not None:
+                self.on_connection(route, monotonic() - started_at)
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_queued_start.append(on_connection_queued_start)
+        trace_config.on_connection_create_start.append(on_connection_create_start)
+        trace_config.on_connection_create_end.append(on_connection_done)
+        trace_config.on_connection_reuseconn.append(on_connection_done)
+        return [trace_config]
+
+    @utils.copy_doc(HTTPInstrumentation.on_blocker_wait)
+    def on_blocker_wait(self, route: routes.CompiledRoute, duration: float, /) -> None:
+        self.get(route.route).blocker_wait += duration
+
+    @utils.copy_doc(HTTPInstrumentation.on_rate_limit_wait)
+    def on_rate_limit_wait(self, route: routes.CompiledRoute, duration: float, /) -> None:
+        self.get(route.route).rate_limit_wait += duration
+
+    @utils.copy_doc(HTTPInstrumentation.on_connection)
+    def on_connection(self, route: routes.CompiledRoute, duration: float, /) -> None:
+        self.get(route.route).connection_wait += duration
+
+    @utils.copy_doc(HTTPInstrumentation.on_response)
+    def on_response(
+        self,
+        route: routes.CompiledRoute,
+        response: aiohttp.ClientResponse,
+        /,
+        *,
+        latency: float,
+        request_size: int,
+    ) -> None:
+        metrics = self.get(route.route)
+        metrics.requests += 1
+        metrics.latency += latency
+        if latency > metrics.max_latency:
+            metrics.max_latency = latency
+        metrics.request_bytes += request_size
+        metrics.response_bytes += response.content_length or 0
+        metrics.statuses[response.status] = metrics.statuses.get(response.status, 0) + 1
+
+    @utils.copy_doc(HTTPInstrumentation.on_retry)
+    def on_retry(self, route: routes.CompiledRoute, reason: str, /) -> None:
+        retries = self.get(route.route).retries
+        retries[reason] = retries.get(reason, 0) + 1
 
 
 def _resolve_member_id(target: typing.Union[str, BaseUser, BaseMember], /) -> str:
@@ -441,9 +1133,20 @@ class HTTPClient:
     cookie: :class:`str`
         The cookie used to make requests. If ``cf_clearance`` cookie is present, then it's used to prevent HTML pages when service is down.
     max_retries: :class:`int`
-        How many times to retry requests that received 429 or 502 HTTP status code.
+        How many times the default retry policy retries requests.
+    instrumentation: Optional[:class:`.HTTPInstrumentation`]
+        The instrumentation receiving timings and sizes of requests. Disabled by default.
     rate_limiter: Optional[:class:`RateLimiter`]
         The rate limiter in use.
+    retry_policy: :class:`.RetryPolicy`
+        The policy deciding whether and when failed requests are retried. Defaults to :class:`.ExponentialBackoff`
+        with :class:`.RetryBudget`.
+    response_cache: Optional[:class:`ResponseCache`]
+        The cache for responses of ``GET`` requests. Disabled by default.
+    single_flight: :class:`bool`
+        Whether concurrent identical ``GET`` requests should share single in-flight request.
+        Only requests made in same :func:`request_lane` and with same timeout are shared.
+        :meth:`.request` returns same parsed JSON object to every caller, so it should not be mutated.
     state: :class:`State`
         The state.
     token: :class:`str`
@@ -456,11 +1159,16 @@ class HTTPClient:
 
     __slots__ = (
         '_base',
+        '_inflight',
         '_session',
         'bot',
         'cookie',
+        'instrumentation',
         'max_retries',
         'rate_limiter',
+        'response_cache',
+        'retry_policy',
+        'single_flight',
         'state',
         'token',
         'user_agent',
@@ -473,10 +1181,14 @@ class HTTPClient:
         base: typing.Optional[str] = None,
         bot: bool = True,
         cookie: typing.Optional[str] = None,
+        instrumentation: typing.Optional[HTTPInstrumentation] = None,
         max_retries: typing.Optional[int] = None,
         rate_limiter: UndefinedOr[
             typing.Optional[typing.Union[Callable[[HTTPClient], typing.Optional[RateLimiter]], RateLimiter]]
         ] = UNDEFINED,
+        response_cache: typing.Optional[ResponseCache] = None,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        single_flight: bool = True,
         state: State,
         session: typing.Union[utils.MaybeAwaitableFunc[[HTTPClient], aiohttp.ClientSession], aiohttp.ClientSession],
         user_agent: typing.Optional[str] = None,
@@ -489,6 +1201,7 @@ class HTTPClient:
             utils.MaybeAwaitableFunc[[HTTPClient], aiohttp.ClientSession], aiohttp.ClientSession
         ] = session
         self.cookie: typing.Optional[str] = cookie
+        self.instrumentation: typing.Optional[HTTPInstrumentation] = instrumentation
         self.max_retries: int = max_retries or 3
 
         if rate_limiter is UNDEFINED:
@@ -498,6 +1211,12 @@ class HTTPClient:
         else:
             self.rate_limiter = rate_limiter
 
+        self._inflight: dict[typing.Any, asyncio.Task[typing.Any]] = {}
+        self.response_cache: typing.Optional[ResponseCache] = response_cache
+        if retry_policy is None:
+            retry_policy = ExponentialBackoff(max_retries=self.max_retries, budget=RetryBudget())
+        self.retry_policy: RetryPolicy = retry_policy
+        self.single_flight: bool = single_flight
         self.state: State = state
         self.token: str = token or ''
         self.user_agent: str = user_agent or DEFAULT_HTTP_USER_AGENT
@@ -672,39 +1391,59 @@ class HTTPClient:
         path = route.build()
         url = self._base + path
 
+        request_size = 0
         if json is not UNDEFINED:
-            kwargs['data'] = utils.to_json(json)
+            # Pass encoded bytes to aiohttp as is, to avoid encoding them again
+            kwargs['data'] = utils.to_json_bytes(json)
+            request_size = len(kwargs['data'])
+
+        instrumentation = self.instrumentation
+        if instrumentation is not None:
+            kwargs.setdefault('trace_request_ctx', route)
 
         rate_limiter = self.rate_limiter
+        retry_policy = self.retry_policy
 
-        while True:
-            if rate_limiter:
-                rate_limit = rate_limiter.fetch_ratelimit_for(route, path)
-                if rate_limit:
-                    blocker: typing.Optional[RateLimitBlocker] = None
-                else:
-                    blocker = rate_limiter.fetch_blocker_for(route, path)
-                    await blocker.increment()
+        # Retrying requests that might have been processed must not have side effects
+        idempotent = method != 'POST' or 'Idempotency-Key' in headers
 
+        while True:
+            blocker: typing.Optional[RateLimitBlocker] = None
+            try:
+                if rate_limiter:
                     rate_limit = rate_limiter.fetch_ratelimit_for(route, path)
+                    if not rate_limit:
+                        pending = rate_limiter.fetch_blocker_for(route, path)
+                        if instrumentation is None:
+                            await pending.increment()
+                        else:
+                            started_at = monotonic()
+                            await pending.increment()
+                            instrumentation.on_blocker_wait(route, monotonic() - started_at)
+                        blocker = pending
 
-                if rate_limit:
-                    await rate_limit.block()
-            else:
-                blocker = None
+                        rate_limit = rate_limiter.fetch_ratelimit_for(route, path)
 
-            _L.debug('Sending request to %s %s with %s', method, path, kwargs.get('data'))
+                    if rate_limit:
+                        if instrumentation is None:
+                            await rate_limit.block()
+                        else:
+                            started_at = monotonic()
+                            await rate_limit.block()
+                            instrumentation.on_rate_limit_wait(route, monotonic() - started_at)
 
-            session = self._session
-            if callable(session):
-                session = await utils.maybe_coroutine(session, self)
-                # detect recursion
-                if callable(session):
-                    raise TypeError(f'Expected aiohttp.ClientSession, not {type(session)!r}')
-                # Do not call factory on future requests
-                self._session = session
+                _L.debug('Sending request to %s %s with %s', method, path, kwargs.get('data'))
 
-            try:
+                session = self._session
+                if callable(session):
+                    session = await utils.maybe_coroutine(session, self)
+                    # detect recursion
+                    if callable(session):
+                        raise TypeError(f'Expected aiohttp.ClientSession, not {type(session)!r}')
+                    # Do not call factory on future requests
+                    self._session = session
+
+                started_at = monotonic()
                 response = await self.send_request(
                     session,
                     method=method,
@@ -712,55 +1451,88 @@ class HTTPClient:
                     headers=headers,
                     **kwargs,
                 )
-            except OSError as exc:
+            except BaseException as exc:
+                # Otherwise the route would stay blocked forever, including on timeouts and cancellation
+                if blocker is not None:
+                    await blocker.decrement()
+
                 # TODO: Handle 10053?
-                if exc.errno in (54, 10054):  # Connection reset by peer
-                    await asyncio.sleep(1.5)
-                    continue
+                if isinstance(exc, OSError) and exc.errno in (54, 10054):  # Connection reset by peer
+                    delay = retry_policy.compute_delay(
+                        retries,
+                        'connection_reset',
+                        method=method,
+                        path=route.route.path,
+                        idempotent=idempotent,
+                    )
+                    if delay is not None:
+                        retries += 1
+                        if instrumentation is not None:
+                            instrumentation.on_retry(route, 'connection_reset')
+                        await asyncio.sleep(delay)
+                        continue
                 raise
 
+            if instrumentation is not None:
+                instrumentation.on_response(
+                    route,
+                    response,
+                    latency=monotonic() - started_at,
+                    request_size=request_size,
+                )
+
             if rate_limiter:
-                await rate_limiter.on_response(route, path, response)
-                if blocker:
-                    await blocker.decrement()
+                try:
+                    await rate_limiter.on_response(route, path, response)
+                finally:
+                    if blocker is not None:
+                        await blocker.decrement()
 
             if response.status >= 400:
                 _L.debug('%s %s has returned %s', method, path, response.status)
 
-                if response.status == 525:
-                    await asyncio.sleep(1)
-                    continue
-
-                retries += 1
+                status = response.status
+                if status in (429, 502, 525):
+                    retry_after: typing.Optional[float] = None
+                    ignoring = False
 
-                if response.status == 502:
-                    if retries >= self.max_retries:
-                        data = await utils._json_or_text(response)
-                        raise BadGateway(response, data)
-                    continue
-
-                elif response.status == 429:
-                    if retries < self.max_retries:
+                    if status == 429:
                         data = await utils._json_or_text(response)
 
                         if isinstance(data, dict):
                             # Special case here
                             ignoring = data.get('type') == 'DiscriminatorChangeRatelimited'
-                            retry_after: float = data.get('retry_after', 0) / 1000.0
+                            retry_after = data.get('retry_after', 0) / 1000.0
                         else:
-                            ignoring = False
                             retry_after = 1
 
-                        if not ignoring:
+                    if not ignoring:
+                        delay = retry_policy.compute_delay(
+                            retries,
+                            str(status),  # type: ignore
+                            method=method,
+                            path=route.route.path,
+                            idempotent=idempotent,
+                            retry_after=retry_after,
+                        )
+                        if delay is not None:
                             _L.debug(
-                                'Ratelimited on %s %s, retrying in %.3f seconds',
+                                '%s %s has returned %s, retrying in %.3f seconds',
                                 method,
                                 url,
-                                retry_after,
+                                status,
+                                delay,
                             )
-                            await asyncio.sleep(retry_after)
+                            retries += 1
+                            if instrumentation is not None:
+                                instrumentation.on_retry(route, str(status))
+                            await asyncio.sleep(delay)
                             continue
 
+                if status == 502:
+                    data = await utils._json_or_text(response)
+                    raise BadGateway(response, data)
+
                 data = await utils._json_or_text(response)
                 if isinstance(data, dict) and isinstance(data.get('error'), dict):
                     error = data['error']
@@ -771,6 +1543,8 @@ class HTTPClient:
                     data['err'] = f'{code} {reason}: {description}'
 
                 raise _STATUS_TO_ERRORS.get(response.status, HTTPException)(response, data)
+
+            retry_policy.on_success()
             return response
 
     async def request(
@@ -820,6 +1594,116 @@ class HTTPClient:
         typing.Any
             The parsed JSON response.
         """
+        method = route.route.method
+        response_cache = self.response_cache
+
+        key = None
+        if (
+            method == 'GET'
+            and (self.single_flight or response_cache is not None)
+            and json is UNDEFINED
+            and kwargs.keys() <= {'params'}
+        ):
+            params = kwargs.get('params')
+            key = (
+                route.build(),
+                tuple(sorted(params.items())) if params else (),
+                accept_json,
+                mfa_ticket,
+                # UNDEFINED is not hashable, and defined values are wrapped to not collide with None
+                *(None if value is UNDEFINED else (value,) for value in (bot, token, user_agent)),
+            )
+            try:
+                hash(key)
+            except TypeError:
+                # Unhashable parameters
+                key = None
+
+        if key is None:
+            result = await self._request(
+                route,
+                accept_json=accept_json,
+                bot=bot,
+                json=json,
+                log=log,
+                mfa_ticket=mfa_ticket,
+                token=token,
+                user_agent=user_agent,
+                **kwargs,
+            )
+            if response_cache is not None and method != 'GET':
+                # The resource, or collection it is in, might have changed
+                path = route.build()
+                response_cache.invalidate(path)
+                response_cache.invalidate(path.rpartition('/')[0])
+            return result
+
+        if response_cache is not None:
+            result = response_cache.get(route, key)
+            if result is not UNDEFINED:
+                return result
+
+        if self.single_flight:
+            # Callers join only requests waiting in their own lane, with same timeout, as the shared task
+            # inherits context of caller that started it
+            flight_key = (key, _request_lane.get())
+            task = self._inflight.get(flight_key)
+            if task is None:
+                task = asyncio.ensure_future(
+                    self._request(
+                        route,
+                        accept_json=accept_json,
+                        bot=bot,
+                        log=log,
+                        mfa_ticket=mfa_ticket,
+                        token=token,
+                        user_agent=user_agent,
+                        **kwargs,
+                    )
+                )
+                self._inflight[flight_key] = task
+                task.add_done_callback(lambda task, /: self._on_inflight_done(flight_key, task))
+            else:
+                _L.debug('Reusing in-flight request to %s', key[0])
+
+            # Callers share the request, so one of them being cancelled must not cancel it for others
+            result = await asyncio.shield(task)
+        else:
+            result = await self._request(
+                route,
+                accept_json=accept_json,
+                bot=bot,
+                log=log,
+                mfa_ticket=mfa_ticket,
+                token=token,
+                user_agent=user_agent,
+                **kwargs,
+            )
+
+        if response_cache is not None:
+            response_cache.store(route, key, result)
+        return result
+
+    def _on_inflight_done(self, key: typing.Any, task: asyncio.Task[typing.Any], /) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Avoid 'exception was never retrieved' warnings if every caller was cancelled
+            task.exception()
+
+    async def _request(
+        self,
+        route: routes.CompiledRoute,
+        *,
+        accept_json: bool = True,
+        bot: UndefinedOr[bool] = UNDEFINED,
+        mfa_ticket: typing.Optional[str] = None,
+        json: UndefinedOr[typing.Any] = UNDEFINED,
+        log: bool = True,
+        token: UndefinedOr[typing.Optional[str]] = UNDEFINED,
+        user_agent: UndefinedOr[str] = UNDEFINED,
+        **kwargs,
+    ) -> typing.Any:
         response = await self.raw_request(
             route,
             accept_json=accept_json,
@@ -846,6 +1730,22 @@ class HTTPClient:
         response.close()
         return result
 
+    async def _stream(
+        self, route: routes.CompiledRoute, /, **kwargs
+    ) -> AsyncGenerator[tuple[typing.Optional[str], typing.Any], None]:
+        response = await self.raw_request(route, **kwargs)
+        try:
+            _L.debug(
+                '%s %s has received %s [streaming response]',
+                response.request_info.method,
+                response.request_info.url,
+                response.status,
+            )
+            async for item in utils._stream_json_items(response):
+                yield item
+        finally:
+            response.close()
+
     async def cleanup(self) -> None:
         """|coro|
 
@@ -2274,7 +3174,7 @@ class HTTPClient:
         if content is not UNDEFINED:
             payload['content'] = content
         if embeds is not UNDEFINED:
-            payload['embeds'] = [await embed.build(self.state) for embed in embeds]
+            payload['embeds'] = await utils._gather(*(embed.build(self.state) for embed in embeds))
 
         resp: raw.Message = await self.request(
             routes.CHANNELS_MESSAGE_EDIT.compile(
@@ -2419,6 +3319,7 @@ class HTTPClient:
         sort: typing.Optional[MessageSort] = None,
         nearby: typing.Optional[ULIDOr[BaseMessage]] = None,
         populate_users: typing.Optional[bool] = None,
+        cache_first: bool = False,
     ) -> list[Message]:
         """|coro|
 
@@ -2448,6 +3349,11 @@ class HTTPClient:
             It will also take half of limit rounded as the limits to each side. It also fetches the message specified.
         populate_users: :class:`bool`
             Whether to populate user (and member, if server channel) objects.
+        cache_first: :class:`bool`
+            Whether to serve messages from cache, if it is known to hold them, and retrieve only missing ones.
+            Retrieved messages are stored in cache. Defaults to ``False``.
+
+            This has no effect if ``nearby`` is provided, or ``sort`` is :attr:`.MessageSort.relevance`.
 
         Raises
         ------
@@ -2489,6 +3395,20 @@ class HTTPClient:
         List[:class:`.Message`]
             The messages retrieved.
         """
+        channel_id = resolve_id(channel)
+        cache = self.state.cache
+
+        if cache_first and cache is not None and nearby is None and sort is not MessageSort.relevance:
+            return await self._get_messages_cache_first(
+                cache,
+                channel_id,
+                limit=50 if limit is None else limit,
+                before=None if before is None else resolve_id(before),
+                after=None if after is None else resolve_id(after),
+                sort=sort,
+                populate_users=populate_users,
+            )
+
         params: raw.OptionsQueryMessages = {}
 
         if limit is not None:
@@ -2505,11 +3425,137 @@ class HTTPClient:
             params['include_users'] = utils._bool(populate_users)
 
         resp: raw.BulkMessageResponse = await self.request(
-            routes.CHANNELS_MESSAGE_QUERY.compile(channel_id=resolve_id(channel)),
+            routes.CHANNELS_MESSAGE_QUERY.compile(channel_id=channel_id),
             params=params,
         )
         return self.state.parser.parse_messages(resp)
 
+    async def _get_messages_cache_first(
+        self,
+        cache: Cache,
+        channel_id: str,
+        *,
+        limit: int,
+        before: typing.Optional[str],
+        after: typing.Optional[str],
+        sort: typing.Optional[MessageSort],
+        populate_users: typing.Optional[bool],
+    ) -> list[Message]:
+        ctx = caching._USER_REQUEST
+        oldest_first = sort is MessageSort.oldest
+
+        messages = cache.get_messages_range(
+            channel_id, ctx, before=before, after=after, limit=limit, oldest_first=oldest_first
+        )
+        if messages is not None:
+            return messages
+
+        # Serve the part right next to the anchor from cache, and retrieve the rest
+        cached = (
+            cache.get_messages_range(
+                channel_id, ctx, before=before, after=after, limit=limit, oldest_first=oldest_first, partial=True
+            )
+            or []
+        )
+        if cached:
+            if oldest_first:
+                after = cached[-1].id
+            else:
+                before = cached[-1].id
+            limit -= len(cached)
+
+        params: raw.OptionsQueryMessages = {'limit': limit}
+        if before is not None:
+            params['before'] = before
+        if after is not None:
+            params['after'] = after
+        if sort is not None:
+            params['sort'] = sort.value
+        if populate_users is not None:
+            params['include_users'] = utils._bool(populate_users)
+
+        resp: raw.BulkMessageResponse = await self.request(
+            routes.CHANNELS_MESSAGE_QUERY.compile(channel_id=channel_id),
+            params=params,
+        )
+        retrieved = self.state.parser.parse_messages(resp)
+        cache.store_messages_range(
+            channel_id, retrieved, ctx, before=before, after=after, limit=limit, oldest_first=oldest_first
+        )
+
+        cached.extend(retrieved)
+        return cached
+
+    def history(
+        self,
+        channel: ULIDOr[TextableChannel],
+        *,
+        limit: typing.Optional[int] = None,
+        before: typing.Optional[ULIDOr[BaseMessage]] = None,
+        after: typing.Optional[ULIDOr[BaseMessage]] = None,
+        oldest_first: bool = False,
+        populate_users: typing.Optional[bool] = None,
+        cache: bool = False,
+        page_size: int = 100,
+        prefetch: bool = True,
+    ) -> MessageIterator:
+        """Returns an asynchronous iterator over message history of a textable channel,
+        retrieving messages page by page.
+
+        You must have :attr:`~Permissions.read_message_history` to do this.
+
+        Parameters
+        ----------
+        channel: ULIDOr[:class:`.TextableChannel`]
+            The channel.
+        limit: Optional[:class:`int`]
+            The maximum number of messages to retrieve. If ``None``, the whole history is retrieved.
+        before: Optional[ULIDOr[:class:`.BaseMessage`]]
+            The message before which messages should be retrieved.
+        after: Optional[ULIDOr[:class:`.BaseMessage`]]
+            The message after which messages should be retrieved.
+        oldest_first: :class:`bool`
+            Whether to iterate from oldest messages to newest ones. Defaults to ``False``.
+        populate_users: Optional[:class:`bool`]
+            Whether to populate user (and member, if server channel) objects.
+        cache: :class:`bool`
+            Whether to store retrieved messages in cache, and serve already cached parts of history from there.
+            Defaults to ``False``.
+        page_size: :class:`int`
+            The maximum number of messages to retrieve per request. Must be between 1 and 100. Defaults to 100.
+        prefetch: :class:`bool`
+            Whether to retrieve next page while current one is consumed. Defaults to ``True``.
+
+        Raises
+        ------
+        :class:`HTTPException`
+            Same as :meth:`.get_messages`, raised during iteration.
+
+        Returns
+        -------
+        :class:`.MessageIterator`
+            The iterator.
+        """
+        return MessageIterator(
+            self,
+            resolve_id(channel),
+            before=None if before is None else resolve_id(before),
+            after=None if after is None else resolve_id(after),
+            oldest_first=oldest_first,
+            populate_users=populate_users,
+            cache=cache,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+
+    def _has_capacity(self, route: routes.CompiledRoute, /) -> bool:
+        rate_limiter = self.rate_limiter
+        if rate_limiter is None:
+            return True
+        rate_limit = rate_limiter.fetch_ratelimit_for(route, route.build())
+        return rate_limit is None or rate_limit.remaining > 0
+
     async def add_reaction_to_message(
         self,
         channel: ULIDOr[TextableChannel],
@@ -2711,6 +3757,76 @@ class HTTPClient:
         )
         return self.state.parser.parse_messages(resp)
 
+    def search_history(
+        self,
+        channel: ULIDOr[TextableChannel],
+        query: typing.Optional[str] = None,
+        *,
+        pinned: typing.Optional[bool] = None,
+        limit: typing.Optional[int] = None,
+        before: typing.Optional[ULIDOr[BaseMessage]] = None,
+        after: typing.Optional[ULIDOr[BaseMessage]] = None,
+        oldest_first: bool = False,
+        populate_users: typing.Optional[bool] = None,
+        page_size: int = 100,
+        prefetch: bool = True,
+    ) -> MessageIterator:
+        """Returns an asynchronous iterator over all messages matching search, retrieving them page by page.
+
+        Results are ordered by time, not by relevance. Exactly one of ``query`` and ``pinned`` must be provided.
+
+        .. note::
+            This can only be used by non-bot accounts.
+
+        Parameters
+        ----------
+        channel: ULIDOr[:class:`.TextableChannel`]
+            The channel to search in.
+        query: Optional[:class:`str`]
+            The full-text search query. See `MongoDB documentation <https://www.mongodb.com/docs/manual/text-search/>`_ for more information.
+        pinned: Optional[:class:`bool`]
+            Whether to search for (un-)pinned messages or not.
+        limit: Optional[:class:`int`]
+            The maximum number of messages to retrieve. If ``None``, all matching messages are retrieved.
+        before: Optional[ULIDOr[:class:`.BaseMessage`]]
+            The message before which messages should be retrieved.
+        after: Optional[ULIDOr[:class:`.BaseMessage`]]
+            The message after which messages should be retrieved.
+        oldest_first: :class:`bool`
+            Whether to iterate from oldest messages to newest ones. Defaults to ``False``.
+        populate_users: Optional[:class:`bool`]
+            Whether to populate user (and member, if server channel) objects.
+        page_size: :class:`int`
+            The maximum number of messages to retrieve per request. Must be between 1 and 100. Defaults to 100.
+        prefetch: :class:`bool`
+            Whether to retrieve next page while current one is consumed. Defaults to ``True``.
+
+        Raises
+        ------
+        :class:`HTTPException`
+            Same as :meth:`.search_for_messages`, raised during iteration.
+
+        Returns
+        -------
+        :class:`.MessageIterator`
+            The iterator.
+        """
+        if query is None and pinned is None:
+            raise TypeError('Either query or pinned must be provided')
+        return MessageIterator(
+            self,
+            resolve_id(channel),
+            query=query,
+            pinned=pinned,
+            before=None if before is None else resolve_id(before),
+            after=None if after is None else resolve_id(after),
+            oldest_first=oldest_first,
+            populate_users=populate_users,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+
     async def send_message(
         self,
         channel: ULIDOr[TextableChannel],
@@ -2853,16 +3969,14 @@ class HTTPClient:
         if content is not None:
             payload['content'] = content
         if attachments is not None:
-            payload['attachments'] = [
-                await resolve_resource(self.state, attachment, tag='attachments') for attachment in attachments
-            ]
+            payload['attachments'] = await resolve_resources(self.state, attachments, tag='attachments')
         if replies is not None:
             payload['replies'] = [
                 (reply.build() if isinstance(reply, Reply) else {'id': resolve_id(reply), 'mention': False})
                 for reply in replies
             ]
         if embeds is not None:
-            payload['embeds'] = [await embed.build(self.state) for embed in embeds]
+            payload['embeds'] = await utils._gather(*(embed.build(self.state) for embed in embeds))
         if masquerade is not None:
             payload['masquerade'] = masquerade.build()
         if interactions is not None:
@@ -4969,15 +6083,61 @@ class HTTPClient:
         List[:class:`.Member`]
             The retrieved members.
         """
+        members: list[Member] = []
+        users: list[User] = []
+
+        # Decode response incrementally, as member lists of large servers take a lot of memory
+        async for item in self.stream_members(server, exclude_offline=exclude_offline):
+            if isinstance(item, Member):
+                members.append(item)
+            else:
+                users.append(item)
+
+        # Users are in same order as members, but may be sent before them
+        for member, user in zip(members, users):
+            member._user = user
+        return members
+
+    async def stream_members(
+        self, server: ULIDOr[BaseServer], *, exclude_offline: typing.Optional[bool] = None
+    ) -> AsyncGenerator[typing.Union[Member, User], None]:
+        """Retrieves all server members, decoding them as response is received.
+
+        Unlike :meth:`.get_members`, memory usage does not depend on how many members the server has.
+
+        Members and users are yielded in order they appear in response, and users are in same order as members.
+        Members do not have user objects attached to them, and :attr:`.Member.user` is resolved from cache.
+
+        Parameters
+        ----------
+        server: ULIDOr[:class:`.BaseServer`]
+            The server.
+        exclude_offline: Optional[:class:`bool`]
+            Whether to exclude offline users.
+
+        Raises
+        ------
+        :class:`HTTPException`
+            Same as :meth:`.get_members`.
+
+        Yields
+        ------
+        Union[:class:`.Member`, :class:`.User`]
+            The retrieved members and users.
+        """
         params: raw.OptionsFetchAllMembers = {}
         if exclude_offline is not None:
             params['exclude_offline'] = utils._bool(exclude_offline)
-        resp: raw.AllMemberResponse = await self.request(
+
+        parser = self.state.parser
+        async for key, payload in self._stream(
             routes.SERVERS_MEMBER_FETCH_ALL.compile(server_id=resolve_id(server)),
-            log=False,
             params=params,
-        )
-        return self.state.parser.parse_members_with_users(resp)
+        ):
+            if key == 'members':
+                yield parser.parse_member(payload)
+            elif key == 'users':
+                yield parser.parse_user(payload)
 
     async def get_member_list(
         self, server: ULIDOr[BaseServer], *, exclude_offline: typing.Optional[bool] = None
@@ -5098,6 +6258,167 @@ class HTTPClient:
             routes.SERVERS_MEMBER_REMOVE.compile(server_id=resolve_id(server), member_id=_resolve_member_id(member))
         )
 
+    def _bulk_concurrency(self, route: routes.CompiledRoute, /) -> int:
+        # Release whole ratelimit bucket at once, if it is known
+        rate_limiter = self.rate_limiter
+        if rate_limiter is not None:
+            rate_limit = rate_limiter.fetch_ratelimit_for(route, route.build())
+            if isinstance(rate_limit, DefaultRateLimit):
+                return rate_limit.limit
+        return 10
+
+    def _bulk(
+        self,
+        route: routes.CompiledRoute,
+        targets: Iterable[typing.Union[str, BaseUser, BaseMember]],
+        func: Callable[[str], Awaitable[T]],
+        /,
+        *,
+        concurrency: typing.Optional[int],
+        lane: RequestLane,
+    ) -> BulkOperation[T]:
+        async def perform(target: str, /) -> T:
+            with request_lane(lane):
+                return await func(target)
+
+        return BulkOperation(
+            map(_resolve_member_id, targets),
+            perform,
+            concurrency=self._bulk_concurrency(route) if concurrency is None else concurrency,
+        )
+
+    def bulk_ban(
+        self,
+        server: ULIDOr[BaseServer],
+        users: Iterable[typing.Union[str, BaseUser, BaseMember]],
+        *,
+        reason: typing.Optional[str] = None,
+        concurrency: typing.Optional[int] = None,
+        lane: RequestLane = RequestLane.interactive,
+    ) -> BulkOperation[Ban]:
+        """Bans many users from a server concurrently.
+
+        This is same as calling :meth:`.ban` for each user, but requests are made concurrently
+        and queued by rate limiter, instead of one after another.
+
+        Parameters
+        ----------
+        server: ULIDOr[:class:`.BaseServer`]
+            The server.
+        users: Iterable[Union[:class:`str`, :class:`.BaseUser`, :class:`.BaseMember`]]
+            The users to ban.
+        reason: Optional[:class:`str`]
+            The ban reason. Can be only up to 1024 characters long.
+        concurrency: Optional[:class:`int`]
+            How many users to ban at once. Defaults to size of ratelimit bucket, if known.
+        lane: :class:`.RequestLane`
+            The lane to queue requests in. Defaults to :attr:`.RequestLane.interactive`.
+
+        Returns
+        -------
+        :class:`.BulkOperation`
+            The operation yielding :class:`.Ban` for each user. Iterating over it again retries failed users.
+        """
+        server_id = resolve_id(server)
+
+        def ban(user_id: str, /) -> Awaitable[Ban]:
+            return self.ban(server_id, user_id, reason=reason)
+
+        return self._bulk(
+            routes.SERVERS_BAN_CREATE.compile(server_id=server_id, user_id=''),
+            users,
+            ban,
+            concurrency=concurrency,
+            lane=lane,
+        )
+
+    def bulk_kick(
+        self,
+        server: ULIDOr[BaseServer],
+        members: Iterable[typing.Union[str, BaseUser, BaseMember]],
+        *,
+        concurrency: typing.Optional[int] = None,
+        lane: RequestLane = RequestLane.interactive,
+    ) -> BulkOperation[None]:
+        """Kicks many members from a server concurrently.
+
+        This is same as calling :meth:`.kick_member` for each member, but requests are made concurrently
+        and queued by rate limiter, instead of one after another.
+
+        Parameters
+        ----------
+        server: ULIDOr[:class:`.BaseServer`]
+            The server.
+        members: Iterable[Union[:class:`str`, :class:`.BaseUser`, :class:`.BaseMember`]]
+            The members to kick.
+        concurrency: Optional[:class:`int`]
+            How many members to kick at once. Defaults to size of ratelimit bucket, if known.
+        lane: :class:`.RequestLane`
+            The lane to queue requests in. Defaults to :attr:`.RequestLane.interactive`.
+
+        Returns
+        -------
+        :class:`.BulkOperation`
+            The operation. Iterating over it again retries failed members.
+        """
+        server_id = resolve_id(server)
+
+        def kick(member_id: str, /) -> Awaitable[None]:
+            return self.kick_member(server_id, member_id)
+
+        return self._bulk(
+            routes.SERVERS_MEMBER_REMOVE.compile(server_id=server_id, member_id=''),
+            members,
+            kick,
+            concurrency=concurrency,
+            lane=lane,
+        )
+
+    def bulk_edit_members(
+        self,
+        server: ULIDOr[BaseServer],
+        members: Iterable[typing.Union[str, BaseUser, BaseMember]],
+        *,
+        concurrency: typing.Optional[int] = None,
+        lane: RequestLane = RequestLane.interactive,
+        **options: typing.Any,
+    ) -> BulkOperation[Member]:
+        """Edits many members concurrently, using same options for each of them.
+
+        This is same as calling :meth:`.edit_member` for each member, but requests are made concurrently
+        and queued by rate limiter, instead of one after another.
+
+        Parameters
+        ----------
+        server: ULIDOr[:class:`.BaseServer`]
+            The server.
+        members: Iterable[Union[:class:`str`, :class:`.BaseUser`, :class:`.BaseMember`]]
+            The members to edit.
+        concurrency: Optional[:class:`int`]
+            How many members to edit at once. Defaults to size of ratelimit bucket, if known.
+        lane: :class:`.RequestLane`
+            The lane to queue requests in. Defaults to :attr:`.RequestLane.interactive`.
+        **options
+            The options to pass to :meth:`.edit_member`, such as ``roles`` or ``timeout``.
+
+        Returns
+        -------
+        :class:`.BulkOperation`
+            The operation yielding updated :class:`.Member` for each member. Iterating over it again retries failed members.
+        """
+        server_id = resolve_id(server)
+
+        def edit(member_id: str, /) -> Awaitable[Member]:
+            return self.edit_member(server_id, member_id, **options)
+
+        return self._bulk(
+            routes.SERVERS_MEMBER_EDIT.compile(server_id=server_id, member_id=''),
+            members,
+            edit,
+            concurrency=concurrency,
+            lane=lane,
+        )
+
     async def set_server_permissions_for_role(
         self,
         server: ULIDOr[BaseServer],
@@ -5851,17 +7172,23 @@ class HTTPClient:
             else:
                 payload['description'] = description
 
+        uploads: dict[str, Awaitable[str]] = {}
+
         if icon is not UNDEFINED:
             if icon is None:
                 remove.append('Icon')
             else:
-                payload['icon'] = await resolve_resource(self.state, icon, tag='icons')
+                uploads['icon'] = resolve_resource(self.state, icon, tag='icons')
 
         if banner is not UNDEFINED:
             if banner is None:
                 remove.append('Banner')
             else:
-                payload['banner'] = await resolve_resource(self.state, banner, tag='banners')
+                uploads['banner'] = resolve_resource(self.state, banner, tag='banners')
+
+        if uploads:
+            # Upload icon and banner at once
+            payload.update(zip(uploads, await utils._gather(*uploads.values())))  # type: ignore
 
         if categories is not UNDEFINED:
             if categories is None:
@@ -7371,16 +8698,14 @@ class HTTPClient:
         if content is not None:
             payload['content'] = content
         if attachments is not None:
-            payload['attachments'] = [
-                await resolve_resource(self.state, attachment, tag='attachments') for attachment in attachments
-            ]
+            payload['attachments'] = await resolve_resources(self.state, attachments, tag='attachments')
         if replies is not None:
             payload['replies'] = [
                 (reply.build() if isinstance(reply, Reply) else {'id': resolve_id(reply), 'mention': False})
                 for reply in replies
             ]
         if embeds is not None:
-            payload['embeds'] = [await embed.build(self.state) for embed in embeds]
+            payload['embeds'] = await utils._gather(*(embed.build(self.state) for embed in embeds))
         if masquerade is not None:
             payload['masquerade'] = masquerade.build()
         if interactions is not None:
@@ -8922,6 +10247,7 @@ class HTTPClient:
 __all__ = (
     'DEFAULT_HTTP_USER_AGENT',
     '_STATUS_TO_ERRORS',
+    'request_lane',
     'RateLimit',
     'RateLimitBlocker',
     'RateLimiter',
@@ -8929,5 +10255,11 @@ __all__ = (
     'DefaultRateLimitBlocker',
     '_NoopRateLimitBlocker',
     'DefaultRateLimiter',
+    'ResponseCache',
+    'DEFAULT_RESPONSE_CACHE_TTLS',
+    'TTLResponseCache',
+    'HTTPInstrumentation',
+    'RouteMetrics',
+    'HTTPMetrics',
     'HTTPClient',
 )
@@ -0,0 +1,296 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2024-present MCausc78
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import asyncio
+import logging
+import typing
+
+from . import routes
+from .enums import MessageSort
+
+if typing.TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from .abc import Messageable
+    from .http import HTTPClient
+    from .message import Message
+
+_L = logging.getLogger(__name__)
+
+T = typing.TypeVar('T')
+
+
+class PageIterator(ABC, typing.Generic[T]):
+    """An ABC for asynchronous iterators over paginated API results.
+
+    While items of one page are consumed, the next page is already being retrieved.
+
+    .. container:: operations
+
+        .. describe:: async for item in x
+
+            Iterates over all items, retrieving pages as needed.
+
+    Parameters
+    ----------
+    limit: Optional[:class:`int`]
+        The maximum number of items to retrieve. If ``None``, all items are retrieved.
+    page_size: :class:`int`
+        The maximum number of items to retrieve per request.
+    prefetch: :class:`bool`
+        Whether to retrieve next page while current one is consumed.
+
+    Attributes
+    ----------
+    limit: Optional[:class:`int`]
+        The maximum number of items to retrieve.
+    page_size: :class:`int`
+        The maximum number of items to retrieve per request.
+    prefetch: :class:`bool`
+        Whether to retrieve next page while current one is consumed.
+    """
+
+    __slots__ = (
+        'limit',
+        'page_size',
+        'prefetch',
+    )
+
+    def __init__(self, *, limit: typing.Optional[int] = None, page_size: int = 100, prefetch: bool = True) -> None:
+        self.limit: typing.Optional[int] = limit
+        self.page_size: int = page_size
+        self.prefetch: bool = prefetch
+
+    @abstractmethod
+    async def fetch_page(self, limit: int, /) -> list[T]:
+        """|coro|
+
+        Retrieves next page, and advances the cursor past it.
+
+        Parameters
+        ----------
+        limit: :class:`int`
+            The maximum number of items to retrieve.
+
+        Returns
+        -------
+        List[T]
+            The retrieved items. If there are less than ``limit`` items, the iteration stops.
+        """
+        ...
+
+    def can_prefetch(self) -> bool:
+        """:class:`bool`: Whether next page can be retrieved ahead of time. Called only if :attr:`.prefetch` is ``True``."""
+        return True
+
+    def __aiter__(self) -> AsyncGenerator[T, None]:
+        return self._run()
+
+    async def flatten(self) -> list[T]:
+        """|coro|
+
+        Retrieves all items.
+
+        Returns
+        -------
+        List[T]
+            The items.
+        """
+        return [item async for item in self]
+
+    async def _run(self) -> AsyncGenerator[T, None]:
+        remaining = self.limit
+
+        def next_size() -> int:
+            return self.page_size if remaining is None else min(self.page_size, remaining)
+
+        size = next_size()
+        if size <= 0:
+            return
+
+        task: typing.Optional[asyncio.Future[list[T]]] = asyncio.ensure_future(self.fetch_page(size))
+        try:
+            while task is not None:
+                page = await task
+                task = None
+
+                if remaining is not None:
+                    remaining -= len(page)
+
+                deferred = False
+                if len(page) >= size:
+                    size = next_size()
+                    if size > 0:
+                        if self.prefetch and self.can_prefetch():
+                            task = asyncio.ensure_future(self.fetch_page(size))
+                        else:
+                            deferred = True
+
+                for item in page:
+                    yield item
+
+                if deferred:
+                    task = asyncio.ensure_future(self.fetch_page(size))
+        finally:
+            if task is not None:
+                task.cancel()
+
+
+class MessageIterator(PageIterator['Message']):
+    """A :class:`.PageIterator` over channel history or search results.
+
+    Parameters
+    ----------
+    http: :class:`.HTTPClient`
+        The HTTP client.
+    channel: Union[:class:`str`, :class:`.Messageable`]
+        The channel ID, or messageable to retrieve channel ID from.
+    query: Optional[:class:`str`]
+        The full-text search query. If this or ``pinned`` is provided, search results are iterated.
+    pinned: Optional[:class:`bool`]
+        Whether to search for (un-)pinned messages.
+    before: Optional[:class:`str`]
+        The message ID before which messages should be retrieved.
+    after: Optional[:class:`str`]
+        The message ID after which messages should be retrieved.
+    oldest_first: :class:`bool`
+        Whether to iterate from oldest messages to newest ones.
+    populate_users: Optional[:class:`bool`]
+        Whether to populate user (and member, if server channel) objects.
+    cache: :class:`bool`
+        Whether to store channel history in cache, and serve parts of it that are already cached from there.
+        Search results are never cached.
+    limit: Optional[:class:`int`]
+        The maximum number of messages to retrieve. If ``None``, all messages are retrieved.
+    page_size: :class:`int`
+        The maximum number of messages to retrieve per request. Must be between 1 and 100.
+    prefetch: :class:`bool`
+        Whether to retrieve next page while current one is consumed. Pages are not prefetched while
+        the ratelimit bucket is exhausted.
+    """
+
+    __slots__ = (
+        '_channel',
+        '_channel_id',
+        '_http',
+        'after',
+        'before',
+        'cache',
+        'oldest_first',
+        'pinned',
+        'populate_users',
+        'query',
+    )
+
+    def __init__(
+        self,
+        http: HTTPClient,
+        channel: typing.Union[str, Messageable],
+        /,
+        *,
+        query: typing.Optional[str] = None,
+        pinned: typing.Optional[bool] = None,
+        before: typing.Optional[str] = None,
+        after: typing.Optional[str] = None,
+        oldest_first: bool = False,
+        populate_users: typing.Optional[bool] = None,
+        cache: bool = False,
+        limit: typing.Optional[int] = None,
+        page_size: int = 100,
+        prefetch: bool = True,
+    ) -> None:
+        super().__init__(limit=limit, page_size=page_size, prefetch=prefetch)
+        self._channel: typing.Union[str, Messageable] = channel
+        self._channel_id: typing.Optional[str] = channel if isinstance(channel, str) else None
+        self._http: HTTPClient = http
+        self.after: typing.Optional[str] = after
+        self.before: typing.Optional[str] = before
+        self.cache: bool = cache
+        self.oldest_first: bool = oldest_first
+        self.pinned: typing.Optional[bool] = pinned
+        self.populate_users: typing.Optional[bool] = populate_users
+        self.query: typing.Optional[str] = query
+
+    def __repr__(self) -> str:
+        return (
+            f'<{self.__class__.__name__} channel_id={self._channel_id!r} before={self.before!r} '
+            f'after={self.after!r} oldest_first={self.oldest_first!r}>'
+        )
+
+    def can_prefetch(self) -> bool:
+        channel_id = self._channel_id
+        if channel_id is None:
+            return True
+        route = routes.CHANNELS_MESSAGE_QUERY if self._is_history() else routes.CHANNELS_MESSAGE_SEARCH
+        # Prefetching would only wait for the bucket to reset, in front of other requests
+        return self._http._has_capacity(route.compile(channel_id=channel_id))
+
+    def _is_history(self) -> bool:
+        return self.query is None and self.pinned is None
+
+    async def fetch_page(self, limit: int, /) -> list[Message]:
+        channel_id = self._channel_id
+        if channel_id is None:
+            channel_id = self._channel_id = await self._channel.fetch_channel_id()  # type: ignore
+
+        sort = MessageSort.oldest if self.oldest_first else MessageSort.latest
+        http = self._http
+
+        if self._is_history():
+            messages = await http.get_messages(
+                channel_id,
+                limit=limit,
+                before=self.before,
+                after=self.after,
+                sort=sort,
+                populate_users=self.populate_users,
+                cache_first=self.cache and http.state.cache is not None,
+            )
+        else:
+            messages = await http.search_for_messages(
+                channel_id,
+                self.query,
+                pinned=self.pinned,
+                limit=limit,
+                before=self.before,
+                after=self.after,
+                sort=sort,
+                populate_users=self.populate_users,
+            )
+
+        if messages:
+            if self.oldest_first:
+                self.after = messages[-1].id
+            else:
+                self.before = messages[-1].id
+        return messages
+
+
+__all__ = (
+    'PageIterator',
+    'MessageIterator',
+)
@@ -0,0 +1,304 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2024-present MCausc78
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import logging
+import random
+import typing
+
+from . import utils
+
+_L = logging.getLogger(__name__)
+
+RetryReason = typing.Literal['429', '502', '525', 'connection_reset', 'connection_error']
+
+# Reasons for which request was certainly not processed by server, so retrying is always safe
+_SAFE_REASONS: typing.Final[frozenset[str]] = frozenset(('429', '525'))
+
+
+class RetryPolicy(ABC):
+    """An ABC that decides whether and when failed requests and connection attempts are retried.
+
+    Used by :class:`.HTTPClient`, :class:`.CDNClient` and :class:`.Shard`.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def compute_delay(
+        self,
+        attempt: int,
+        reason: RetryReason,
+        /,
+        *,
+        method: str,
+        path: str,
+        idempotent: bool,
+        retry_after: typing.Optional[float] = None,
+    ) -> typing.Optional[float]:
+        """Computes how long to wait before retrying.
+
+        Parameters
+        ----------
+        attempt: :class:`int`
+            The number of retries already made, starting from ``0``.
+        reason: :class:`str`
+            Why the attempt failed: ``'429'``, ``'502'`` or ``'525'`` for HTTP statuses, ``'connection_reset'`` if
+            the connection was reset by peer, or ``'connection_error'`` for other connection failures.
+        method: :class:`str`
+            The HTTP method.
+        path: :class:`str`
+            The route's path template, such as ``'/channels/{channel_id}/messages'``. For :class:`.CDNClient` this is
+            the request path, and for :class:`.Shard` this is the WebSocket URL.
+        idempotent: :class:`bool`
+            Whether performing the request twice has same effect as performing it once.
+        retry_after: Optional[:class:`float`]
+            The delay in seconds requested by server, if any.
+
+        Returns
+        -------
+        Optional[:class:`float`]
+            The delay in seconds, or ``None`` if the attempt should not be retried.
+        """
+        ...
+
+    def on_success(self) -> None:
+        """Called when request or connection attempt succeeds."""
+        pass
+
+
+class RetryBudget:
+    """Limits retries to a fraction of successful requests, so that outages do not cause retry storms.
+
+    Every retry withdraws one token, and every success deposits ``ratio`` tokens.
+
+    Parameters
+    ----------
+    max_tokens: :class:`float`
+        The maximum number of tokens, and how many tokens budget starts with.
+    ratio: :class:`float`
+        How many tokens single success deposits.
+
+    Attributes
+    ----------
+    max_tokens: :class:`float`
+        The maximum number of tokens.
+    ratio: :class:`float`
+        How many tokens single success deposits.
+    tokens: :class:`float`
+        The number of available tokens.
+    """
+
+    __slots__ = (
+        'max_tokens',
+        'ratio',
+        'tokens',
+    )
+
+    def __init__(self, *, max_tokens: float = 10.0, ratio: float = 0.1) -> None:
+        self.max_tokens: float = max_tokens
+        self.ratio: float = ratio
+        self.tokens: float = max_tokens
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} tokens={self.tokens:.1f} max_tokens={self.max_tokens}>'
+
+    def try_withdraw(self) -> bool:
+        """Withdraws token for retry.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether retry is allowed.
+        """
+        if self.tokens < 1.0:
+            return False
+        self.tokens -= 1.0
+        return True
+
+    def deposit(self) -> None:
+        """Deposits tokens for successful request."""
+        self.tokens = min(self.tokens + self.ratio, self.max_tokens)
+
+
+class ExponentialBackoff(RetryPolicy):
+    """A :class:`.RetryPolicy` that waits exponentially longer after each failed attempt, with random jitter.
+
+    Failures after which request might have been processed by server (connection resets and 502 statuses)
+    are retried only for idempotent requests, unless ``retry_non_idempotent`` is ``True``.
+
+    Parameters
+    ----------
+    base: :class:`float`
+        The delay in seconds before first retry.
+    factor: :class:`float`
+        How much delay grows after each retry.
+    max_delay: :class:`float`
+        The maximum delay in seconds.
+    jitter: :class:`float`
+        The fraction of delay that is randomized, between ``0.0`` (none) and ``1.0`` (full jitter).
+    max_retries: :class:`int`
+        How many times to retry single request.
+    retry_non_idempotent: :class:`bool`
+        Whether to retry non-idempotent requests after failures they might have been processed by.
+    budget: Optional[:class:`.RetryBudget`]
+        The budget limiting retries across all requests. Retries after 429 statuses do not use it.
+    overrides: Optional[Dict[:class:`str`, :class:`.RetryPolicy`]]
+        The policies to use instead for specific requests, keyed by ``'METHOD /path/template'`` or by HTTP method.
+        Route keys take precedence over method keys.
+
+    Attributes
+    ----------
+    base: :class:`float`
+        The delay in seconds before first retry.
+    factor: :class:`float`
+        How much delay grows after each retry.
+    max_delay: :class:`float`
+        The maximum delay in seconds.
+    jitter: :class:`float`
+        The fraction of delay that is randomized.
+    max_retries: :class:`int`
+        How many times to retry single request.
+    retry_non_idempotent: :class:`bool`
+        Whether to retry non-idempotent requests after failures they might have been processed by.
+    budget: Optional[:class:`.RetryBudget`]
+        The budget limiting retries across all requests.
+    overrides: Dict[:class:`str`, :class:`.RetryPolicy`]
+        The policies to use instead for specific requests.
+    """
+
+    __slots__ = (
+        'base',
+        'budget',
+        'factor',
+        'jitter',
+        'max_delay',
+        'max_retries',
+        'overrides',
+        'retry_non_idempotent',
+    )
+
+    def __init__(
+        self,
+        *,
+        base: float = 0.5,
+        factor: float = 2.0,
+        max_delay: float = 30.0,
+        jitter: float = 1.0,
+        max_retries: int = 3,
+        retry_non_idempotent: bool = False,
+        budget: typing.Optional[RetryBudget] = None,
+        overrides: typing.Optional[dict[str, RetryPolicy]] = None,
+    ) -> None:
+        self.base: float = base
+        self.budget: typing.Optional[RetryBudget] = budget
+        self.factor: float = factor
+        self.jitter: float = jitter
+        self.max_delay: float = max_delay
+        self.max_retries: int = max_retries
+        self.overrides: dict[str, RetryPolicy] = overrides or {}
+        self.retry_non_idempotent: bool = retry_non_idempotent
+
+    def __repr__(self) -> str:
+        return (
+            f'<{self.__class__.__name__} base={self.base} factor={self.factor} max_delay={self.max_delay} '
+            f'max_retries={self.max_retries}>'
+        )
+
+    def backoff(self, attempt: int, /) -> float:
+        """Computes delay before retry, ignoring limits.
+
+        Parameters
+        ----------
+        attempt: :class:`int`
+            The number of retries already made, starting from ``0``.
+
+        Returns
+        -------
+        :class:`float`
+            The delay in seconds.
+        """
+        delay = min(self.base * self.factor**attempt, self.max_delay)
+        if self.jitter:
+            delay -= delay * self.jitter * random.random()
+        return delay
+
+    @utils.copy_doc(RetryPolicy.compute_delay)
+    def compute_delay(
+        self,
+        attempt: int,
+        reason: RetryReason,
+        /,
+        *,
+        method: str,
+        path: str,
+        idempotent: bool,
+        retry_after: typing.Optional[float] = None,
+    ) -> typing.Optional[float]:
+        overrides = self.overrides
+        if overrides:
+            policy = overrides.get(f'{method} {path}') or overrides.get(method)
+            if policy is not None:
+                return policy.compute_delay(
+                    attempt,
+                    reason,
+                    method=method,
+                    path=path,
+                    idempotent=idempotent,
+                    retry_after=retry_after,
+                )
+
+        if attempt >= self.max_retries:
+            return None
+
+        if not idempotent and not self.retry_non_idempotent and reason not in _SAFE_REASONS:
+            _L.debug('Not retrying non-idempotent %s %s after %s', method, path, reason)
+            return None
+
+        # Server told when to retry, so retrying does not add load
+        budget = self.budget
+        if budget is not None and reason != '429' and not budget.try_withdraw():
+            _L.debug('Retry budget exhausted, not retrying %s %s after %s', method, path, reason)
+            return None
+
+        if retry_after is not None:
+            return retry_after
+        return self.backoff(attempt)
+
+    @utils.copy_doc(RetryPolicy.on_success)
+    def on_success(self) -> None:
+        if self.budget is not None:
+            self.budget.deposit()
+        for policy in self.overrides.values():
+            policy.on_success()
+
+
+__all__ = (
+    'RetryReason',
+    'RetryPolicy',
+    'RetryBudget',
+    'ExponentialBackoff',
+)
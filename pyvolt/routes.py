@@ -24,6 +24,7 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+from string import Formatter
 import typing
 from urllib.parse import quote
 
@@ -32,14 +33,45 @@ from .core import UndefinedOr, UNDEFINED
 HTTPMethod = typing.Literal['GET', 'POST', 'PATCH', 'DELETE', 'PUT']
 
 
+def _compile_template(template: str, /) -> tuple[str, tuple[str, ...]]:
+    # Turns '/channels/{channel_id}' into ('/channels/%s', ('channel_id',)) for use with % operator
+    parts = []
+    fields = []
+    for literal, field, _, _ in Formatter().parse(template):
+        parts.append(literal.replace('%', '%%'))
+        if field is not None:
+            parts.append('%s')
+            fields.append(field)
+    return ''.join(parts), tuple(fields)
+
+
+def _quote(value: typing.Any, /) -> str:
+    value = str(value)
+    # IDs are alphanumeric, and quoting them is no-op
+    if value.isalnum() and value.isascii():
+        return value
+    return quote(value)
+
+
+def _format(template: str, fields: tuple[str, ...], args: dict[str, typing.Any], /) -> str:
+    if not fields:
+        return template
+    return template % tuple([_quote(args[field]) for field in fields])
+
+
 class CompiledRoute:
-    """Represents compiled Revolt API route."""
+    """Represents compiled Revolt API route.
 
-    __slots__ = ('route', 'args')
+    The path and ratelimit key are built once, when first requested. :attr:`.args` should not be modified after that.
+    """
+
+    __slots__ = ('route', 'args', '_path', '_ratelimit_key')
 
     def __init__(self, route: Route, /, **args: typing.Any) -> None:
         self.route: Route = route
         self.args: dict[str, typing.Any] = args
+        self._path: typing.Optional[str] = None
+        self._ratelimit_key: typing.Optional[str] = None
 
     def __repr__(self) -> str:
         return f'<CompiledRoute route={self.route!r} args={self.args!r}>'
@@ -48,16 +80,28 @@ class CompiledRoute:
         return f'CompiledRoute({self.route}, **{self.args!r})'
 
     def build(self) -> str:
-        return self.route.path.format_map({k: quote(str(v)) for k, v in self.args.items()})
+        path = self._path
+        if path is None:
+            route = self.route
+            path = self._path = _format(route._path_template, route._path_fields, self.args)
+        return path
 
     def build_ratelimit_key(self) -> str:
-        return self.route.ratelimit_key_template.format_map({k: quote(str(v)) for k, v in self.args.items()})
+        key = self._ratelimit_key
+        if key is None:
+            route = self.route
+            key = self._ratelimit_key = _format(route._ratelimit_key_template, route._ratelimit_key_fields, self.args)
+        return key
 
 
 class Route:
     """Represents Revolt API route."""
 
     __slots__ = (
+        '_path_fields',
+        '_path_template',
+        '_ratelimit_key_fields',
+        '_ratelimit_key_template',
         'method',
         'path',
         'ratelimit_key_template',
@@ -96,6 +140,10 @@ class Route:
             ratelimit_key_template = path
         self.ratelimit_key_template: str = ratelimit_key_template
 
+        # Parse templates once, instead of on every request
+        self._path_template, self._path_fields = _compile_template(path)
+        self._ratelimit_key_template, self._ratelimit_key_fields = _compile_template(ratelimit_key_template)
+
     def __repr__(self) -> str:
         return f'<Route method={self.method!r} path={self.path!r}>'
 
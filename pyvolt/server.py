@@ -1751,11 +1751,11 @@ class Server(BaseServer):
         if not cache:
             return
 
-        from .channel import ServerChannel
-
-        channel = cache.get_channel(channel_id, caching._USER_REQUEST)
-        if channel and isinstance(channel, ServerChannel) and (channel.server_id == self.id or channel.server_id == ''):
-            return channel
+        channels = cache.get_server_channels_mapping_of(self.id, caching._USER_REQUEST)
+        if channels is not None:
+            channel = channels.get(channel_id)
+            if channel is not None:
+                return channel
 
         if not self.internal_channels[0]:
             for ch in self.internal_channels[1]:
@@ -1792,19 +1792,15 @@ class Server(BaseServer):
         if cache is None:
             return []
 
-        from .channel import TextChannel, VoiceChannel
+        mapping = cache.get_server_channels_mapping_of(self.id, caching._USER_REQUEST)
+        if mapping is None:
+            return []
 
         channels = []
         for channel_id in self.internal_channels[1]:
             id: str = channel_id  # type: ignore
-            channel = cache.get_channel(id, caching._USER_REQUEST)
-
-            if channel:
-                if channel.__class__ not in (
-                    TextChannel,
-                    VoiceChannel,
-                ) or not isinstance(channel, (TextChannel, VoiceChannel)):
-                    raise TypeError(f'Cache have given us incorrect channel type: {channel.__class__!r}')
+            channel = mapping.get(id)
+            if channel is not None:
                 channels.append(channel)
         return channels
 
@@ -35,6 +35,7 @@ from . import utils
 from .core import ULIDOr, resolve_id, __version__ as version
 from .enums import ShardFormat
 from .errors import PyvoltException, ShardClosedError, AuthenticationError, ConnectError
+from .retry import ExponentialBackoff, RetryPolicy, RetryReason
 
 if typing.TYPE_CHECKING:
     from datetime import datetime
@@ -53,6 +54,9 @@ else:
 
 _L = logging.getLogger(__name__)
 
+# aiohttp 3.11+ can send already encoded text frames
+_HAS_SEND_FRAME: typing.Final[bool] = hasattr(aiohttp.ClientWebSocketResponse, 'send_frame')
+
 
 class Close(Exception):
     __slots__ = ()
@@ -108,7 +112,7 @@ class Shard:
     bot: :class:`bool`
         Whether the token belongs to bot account. Defaults to ``True``.
     connect_delay: Optional[:class:`float`]
-        The duration in seconds to sleep when reconnecting to WebSocket due to aiohttp errors. Defaults to 2.
+        The base delay in seconds of default retry policy, used when reconnecting to WebSocket fails. Defaults to 2.
     format: :class:`ShardFormat`
         The message format to use when communicating with Revolt WebSocket.
     handler: Optional[:class:`.EventHandler`]
@@ -123,6 +127,11 @@ class Shard:
         Whether to reconnect when received pong nonce is not equal to current ping nonce. Defaults to ``True``.
     request_user_settings: Optional[List[:class:`str`]]
         The list of user setting keys to request.
+    retries: :class:`int`
+        How many times the default retry policy retries connecting to WebSocket. Defaults to 150.
+    retry_policy: :class:`.RetryPolicy`
+        The policy deciding whether and when failed connection attempts are retried. Defaults to
+        :class:`.ExponentialBackoff` built from :attr:`.connect_delay` and :attr:`.retries`.
     state: :class:`State`
         The state.
     token: :class:`str`
@@ -151,6 +160,7 @@ class Shard:
         'reconnect_on_timeout',
         'request_user_settings',
         'retries',
+        'retry_policy',
         'state',
         'token',
         'user_agent',
@@ -170,6 +180,7 @@ class Shard:
         reconnect_on_timeout: bool = True,
         request_user_settings: list[str] | None = None,
         retries: int | None = None,
+        retry_policy: RetryPolicy | None = None,
         session: utils.MaybeAwaitableFunc[[Shard], aiohttp.ClientSession] | aiohttp.ClientSession,
         state: State,
         user_agent: str | None = None,
@@ -194,6 +205,14 @@ class Shard:
         self.reconnect_on_timeout: bool = reconnect_on_timeout
         self.request_user_settings = request_user_settings
         self.retries: int = retries or 150
+        if retry_policy is None:
+            retry_policy = ExponentialBackoff(
+                base=connect_delay or 0.0,
+                factor=1.5,
+                max_delay=60.0,
+                max_retries=self.retries,
+            )
+        self.retry_policy: RetryPolicy = retry_policy
         self.state: State = state
         self.token: str = token
         self.user_agent: str = user_agent or DEFAULT_SHARD_USER_AGENT
@@ -317,7 +336,12 @@ class Shard:
 
     async def _send_json(self, d: raw.ServerEvent, /) -> None:
         _L.debug('sending %s', d)
-        await self.socket.send_str(utils.to_json(d))
+
+        payload = utils.to_json_bytes(d)
+        if _HAS_SEND_FRAME:
+            await self.socket.send_frame(payload, aiohttp.WSMsgType.TEXT)
+        else:
+            await self.socket.send_str(payload.decode('utf-8'))
 
     async def _send_msgpack(self, d: raw.ServerEvent, /) -> None:
         _L.debug('sending %s', d)
@@ -456,35 +480,41 @@ class Shard:
         _L.debug('Connecting to %s, format=%s', self.base, self.format)
 
         headers = self.get_headers()
+        retry_policy = self.retry_policy
         while True:
-            if i >= self.retries:
-                break
+            reason: RetryReason
             try:
-                return await self.ws_connect(
+                socket = await self.ws_connect(
                     session,
                     self.base,
                     headers=headers,
                     params=params,  # type: ignore # Not true
                 )
-            except OSError as exc:
-                if i == 0:
-                    _L.warning('Connection failed (code: %i)', exc.errno)
-                if exc.errno == 11001:
-                    await asyncio.sleep(1)
-                i += 1
             except aiohttp.WSServerHandshakeError as exc:
                 _L.debug('Server replied with %i', exc.code)
-                if exc.code in (502, 525):
-                    await asyncio.sleep(1.5)
-                    continue
-                raise exc from None
+                if exc.code not in (429, 502, 525):
+                    raise exc from None
+                errors.append(exc)
+                reason = str(exc.code)  # type: ignore
+            except OSError as exc:
+                if i == 0:
+                    _L.warning('Connection failed (code: %s)', exc.errno)
+                errors.append(exc)
+                reason = 'connection_reset' if exc.errno in (54, 10054) else 'connection_error'
             except Exception as exc:
-                i += 1
                 errors.append(exc)
-                _L.exception('Connection failed on %i attempt', i)
-                if self.connect_delay is not None:
-                    await asyncio.sleep(self.connect_delay)
-        raise ConnectError(self.retries, errors)
+                _L.exception('Connection failed on %i attempt', i + 1)
+                reason = 'connection_error'
+            else:
+                retry_policy.on_success()
+                return socket
+
+            delay = retry_policy.compute_delay(i, reason, method='GET', path=self.base, idempotent=True)
+            i += 1
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+        raise ConnectError(i, errors)
 
     async def connect(self) -> None:
         """|coro|
@@ -0,0 +1,837 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2024-present MCausc78
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
+import io
+import logging
+import os
+import pickle
+import sqlite3
+import typing
+
+from .cache import (
+    BaseCacheContext,
+    Cache,
+    CacheEntityType,
+    _SnapshotPickler,
+    _SnapshotUnpickler,
+)
+from .core import __version__ as version
+from .emoji import ServerEmoji
+from .user import User
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Sequence
+    from os import PathLike
+
+    from .channel import DMChannel, GroupChannel, ServerChannel, Channel, ChannelVoiceStateContainer
+    from .emoji import Emoji
+    from .message import Message
+    from .read_state import ReadState
+    from .server import Server, Member
+    from .state import State
+
+_L = logging.getLogger(__name__)
+
+V = typing.TypeVar('V')
+
+_SCHEMA_VERSION: typing.Final[int] = 1
+
+_SCHEMA: typing.Final[str] = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS users (
+    id TEXT PRIMARY KEY,
+    name_key TEXT,
+    display_name_key TEXT,
+    data BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS users_name_key ON users (name_key);
+CREATE INDEX IF NOT EXISTS users_display_name_key ON users (display_name_key);
+CREATE TABLE IF NOT EXISTS servers (id TEXT PRIMARY KEY, data BLOB NOT NULL);
+CREATE TABLE IF NOT EXISTS channels (
+    id TEXT PRIMARY KEY,
+    server_id TEXT,
+    private INTEGER NOT NULL,
+    name_key TEXT,
+    data BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS channels_server_id ON channels (server_id);
+CREATE INDEX IF NOT EXISTS channels_name_key ON channels (name_key);
+CREATE TABLE IF NOT EXISTS emojis (id TEXT PRIMARY KEY, server_id TEXT, name_key TEXT, data BLOB NOT NULL);
+CREATE INDEX IF NOT EXISTS emojis_server_id ON emojis (server_id);
+CREATE INDEX IF NOT EXISTS emojis_name_key ON emojis (name_key);
+CREATE TABLE IF NOT EXISTS read_states (channel_id TEXT PRIMARY KEY, data BLOB NOT NULL);
+CREATE TABLE IF NOT EXISTS messages (
+    channel_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    author_id TEXT NOT NULL,
+    server_id TEXT,
+    data BLOB NOT NULL,
+    PRIMARY KEY (channel_id, id)
+);
+CREATE INDEX IF NOT EXISTS messages_author_id ON messages (author_id);
+CREATE INDEX IF NOT EXISTS messages_server_id ON messages (server_id);
+CREATE TABLE IF NOT EXISTS server_members (
+    server_id TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    nick_key TEXT,
+    data BLOB NOT NULL,
+    PRIMARY KEY (server_id, user_id)
+);
+CREATE INDEX IF NOT EXISTS server_members_nick_key ON server_members (server_id, nick_key);
+CREATE INDEX IF NOT EXISTS server_members_user_id ON server_members (user_id);
+CREATE TABLE IF NOT EXISTS private_channels_by_user (user_id TEXT PRIMARY KEY, channel_id TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS channel_voice_states (channel_id TEXT PRIMARY KEY, data BLOB NOT NULL);
+"""
+
+# The key columns, followed by other columns except ``data``.
+_COLUMNS: typing.Final[dict[CacheEntityType, tuple[tuple[str, ...], tuple[str, ...]]]] = {
+    'users': (('id',), ('name_key', 'display_name_key')),
+    'servers': (('id',), ()),
+    'channels': (('id',), ('server_id', 'private', 'name_key')),
+    'emojis': (('id',), ('server_id', 'name_key')),
+    'read_states': (('channel_id',), ()),
+    'messages': (('channel_id', 'id'), ('author_id', 'server_id')),
+    'server_members': (('server_id', 'user_id'), ('nick_key',)),
+    'channel_voice_states': (('channel_id',), ()),
+}
+
+# The prefix lookups are done with ``key >= prefix AND key < prefix || _MAX_CHAR``.
+_MAX_CHAR: typing.Final[str] = '\U0010ffff'
+
+
+def _casefold(name: typing.Optional[str], /) -> typing.Optional[str]:
+    return name.casefold() if name else None
+
+
+def _name_condition(column: str, name: str, prefix: bool, /) -> tuple[str, tuple[str, ...]]:
+    name = name.casefold()
+    if prefix:
+        return f'{column} >= ? AND {column} < ?', (name, name + _MAX_CHAR)
+    return f'{column} = ?', (name,)
+
+
+class _SQLiteMapping(Mapping[str, V]):
+    """A read-only view of rows in table, optionally filtered by single column."""
+
+    __slots__ = ('_cache', '_table', '_key', '_where', '_params')
+
+    def __init__(
+        self,
+        cache: SQLiteCache,
+        table: CacheEntityType,
+        key: str,
+        where: str = '',
+        params: tuple[typing.Any, ...] = (),
+        /,
+    ) -> None:
+        self._cache: SQLiteCache = cache
+        self._table: CacheEntityType = table
+        self._key: str = key
+        self._where: str = where
+        self._params: tuple[typing.Any, ...] = params
+
+    def _query(self, columns: str, /) -> sqlite3.Cursor:
+        sql = f'SELECT {columns} FROM {self._table}'
+        if self._where:
+            sql += f' WHERE {self._where}'
+        return self._cache._execute(sql, self._params)
+
+    def __getitem__(self, key: str, /) -> V:
+        sql = f'SELECT data FROM {self._table} WHERE {self._key} = ?'
+        if self._where:
+            sql += f' AND {self._where}'
+        row = self._cache._execute(sql, (key, *self._params)).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return self._cache._loads(row[0])
+
+    def __contains__(self, key: object, /) -> bool:
+        sql = f'SELECT 1 FROM {self._table} WHERE {self._key} = ?'
+        if self._where:
+            sql += f' AND {self._where}'
+        return self._cache._execute(sql, (key, *self._params)).fetchone() is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return (row[0] for row in self._query(self._key).fetchall())
+
+    def __len__(self) -> int:
+        return self._query('COUNT(*)').fetchone()[0]
+
+    # Mapping's implementations would do a query for each key
+    def values(self) -> list[V]:  # type: ignore
+        loads = self._cache._loads
+        return [loads(row[0]) for row in self._query('data').fetchall()]
+
+    def items(self) -> list[tuple[str, V]]:  # type: ignore
+        loads = self._cache._loads
+        return [(row[0], loads(row[1])) for row in self._query(f'{self._key}, data').fetchall()]
+
+
+class _SQLiteServerEmojisMapping(Mapping[str, Mapping[str, ServerEmoji]]):
+    __slots__ = ('_cache',)
+
+    def __init__(self, cache: SQLiteCache, /) -> None:
+        self._cache: SQLiteCache = cache
+
+    def __getitem__(self, key: str, /) -> Mapping[str, ServerEmoji]:
+        if not self._cache._exists('emojis', 'server_id = ?', (key,)):
+            raise KeyError(key)
+        return _SQLiteMapping(self._cache, 'emojis', 'id', 'server_id = ?', (key,))
+
+    def __iter__(self) -> Iterator[str]:
+        rows = self._cache._execute('SELECT DISTINCT server_id FROM emojis WHERE server_id IS NOT NULL').fetchall()
+        return (row[0] for row in rows)
+
+    def __len__(self) -> int:
+        return self._cache._execute('SELECT COUNT(DISTINCT server_id) FROM emojis').fetchone()[0]
+
+
+class _SQLitePrivateChannelsByUserMapping(Mapping[str, str]):
+    __slots__ = ('_cache',)
+
+    def __init__(self, cache: SQLiteCache, /) -> None:
+        self._cache: SQLiteCache = cache
+
+    def __getitem__(self, key: str, /) -> str:
+        row = self._cache._execute(
+            'SELECT channel_id FROM private_channels_by_user WHERE user_id = ?',
+            (key,),
+        ).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return row[0]
+
+    def __iter__(self) -> Iterator[str]:
+        return (row[0] for row in self._cache._execute('SELECT user_id FROM private_channels_by_user').fetchall())
+
+    def __len__(self) -> int:
+        return self._cache._execute('SELECT COUNT(*) FROM private_channels_by_user').fetchone()[0]
+
+
+class SQLiteCache(Cache):
+    """Implementation of :class:`.Cache` ABC backed by SQLite database.
+
+    Objects are kept out of Python heap, except a bounded number of most recently used ones.
+    The database is opened in WAL mode, so several processes of same bot on one host can share single cache file.
+    Recently used objects are discarded whenever other process writes to the file.
+
+    .. note::
+        Objects returned from mappings are decoded on each access, and may be different instances
+        each time. Mutating them has no effect on cache, unless they are stored again.
+
+    .. note::
+        Database is accessed synchronously on event loop. Reads do not wait for other processes in WAL mode,
+        but writes wait up to ``timeout`` seconds for write lock held by other process, during which
+        nothing else runs. Keep ``timeout`` low if the file is shared.
+
+    .. warning::
+        Objects are pickled, so only open cache files written by yourself.
+
+    Parameters
+    ----------
+    path: Union[:class:`str`, :class:`os.PathLike`]
+        The path to database file. Use ``':memory:'`` for in-memory database.
+    state: :class:`.State`
+        The state to attach decoded objects to.
+    lru_size: :class:`int`
+        How many recently used objects to keep decoded in memory. Defaults to ``10000``.
+    messages_max_size: :class:`int`
+        How many messages can have cache per channel. Negative value means infinite count. Defaults to ``1000``.
+    timeout: :class:`float`
+        How long, in seconds, to wait for database lock held by other process. Defaults to ``0.5``.
+    """
+
+    __slots__ = (
+        '_connection',
+        '_data_version',
+        '_lru',
+        '_lru_size',
+        '_messages_max_size',
+        '_path',
+        '_state',
+        '_timeout',
+    )
+
+    def __init__(
+        self,
+        path: typing.Union[str, PathLike[str]],
+        *,
+        state: State,
+        lru_size: int = 10_000,
+        messages_max_size: int = 1000,
+        timeout: float = 0.5,
+    ) -> None:
+        self._path: typing.Union[str, PathLike[str]] = path
+        self._state: State = state
+        self._lru: OrderedDict[tuple[typing.Any, ...], typing.Any] = OrderedDict()
+        self._lru_size: int = lru_size
+        self._messages_max_size: int = messages_max_size
+        self._timeout: float = timeout
+        self._connection: typing.Optional[sqlite3.Connection] = None
+        # In-memory databases cannot be written by other connections, so the check is skipped for them
+        self._data_version: typing.Optional[int] = None
+        self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = self._connection
+        if connection is not None:
+            return connection
+
+        # Autocommit mode, transactions are started explicitly for batched writes
+        connection = sqlite3.connect(self._path, timeout=self._timeout, isolation_level=None)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        connection.executescript(_SCHEMA)
+
+        # Objects are pickled as tuples of attributes, so their layout depends on library version
+        row = connection.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        current = f'{_SCHEMA_VERSION}:{version}'
+        if row is None or row[0] != current:
+            if row is not None:
+                _L.info('Clearing SQLite cache at %s written by other version (%s)', self._path, row[0])
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                for table in _COLUMNS:
+                    connection.execute(f'DELETE FROM {table}')
+                connection.execute('DELETE FROM private_channels_by_user')
+                connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)", (current,))
+            except BaseException:
+                connection.execute('ROLLBACK')
+                raise
+            connection.execute('COMMIT')
+
+        if os.fspath(self._path) != ':memory:':
+            self._data_version = connection.execute('PRAGMA data_version').fetchone()[0]
+        self._lru.clear()
+        self._connection = connection
+        return connection
+
+    async def start(self) -> None:
+        self._connect()
+
+    async def close(self) -> None:
+        connection = self._connection
+        if connection is None:
+            return
+        self._connection = None
+        self._lru.clear()
+        connection.close()
+
+    ###########
+    # Helpers #
+    ###########
+
+    def _execute(
+        self, sql: str, params: typing.Union[tuple[typing.Any, ...], list[typing.Any]] = (), /
+    ) -> sqlite3.Cursor:
+        return self._connect().execute(sql, params)
+
+    def _executemany(self, statements: list[tuple[str, list[tuple[typing.Any, ...]]]], /) -> None:
+        connection = self._connect()
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            for sql, rows in statements:
+                if rows:
+                    connection.executemany(sql, rows)
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        connection.execute('COMMIT')
+
+    def _exists(self, table: CacheEntityType, where: str, params: tuple[typing.Any, ...], /) -> bool:
+        return self._execute(f'SELECT 1 FROM {table} WHERE {where} LIMIT 1', params).fetchone() is not None
+
+    @staticmethod
+    def _dumps(obj: typing.Any, /) -> bytes:
+        buffer = io.BytesIO()
+        _SnapshotPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(obj)
+        return buffer.getvalue()
+
+    def _loads(self, data: bytes, /) -> typing.Any:
+        return _SnapshotUnpickler(io.BytesIO(data), self._state).load()
+
+    def _remember(self, key: tuple[typing.Any, ...], obj: typing.Any, /) -> None:
+        if self._lru_size <= 0:
+            return
+        lru = self._lru
+        lru[key] = obj
+        lru.move_to_end(key)
+        while len(lru) > self._lru_size:
+            lru.popitem(last=False)
+
+    def _forget(self, key: tuple[typing.Any, ...], /) -> None:
+        self._lru.pop(key, None)
+
+    def _forget_where(self, predicate: typing.Callable[[tuple[typing.Any, ...]], bool], /) -> None:
+        lru = self._lru
+        for key in [key for key in lru if predicate(key)]:
+            del lru[key]
+
+    def _validate_lru(self) -> None:
+        # Changes only when other connection commits, so own writes, which update LRU as well, do not reset it
+        if self._data_version is None or not self._lru:
+            return
+        data_version = self._execute('PRAGMA data_version').fetchone()[0]
+        if data_version != self._data_version:
+            self._data_version = data_version
+            self._lru.clear()
+
+    def _get(self, table: CacheEntityType, key: tuple[str, ...], /) -> typing.Any:
+        self._validate_lru()
+        lru_key = (table, *key)
+        try:
+            obj = self._lru[lru_key]
+        except KeyError:
+            pass
+        else:
+            self._lru.move_to_end(lru_key)
+            return obj
+
+        key_columns, _ = _COLUMNS[table]
+        where = ' AND '.join(f'{column} = ?' for column in key_columns)
+        row = self._execute(f'SELECT data FROM {table} WHERE {where}', key).fetchone()
+        if row is None:
+            return None
+        obj = self._loads(row[0])
+        self._remember(lru_key, obj)
+        return obj
+
+    def _insert_sql(self, table: CacheEntityType, /) -> str:
+        key_columns, columns = _COLUMNS[table]
+        names = (*key_columns, *columns, 'data')
+        return f'INSERT OR REPLACE INTO {table} ({", ".join(names)}) VALUES ({", ".join("?" * len(names))})'
+
+    def _put(self, table: CacheEntityType, row: tuple[typing.Any, ...], obj: typing.Any, /) -> None:
+        self._execute(self._insert_sql(table), (*row, self._dumps(obj)))
+        key_columns, _ = _COLUMNS[table]
+        self._remember((table, *row[: len(key_columns)]), obj)
+
+    def _put_many(self, table: CacheEntityType, rows: list[tuple[tuple[typing.Any, ...], typing.Any]], /) -> None:
+        dumps = self._dumps
+        self._executemany([(self._insert_sql(table), [(*row, dumps(obj)) for row, obj in rows])])
+        key_columns, _ = _COLUMNS[table]
+        for row, obj in rows:
+            self._remember((table, *row[: len(key_columns)]), obj)
+
+    def _delete(self, table: CacheEntityType, key: tuple[str, ...], /) -> None:
+        key_columns, _ = _COLUMNS[table]
+        where = ' AND '.join(f'{column} = ?' for column in key_columns)
+        self._execute(f'DELETE FROM {table} WHERE {where}', key)
+        self._forget((table, *key))
+
+    def _select(self, sql: str, params: tuple[typing.Any, ...], /) -> list[typing.Any]:
+        loads = self._loads
+        return [loads(row[0]) for row in self._execute(sql, params).fetchall()]
+
+    ############
+    # Channels #
+    ############
+
+    def get_channel(self, channel_id: str, ctx: BaseCacheContext, /) -> typing.Optional[Channel]:
+        return self._get('channels', (channel_id,))
+
+    def get_channels_mapping(self) -> Mapping[str, Channel]:
+        return _SQLiteMapping(self, 'channels', 'id')
+
+    def store_channel(self, channel: Channel, ctx: BaseCacheContext, /) -> None:
+        from .channel import DMChannel, GroupChannel
+
+        server_id = getattr(channel, 'server_id', None)
+        private = isinstance(channel, (DMChannel, GroupChannel))
+        self._put(
+            'channels',
+            (channel.id, server_id, int(private), _casefold(getattr(channel, 'name', None))),
+            channel,
+        )
+
+    def delete_channel(self, channel_id: str, ctx: BaseCacheContext, /) -> None:
+        self._delete('channels', (channel_id,))
+
+    def get_private_channels_mapping(self) -> Mapping[str, typing.Union[DMChannel, GroupChannel]]:
+        return _SQLiteMapping(self, 'channels', 'id', 'private = 1')
+
+    def get_server_channels_mapping_of(
+        self, server_id: str, ctx: BaseCacheContext, /
+    ) -> typing.Optional[Mapping[str, ServerChannel]]:
+        if not self._exists('channels', 'server_id = ?', (server_id,)):
+            return None
+        return _SQLiteMapping(self, 'channels', 'id', 'server_id = ?', (server_id,))
+
+    def delete_server_channels_of(self, server_id: str, ctx: BaseCacheContext, /) -> None:
+        channel_ids = {row[0] for row in self._execute('SELECT id FROM channels WHERE server_id = ?', (server_id,))}
+        self._execute('DELETE FROM channels WHERE server_id = ?', (server_id,))
+        self._forget_where(lambda key: key[0] == 'channels' and key[1] in channel_ids)
+
+    def get_channels_by_name(
+        self,
+        name: str,
+        ctx: BaseCacheContext,
+        /,
+        *,
+        server_id: typing.Optional[str] = None,
+        prefix: bool = False,
+    ) -> Sequence[Channel]:
+        condition, params = _name_condition('name_key', name, prefix)
+        if server_id is not None:
+            condition += ' AND server_id = ?'
+            params = (*params, server_id)
+        return self._select(f'SELECT data FROM channels WHERE {condition}', params)
+
+    ####################
+    # Channel Messages #
+    ####################
+
+    def get_message(self, channel_id: str, message_id: str, ctx: BaseCacheContext, /) -> typing.Optional[Message]:
+        return self._get('messages', (channel_id, message_id))
+
+    def get_messages_mapping_of(
+        self, channel_id: str, ctx: BaseCacheContext, /
+    ) -> typing.Optional[Mapping[str, Message]]:
+        if not self._exists('messages', 'channel_id = ?', (channel_id,)):
+            return None
+        return _SQLiteMapping(self, 'messages', 'id', 'channel_id = ?', (channel_id,))
+
+    def store_message(self, message: Message, ctx: BaseCacheContext, /) -> None:
+        from .server import Member
+
+        max_size = self._messages_max_size
+        if max_size == 0:
+            return
+
+        server_id = None
+
+        author = message._author
+        if isinstance(author, Member):
+            server_id = author.server_id
+            self.store_server_member(author, ctx)
+            message._author = author.id
+        elif isinstance(author, User):
+            self.store_user(author, ctx)
+            message._author = author.id
+
+        channel_id = message.channel_id
+        if server_id is None:
+            row = self._execute('SELECT server_id FROM channels WHERE id = ?', (channel_id,)).fetchone()
+            if row is not None:
+                server_id = row[0]
+
+        self._put('messages', (channel_id, message.id, message.author_id, server_id), message)
+
+        if max_size > 0:
+            # IDs are ULIDs, so ordering by them gives oldest messages first
+            trimmed = [
+                row[0]
+                for row in self._execute(
+                    'SELECT id FROM messages WHERE channel_id = ? ORDER BY id DESC LIMIT -1 OFFSET ?',
+                    (channel_id, max_size),
+                ).fetchall()
+            ]
+            for message_id in trimmed:
+                self._delete('messages', (channel_id, message_id))
+
+    def delete_message(self, channel_id: str, message_id: str, ctx: BaseCacheContext, /) -> None:
+        self._delete('messages', (channel_id, message_id))
+
+    def delete_messages_of(self, channel_id: str, ctx: BaseCacheContext, /) -> None:
+        self._execute('DELETE FROM messages WHERE channel_id = ?', (channel_id,))
+        self._forget_where(lambda key: key[0] == 'messages' and key[1] == channel_id)
+
+    def get_messages_by_author(self, author_id: str, ctx: BaseCacheContext, /) -> Sequence[Message]:
+        return self._select('SELECT data FROM messages WHERE author_id = ?', (author_id,))
+
+    def delete_messages_by_author(self, author_id: str, ctx: BaseCacheContext, /) -> None:
+        self._execute('DELETE FROM messages WHERE author_id = ?', (author_id,))
+        # Author is not part of key, so look at cached objects
+        self._forget_where(lambda key: key[0] == 'messages' and self._lru[key].author_id == author_id)
+
+    def get_messages_in_server(self, server_id: str, ctx: BaseCacheContext, /) -> Sequence[Message]:
+        return self._select('SELECT data FROM messages WHERE server_id = ?', (server_id,))
+
+    def delete_messages_in_server(self, server_id: str, ctx: BaseCacheContext, /) -> None:
+        channel_ids = {
+            row[0]
+            for row in self._execute('SELECT DISTINCT channel_id FROM messages WHERE server_id = ?', (server_id,))
+        }
+        self._execute('DELETE FROM messages WHERE server_id = ?', (server_id,))
+        self._forget_where(lambda key: key[0] == 'messages' and key[1] in channel_ids)
+
+    ###############
+    # Read States #
+    ###############
+
+    def get_read_state(self, channel_id: str, ctx: BaseCacheContext, /) -> typing.Optional[ReadState]:
+        return self._get('read_states', (channel_id,))
+
+    def get_read_states_mapping(self) -> Mapping[str, ReadState]:
+        return _SQLiteMapping(self, 'read_states', 'channel_id')
+
+    def store_read_state(self, read_state: ReadState, ctx: BaseCacheContext, /) -> None:
+        self._put('read_states', (read_state.channel_id,), read_state)
+
+    def delete_read_state(self, channel_id: str, ctx: BaseCacheContext, /) -> None:
+        self._delete('read_states', (channel_id,))
+
+    ##########
+    # Emojis #
+    ##########
+
+    def get_emoji(self, emoji_id: str, ctx: BaseCacheContext, /) -> typing.Optional[Emoji]:
+        return self._get('emojis', (emoji_id,))
+
+    def get_emojis_mapping(self) -> Mapping[str, Emoji]:
+        return _SQLiteMapping(self, 'emojis', 'id')
+
+    def get_server_emojis_mapping(
+        self,
+    ) -> Mapping[str, Mapping[str, ServerEmoji]]:
+        return _SQLiteServerEmojisMapping(self)
+
+    def get_server_emojis_mapping_of(
+        self, server_id: str, ctx: BaseCacheContext, /
+    ) -> typing.Optional[Mapping[str, ServerEmoji]]:
+        if not self._exists('emojis', 'server_id = ?', (server_id,)) and not self._exists(
+            'servers', 'id = ?', (server_id,)
+        ):
+            return None
+        return _SQLiteMapping(self, 'emojis', 'id', 'server_id = ?', (server_id,))
+
+    def delete_server_emojis_of(self, server_id: str, ctx: BaseCacheContext, /) -> None:
+        emoji_ids = {row[0] for row in self._execute('SELECT id FROM emojis WHERE server_id = ?', (server_id,))}
+        self._execute('DELETE FROM emojis WHERE server_id = ?', (server_id,))
+        self._forget_where(lambda key: key[0] == 'emojis' and key[1] in emoji_ids)
+
+    def store_emoji(self, emoji: Emoji, ctx: BaseCacheContext, /) -> None:
+        server_id = emoji.server_id if isinstance(emoji, ServerEmoji) else None
+        self._put('emojis', (emoji.id, server_id, _casefold(emoji.name)), emoji)
+
+    def delete_emoji(self, emoji_id: str, server_id: typing.Optional[str], ctx: BaseCacheContext, /) -> None:
+        self._delete('emojis', (emoji_id,))
+
+    def get_emojis_by_name(
+        self,
+        name: str,
+        ctx: BaseCacheContext,
+        /,
+        *,
+        server_id: typing.Optional[str] = None,
+        prefix: bool = False,
+    ) -> Sequence[Emoji]:
+        condition, params = _name_condition('name_key', name, prefix)
+        if server_id is not None:
+            condition += ' AND server_id = ?'
+            params = (*params, server_id)
+        return self._select(f'SELECT data FROM emojis WHERE {condition}', params)
+
+    ###########
+    # Servers #
+    ###########
+
+    def get_server(self, server_id: str, ctx: BaseCacheContext, /) -> typing.Optional[Server]:
+        return self._get('servers', (server_id,))
+
+    def get_servers_mapping(self) -> Mapping[str, Server]:
+        return _SQLiteMapping(self, 'servers', 'id')
+
+    def store_server(self, server: Server, ctx: BaseCacheContext, /) -> None:
+        self._put('servers', (server.id,), server)
+
+    def delete_server(self, server_id: str, ctx: BaseCacheContext, /) -> typing.Optional[Server]:
+        server = self._get('servers', (server_id,))
+        self._delete('servers', (server_id,))
+        return server
+
+    ##################
+    # Server Members #
+    ##################
+
+    def get_server_member(self, server_id: str, user_id: str, ctx: BaseCacheContext, /) -> typing.Optional[Member]:
+        return self._get('server_members', (server_id, user_id))
+
+    def get_server_members_mapping_of(
+        self, server_id: str, ctx: BaseCacheContext, /
+    ) -> typing.Optional[Mapping[str, Member]]:
+        if not self._exists('server_members', 'server_id = ?', (server_id,)) and not self._exists(
+            'servers', 'id = ?', (server_id,)
+        ):
+            return None
+        return _SQLiteMapping(self, 'server_members', 'user_id', 'server_id = ?', (server_id,))
+
+    def _member_rows(
+        self, members: typing.Iterable[Member], /
+    ) -> tuple[list[tuple[tuple[typing.Any, ...], typing.Any]], list[tuple[tuple[typing.Any, ...], typing.Any]]]:
+        member_rows = []
+        user_rows = []
+        for member in members:
+            user = member._user
+            if isinstance(user, User):
+                user_rows.append(((user.id, _casefold(user.name), _casefold(user.display_name)), user))
+                member._user = user.id
+            member_rows.append(((member.server_id, member.id, _casefold(member.nick)), member))
+        return member_rows, user_rows
+
+    def bulk_store_server_members(
+        self,
+        server_id: str,
+        members: dict[str, Member],
+        ctx: BaseCacheContext,
+        /,
+    ) -> None:
+        member_rows, user_rows = self._member_rows(members.values())
+        if user_rows:
+            self._put_many('users', user_rows)
+        self._put_many('server_members', member_rows)
+
+    def overwrite_server_members(
+        self,
+        server_id: str,
+        members: dict[str, Member],
+        ctx: BaseCacheContext,
+        /,
+    ) -> None:
+        member_rows, user_rows = self._member_rows(members.values())
+        dumps = self._dumps
+        self._executemany(
+            [
+                (self._insert_sql('users'), [(*row, dumps(obj)) for row, obj in user_rows]),
+                ('DELETE FROM server_members WHERE server_id = ?', [(server_id,)]),
+                (self._insert_sql('server_members'), [(*row, dumps(obj)) for row, obj in member_rows]),
+            ]
+        )
+        self._forget_where(lambda key: key[0] == 'server_members' and key[1] == server_id)
+        for row, obj in user_rows:
+            self._remember(('users', row[0]), obj)
+
+    def store_server_member(self, member: Member, ctx: BaseCacheContext, /) -> None:
+        if isinstance(member._user, User):
+            self.store_user(member._user, ctx)
+            member._user = member._user.id
+        self._put('server_members', (member.server_id, member.id, _casefold(member.nick)), member)
+
+    def delete_server_member(self, server_id: str, user_id: str, ctx: BaseCacheContext, /) -> None:
+        self._delete('server_members', (server_id, user_id))
+
+    def delete_server_members_of(self, server_id: str, ctx: BaseCacheContext, /) -> None:
+        self._execute('DELETE FROM server_members WHERE server_id = ?', (server_id,))
+        self._forget_where(lambda key: key[0] == 'server_members' and key[1] == server_id)
+
+    def get_server_members_by_name(
+        self, server_id: str, name: str, ctx: BaseCacheContext, /, *, prefix: bool = False
+    ) -> Sequence[Member]:
+        nick_condition, nick_params = _name_condition('nick_key', name, prefix)
+        name_condition, name_params = _name_condition('u.name_key', name, prefix)
+        display_name_condition, display_name_params = _name_condition('u.display_name_key', name, prefix)
+        return self._select(
+            f'SELECT data FROM server_members WHERE server_id = ? AND {nick_condition} '
+            'UNION '
+            'SELECT m.data FROM server_members m JOIN users u ON u.id = m.user_id '
+            f'WHERE m.server_id = ? AND (({name_condition}) OR ({display_name_condition}))',
+            (server_id, *nick_params, server_id, *name_params, *display_name_params),
+        )
+
+    #########
+    # Users #
+    #########
+
+    def get_user(self, user_id: str, ctx: BaseCacheContext, /) -> typing.Optional[User]:
+        return self._get('users', (user_id,))
+
+    def get_users_mapping(self) -> Mapping[str, User]:
+        return _SQLiteMapping(self, 'users', 'id')
+
+    def store_user(self, user: User, ctx: BaseCacheContext, /) -> None:
+        self._put('users', (user.id, _casefold(user.name), _casefold(user.display_name)), user)
+
+    def bulk_store_users(self, users: Mapping[str, User], ctx: BaseCacheContext, /) -> None:
+        self._put_many(
+            'users',
+            [((user_id, _casefold(user.name), _casefold(user.display_name)), user) for user_id, user in users.items()],
+        )
+
+    def get_users_by_name(self, name: str, ctx: BaseCacheContext, /, *, prefix: bool = False) -> Sequence[User]:
+        name_condition, name_params = _name_condition('name_key', name, prefix)
+        display_name_condition, display_name_params = _name_condition('display_name_key', name, prefix)
+        return self._select(
+            f'SELECT data FROM users WHERE ({name_condition}) OR ({display_name_condition})',
+            (*name_params, *display_name_params),
+        )
+
+    ############################
+    # Private Channels by User #
+    ############################
+
+    def get_private_channel_by_user(self, user_id: str, ctx: BaseCacheContext, /) -> typing.Optional[str]:
+        row = self._execute('SELECT channel_id FROM private_channels_by_user WHERE user_id = ?', (user_id,)).fetchone()
+        return None if row is None else row[0]
+
+    def get_private_channels_by_users_mapping(self) -> Mapping[str, str]:
+        return _SQLitePrivateChannelsByUserMapping(self)
+
+    def store_private_channel_by_user(self, channel: DMChannel, ctx: BaseCacheContext, /) -> None:
+        self._execute(
+            'INSERT OR REPLACE INTO private_channels_by_user (user_id, channel_id) VALUES (?, ?)',
+            (channel.recipient_id, channel.id),
+        )
+
+    def delete_private_channel_by_user(self, user_id: str, ctx: BaseCacheContext, /) -> None:
+        self._execute('DELETE FROM private_channels_by_user WHERE user_id = ?', (user_id,))
+
+    ########################
+    # Channel Voice States #
+    ########################
+
+    def get_channel_voice_state(
+        self, channel_id: str, ctx: BaseCacheContext, /
+    ) -> typing.Optional[ChannelVoiceStateContainer]:
+        return self._get('channel_voice_states', (channel_id,))
+
+    def get_channel_voice_states_mapping(self) -> Mapping[str, ChannelVoiceStateContainer]:
+        return _SQLiteMapping(self, 'channel_voice_states', 'channel_id')
+
+    def store_channel_voice_state(self, container: ChannelVoiceStateContainer, ctx: BaseCacheContext, /) -> None:
+        self._put('channel_voice_states', (container.channel_id,), container)
+
+    def bulk_store_channel_voice_states(
+        self, containers: dict[str, ChannelVoiceStateContainer], ctx: BaseCacheContext, /
+    ) -> None:
+        self._put_many(
+            'channel_voice_states',
+            [((channel_id,), container) for channel_id, container in containers.items()],
+        )
+
+    def delete_channel_voice_state(self, channel_id: str, ctx: BaseCacheContext, /) -> None:
+        self._delete('channel_voice_states', (channel_id,))
+
+
+__all__ = (
+    '_SCHEMA_VERSION',
+    '_SCHEMA',
+    '_casefold',
+    '_name_condition',
+    '_SQLiteMapping',
+    'SQLiteCache',
+)
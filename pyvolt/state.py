@@ -32,7 +32,8 @@ from .settings import UserSettings
 from .user import RelationshipStatus, User
 
 if typing.TYPE_CHECKING:
-    from .cache import ProvideCacheContextIn, Cache
+    from .cache import ProvideCacheContextIn, AsyncCache, Cache
+    from .events import SkipBeforeSnapshotIn
     from .cdn import CDNClient
     from .channel import SavedMessagesChannel
     from .http import HTTPClient
@@ -47,6 +48,9 @@ class State:
     ----------
     provide_cache_context_in: List[:class:`.ProvideCacheContextIn`]
         The methods/properties that do provide cache context.
+    skip_before_snapshot_in: List[:class:`.SkipBeforeSnapshotIn`]
+        The update events that should update cached objects in place, instead of copying them.
+        The ``before`` attribute of these events is always ``None``, and canceling them does not revert the changes.
     parser: :class:`.Parser`
         The parser.
     system: :class:`.User`
@@ -56,8 +60,10 @@ class State:
     """
 
     __slots__ = (
+        '_async_cache',
         '_cache',
         'provide_cache_context_in',
+        'skip_before_snapshot_in',
         '_cdn_client',
         '_http',
         'parser',
@@ -72,12 +78,16 @@ class State:
     def __init__(
         self,
         *,
+        async_cache: typing.Optional[AsyncCache] = None,
         cache: typing.Optional[Cache] = None,
         provide_cache_context_in: typing.Optional[list[ProvideCacheContextIn]] = None,
         shard: typing.Optional[Shard] = None,
+        skip_before_snapshot_in: typing.Optional[list[SkipBeforeSnapshotIn]] = None,
     ) -> None:
+        self._async_cache: typing.Optional[AsyncCache] = async_cache
         self._cache: Cache | None = cache
         self.provide_cache_context_in: list[ProvideCacheContextIn] = provide_cache_context_in or []
+        self.skip_before_snapshot_in: list[SkipBeforeSnapshotIn] = skip_before_snapshot_in or []
         self._cdn_client: typing.Optional[CDNClient] = None
         self._http: typing.Optional[HTTPClient] = None
         self.parser: Parser = Parser(state=self)
@@ -105,12 +115,15 @@ class State:
     def setup(
         self,
         *,
+        async_cache: typing.Optional[AsyncCache] = None,
         cache: typing.Optional[Cache] = None,
         cdn_client: typing.Optional[CDNClient] = None,
         http: typing.Optional[HTTPClient] = None,
         parser: typing.Optional[Parser] = None,
         shard: typing.Optional[Shard] = None,
     ) -> State:
+        if async_cache:
+            self._async_cache = async_cache
         if cache:
             self._cache = cache
         if cdn_client:
@@ -123,6 +136,15 @@ class State:
             self._shard = shard
         return self
 
+    @property
+    def async_cache(self) -> typing.Optional[AsyncCache]:
+        """Optional[:class:`.AsyncCache`]: The asynchronous cache attached to this state.
+
+        Events update it in :meth:`.BaseEvent.abefore_dispatch` and :meth:`.BaseEvent.aprocess`.
+        It is not used by synchronous lookups, see :class:`.AsyncCache` for details.
+        """
+        return self._async_cache
+
     @property
     def cache(self) -> typing.Optional[Cache]:
         """Optional[:class:`.Cache`]: The cache attacted to this state."""
@@ -30,6 +30,7 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+import asyncio
 import datetime
 from functools import partial
 import inspect
@@ -51,7 +52,7 @@ else:
     HAS_ORJSON = True
 
 if typing.TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable, Iterable, Sequence
+    from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable, Sequence
 
     P = typing.ParamSpec('P')
     T = typing.TypeVar('T')
@@ -70,6 +71,7 @@ if HAS_ORJSON:
     def to_json(obj: typing.Any) -> str:
         return orjson.dumps(obj).decode('utf-8')  # type: ignore
 
+    to_json_bytes = orjson.dumps  # type: ignore
     from_json = orjson.loads  # type: ignore
 
 else:
@@ -77,6 +79,9 @@ else:
     def to_json(obj: typing.Any) -> str:
         return json.dumps(obj, separators=(',', ':'), ensure_ascii=True)
 
+    def to_json_bytes(obj: typing.Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=True).encode('ascii')
+
     from_json = json.loads
 
 
@@ -88,6 +93,18 @@ async def maybe_coroutine(f: MaybeAwaitableFunc[P, T], *args: P.args, **kwargs:
         return value
 
 
+async def _gather(*aws: Awaitable[T]) -> list[T]:
+    # Unlike asyncio.gather(), cancels remaining awaitables once any of them fails
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
 def copy_doc(original: Callable[..., typing.Any]) -> Callable[[T], T]:
     """A decorator that copies documentation.
 
@@ -160,15 +177,151 @@ def decode_bool(
 
 
 async def _json_or_text(response: aiohttp.ClientResponse) -> typing.Any:
-    text = await response.text(encoding='utf-8')
+    # Parse JSON from bytes directly, without decoding whole body to str first
+    body = await response.read()
     try:
         if response.headers['content-type'].startswith('application/json'):
-            return from_json(text)
+            return from_json(body)
     except KeyError:
         # Thanks Cloudflare
         pass
 
-    return text
+    return body.decode('utf-8')
+
+
+_JSON_STRUCTURAL_RE: typing.Final[re.Pattern[bytes]] = re.compile(rb'[\[\]{},"]')
+_JSON_STRING_TAIL_RE: typing.Final[re.Pattern[bytes]] = re.compile(rb'(?:[^"\\]|\\.)*"', re.DOTALL)
+
+
+class JSONItemDecoder:
+    """Incrementally decodes items of top-level JSON array, or of arrays that are values of top-level JSON object.
+
+    Only one item is kept in memory at a time, so memory usage does not depend on size of whole document.
+    Values of top-level object that are not arrays are skipped.
+    """
+
+    __slots__ = (
+        '_buffer',
+        '_depth',
+        '_item_start',
+        '_items_depth',
+        '_key',
+        '_last_string',
+        '_pos',
+        '_top',
+    )
+
+    def __init__(self) -> None:
+        self._buffer: bytearray = bytearray()
+        self._depth: int = 0
+        self._item_start: int = 0
+        # The depth of items being decoded, or 0 if outside of array
+        self._items_depth: int = 0
+        self._key: typing.Optional[str] = None
+        self._last_string: bytes = b''
+        self._pos: int = 0
+        self._top: int = 0
+
+    def _emit(self, end: int, items: list[tuple[typing.Optional[str], typing.Any]], /) -> None:
+        item = bytes(self._buffer[self._item_start : end]).strip()
+        if item:
+            items.append((self._key, from_json(item)))
+
+    def feed(self, data: bytes, /) -> list[tuple[typing.Optional[str], typing.Any]]:
+        """Feeds data to decoder.
+
+        Parameters
+        ----------
+        data: :class:`bytes`
+            The next chunk of JSON document.
+
+        Returns
+        -------
+        List[Tuple[Optional[:class:`str`], Any]]
+            The items that were fully decoded, with key of array they are in, or ``None`` for top-level array.
+        """
+        buffer = self._buffer
+        buffer += data
+
+        items: list[tuple[typing.Optional[str], typing.Any]] = []
+        depth = self._depth
+        pos = self._pos
+
+        while True:
+            match = _JSON_STRUCTURAL_RE.search(buffer, pos)
+            if match is None:
+                pos = len(buffer)
+                break
+
+            index = match.start()
+            char = buffer[index]
+
+            if char == 0x22:  # "
+                tail = _JSON_STRING_TAIL_RE.match(buffer, index + 1)
+                if tail is None:
+                    # The string is not fully received yet
+                    pos = index
+                    break
+                pos = tail.end()
+                if depth == 1:
+                    # Might be key of next array
+                    self._last_string = bytes(buffer[index + 1 : pos - 1])
+                continue
+
+            pos = index + 1
+            if char == 0x5B or char == 0x7B:  # [ {
+                depth += 1
+                if depth == 1:
+                    self._top = char
+                    if char == 0x5B:
+                        self._items_depth = 1
+                        self._key = None
+                        self._item_start = pos
+                elif depth == 2 and char == 0x5B and self._top == 0x7B:
+                    self._items_depth = 2
+                    self._key = from_json(b'"' + self._last_string + b'"')
+                    self._item_start = pos
+            elif char == 0x2C:  # ,
+                if depth == self._items_depth:
+                    self._emit(index, items)
+                    self._item_start = pos
+            else:  # ] }
+                if depth == self._items_depth:
+                    self._emit(index, items)
+                    self._items_depth = 0
+                depth -= 1
+
+        # Drop everything that was consumed, except current item
+        cut = min(pos, self._item_start) if self._items_depth else pos
+        if cut:
+            del buffer[:cut]
+            pos -= cut
+            self._item_start -= cut
+
+        self._depth = depth
+        self._pos = pos
+        return items
+
+    def close(self) -> None:
+        """Checks that whole document was received.
+
+        Raises
+        ------
+        :class:`ValueError`
+            The document is incomplete.
+        """
+        if self._depth or self._buffer[self._pos :].strip():
+            raise ValueError('Incomplete JSON document')
+
+
+async def _stream_json_items(
+    response: aiohttp.ClientResponse, /, *, chunk_size: int = 65536
+) -> AsyncGenerator[tuple[typing.Optional[str], typing.Any], None]:
+    decoder = JSONItemDecoder()
+    async for chunk in response.content.iter_chunked(chunk_size):
+        for item in decoder.feed(chunk):
+            yield item
+    decoder.close()
 
 
 def utcnow() -> datetime.datetime:
@@ -501,14 +654,18 @@ MISSING: typing.Any = _MissingSentinel()
 
 __all__ = (
     'to_json',
+    'to_json_bytes',
     'from_json',
     'maybe_coroutine',
+    '_gather',
     'copy_doc',
     '_bool',
     '_BOOL_FALSE_VALUES',
     '_BOOL_TRUE_VALUES',
     'decode_bool',
     '_json_or_text',
+    'JSONItemDecoder',
+    '_stream_json_items',
     'utcnow',
     'is_docker',
     'stream_supports_color',
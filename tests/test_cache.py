@@ -0,0 +1,559 @@
+from __future__ import annotations
+
+import copy
+import json
+import pytest
+import pyvolt
+
+with open('./tests/data/channels/messages/rules.json', 'r') as fp:
+    messages = json.load(fp)
+
+with open('./tests/data/servers/member.json', 'r') as fp:
+    member = json.load(fp)
+
+with open('./tests/data/users/user.json', 'r') as fp:
+    user = json.load(fp)
+
+
+def make_state() -> pyvolt.State:
+    state = pyvolt.State()
+    state.setup(parser=pyvolt.Parser(state=state))
+    return state
+
+
+def test_ttl_expiry(monkeypatch: pytest.MonkeyPatch):
+    now = 1000.0
+    monkeypatch.setattr(pyvolt.cache, 'monotonic', lambda: now)
+
+    state = make_state()
+    cache = pyvolt.MapCache(messages_ttl=10, server_members_ttl=10, users_ttl=10)
+    ctx = pyvolt.cache._UNDEFINED
+
+    message = state.parser.parse_message(copy.deepcopy(messages[0]))
+    cache.store_message(message, ctx)
+    cache.store_server_member(state.parser.parse_member(member), ctx)
+    cache.store_user(state.parser.parse_user(user), ctx)
+
+    assert cache.get_message(message.channel_id, message.id, ctx) is message
+    assert cache.get_server_member(member['_id']['server'], member['_id']['user'], ctx) is not None
+    assert cache.get_user(user['_id'], ctx) is not None
+
+    now += 5
+    # Storing again refreshes deadline.
+    cache.store_user(state.parser.parse_user(user), ctx)
+
+    now += 6
+    assert cache.get_message(message.channel_id, message.id, ctx) is None
+    assert cache.get_messages_mapping_of(message.channel_id, ctx) is None
+    assert cache.get_user(user['_id'], ctx) is not None
+
+    assert cache.sweep_expired() == 1
+    assert cache.get_server_members_mapping_of(member['_id']['server'], ctx) == {}
+
+    now += 5
+    assert cache.sweep_expired() == 1
+    assert cache.get_users_mapping() == {}
+
+    # Entries trimmed by count limits do not leave their deadlines behind
+    cache = pyvolt.MapCache(
+        messages_max_size=2,
+        messages_ttl=3600,
+        server_members_max_size=2,
+        server_members_ttl=3600,
+        users_max_size=2,
+        users_ttl=3600,
+    )
+    for i in range(10):
+        message_payload = copy.deepcopy(messages[0])
+        message_payload['_id'] = f'01J{i:023d}'
+        cache.store_message(state.parser.parse_message(message_payload), ctx)
+
+        member_payload = copy.deepcopy(member)
+        member_payload['_id']['user'] = f'01J{i:023d}'
+        cache.store_server_member(state.parser.parse_member(member_payload), ctx)
+
+        user_payload = copy.deepcopy(user)
+        user_payload['_id'] = f'01J{i:023d}'
+        cache.store_user(state.parser.parse_user(user_payload), ctx)
+
+    assert len(cache._messages_expiry) == 2
+    assert len(cache._server_members_expiry) == 2
+    assert len(cache._users_expiry) == 2
+
+
+def test_memory_budget():
+    state = make_state()
+    cache = pyvolt.BudgetedMapCache(max_memory=-1, memory_budgets={'messages': 0})
+    ctx = pyvolt.cache._UNDEFINED
+
+    user_object = state.parser.parse_user(user)
+    cache.store_user(user_object, ctx)
+
+    size = pyvolt.cache._estimate_size(user_object)
+    assert size > 0
+    assert cache.memory == size
+
+    message = state.parser.parse_message(copy.deepcopy(messages[0]))
+    cache.store_message(message, ctx)
+    assert cache.get_message(message.channel_id, message.id, ctx) is None
+
+    report = cache.memory_report()
+    assert report.size == size
+    assert report.types['users'].count == 1
+    assert report.types['messages'].count == 0
+
+    cache = pyvolt.BudgetedMapCache(max_memory=size, eviction_order=['users'])
+    cache.store_user(user_object, ctx)
+    other = copy.deepcopy(user)
+    other['_id'] = '01HZZZZZZZZZZZZZZZZZZZZZZZ'
+    cache.store_user(state.parser.parse_user(other), ctx)
+
+    assert list(cache.get_users_mapping()) == [other['_id']]
+    assert cache.memory <= size
+
+    # Evictions are not counted as deletes
+    cache = pyvolt.BudgetedMapCache(max_memory=-1, memory_budgets={'messages': 0}, stats=True)
+    cache.store_message(message, ctx)
+    assert cache.stats is not None
+    counters = cache.stats.snapshot().types['messages']
+    assert (counters.evictions, counters.deletes) == (1, 0)
+
+    with pytest.raises(TypeError):
+        pyvolt.BudgetedMapCache(max_memory=1, eviction_order=['channel_voice_states', 'messages'])
+
+    # Entries trimmed by count limits are released from accounting
+    cache = pyvolt.BudgetedMapCache(messages_max_size=2, users_max_size=0)
+    for i in range(10):
+        payload = copy.deepcopy(messages[0])
+        payload['_id'] = f'01J{i:023d}'
+        cache.store_message(state.parser.parse_message(payload), ctx)
+    cache.store_user(user_object, ctx)
+
+    report = cache.memory_report()
+    assert report.types['messages'].count == 2
+    assert report.types['users'].count == 0
+    assert cache.memory == sum(
+        pyvolt.cache._estimate_size(m) for m in cache.get_messages_mapping_of(message.channel_id, ctx).values()
+    )
+
+
+def test_message_indexes():
+    state = make_state()
+    cache = pyvolt.MapCache(messages_max_size=2)
+    ctx = pyvolt.cache._UNDEFINED
+
+    first, second = (state.parser.parse_message(copy.deepcopy(payload)) for payload in messages)
+    channel_id = first.channel_id
+    author_id = first.author_id
+
+    third_payload = copy.deepcopy(messages[0])
+    third_payload['_id'] = '01J0000000000000000000000Z'
+    third = state.parser.parse_message(third_payload)
+
+    cache.store_message(first, ctx)
+    cache.store_message(second, ctx)
+    assert first in cache.get_messages_by_author(author_id, ctx)
+
+    # Trimming must update index too
+    cache.store_message(third, ctx)
+    assert first not in cache.get_messages_by_author(author_id, ctx)
+    assert third in cache.get_messages_by_author(author_id, ctx)
+
+    cache.delete_messages_by_author(author_id, ctx)
+    assert cache.get_messages_by_author(author_id, ctx) == []
+    assert cache.get_message(channel_id, third.id, ctx) is None
+
+    cache._channels[channel_id] = state.parser.parse_channel(
+        {
+            'channel_type': 'TextChannel',
+            '_id': channel_id,
+            'server': '01F7ZSBSFHQ8TA81725KQCSDDP',
+            'name': 'rules',
+        }
+    )
+    cache.delete_messages_of(channel_id, ctx)
+    cache.store_message(third, ctx)
+    assert cache.get_messages_in_server('01F7ZSBSFHQ8TA81725KQCSDDP', ctx) == [third]
+
+    cache.delete_messages_in_server('01F7ZSBSFHQ8TA81725KQCSDDP', ctx)
+    assert cache.get_messages_mapping_of(channel_id, ctx) is None
+    assert cache.get_messages_by_author(third.author_id, ctx) == []
+
+
+def test_server_channels_index():
+    state = make_state()
+    cache = pyvolt.MapCache()
+    ctx = pyvolt.cache._UNDEFINED
+
+    server_id = '01F7ZSBSFHQ8TA81725KQCSDDP'
+    channel = state.parser.parse_channel(
+        {
+            'channel_type': 'TextChannel',
+            '_id': '01F7ZSBSFHCAAJQ92ZGTY67HMN',
+            'server': server_id,
+            'name': 'general',
+        }
+    )
+    cache.store_channel(channel, ctx)
+    assert cache.get_server_channels_mapping_of(server_id, ctx) == {channel.id: channel}
+
+    cache.delete_channel(channel.id, ctx)
+    assert cache.get_server_channels_mapping_of(server_id, ctx) is None
+
+    cache.store_channel(channel, ctx)
+    cache.delete_server_channels_of(server_id, ctx)
+    assert cache.get_channel(channel.id, ctx) is None
+
+
+def test_name_indexes():
+    state = make_state()
+    ctx = pyvolt.cache._UNDEFINED
+
+    for cache in (pyvolt.MapCache(), pyvolt.MapCache(name_indexes=True)):
+        user_object = state.parser.parse_user(user)
+        cache.store_user(user_object, ctx)
+
+        member_payload = copy.deepcopy(member)
+        member_payload['nickname'] = 'Bob'
+        member_object = state.parser.parse_member(member_payload)
+        cache.store_server_member(member_object, ctx)
+        server_id = member_object.server_id
+
+        assert cache.get_users_by_name('INSERT', ctx) == [user_object]
+        assert cache.get_users_by_name('ins', ctx, prefix=True) == [user_object]
+        assert cache.get_users_by_name('ins', ctx) == []
+        assert cache.get_server_members_by_name(server_id, 'bob', ctx) == [member_object]
+        assert cache.get_server_members_by_name(server_id, 'insert', ctx) == [member_object]
+
+        channel = state.parser.parse_channel(
+            {
+                'channel_type': 'TextChannel',
+                '_id': '01F7ZSBSFHCAAJQ92ZGTY67HMN',
+                'server': server_id,
+                'name': 'General',
+            }
+        )
+        cache.store_channel(channel, ctx)
+        assert cache.get_channels_by_name('general', ctx, server_id=server_id) == [channel]
+        assert cache.get_channels_by_name('gen', ctx, server_id='0', prefix=True) == []
+
+        cache.delete_channel(channel.id, ctx)
+        cache.delete_server_member(server_id, member_object.id, ctx)
+        assert cache.get_channels_by_name('general', ctx) == []
+        assert cache.get_server_members_by_name(server_id, 'bob', ctx) == []
+
+
+def test_name_index():
+    index = pyvolt.cache._NameIndex()
+    index.set('1', ('Alice', 'alice', None))
+    index.set('2', ('Alina',))
+    assert index.get('ALICE') == ['1']
+    assert sorted(index.get('al', prefix=True)) == ['1', '2']
+
+    index.set('1', ('Bob',))
+    assert index.get('al', prefix=True) == ['2']
+    assert index.get('b', prefix=True) == ['1']
+
+    index.remove('2')
+    assert index.get('al', prefix=True) == []
+    assert len(index) == 1
+
+
+def test_stats():
+    state = make_state()
+    cache = pyvolt.MapCache(messages_max_size=1, stats=True)
+    assert pyvolt.MapCache().stats is None
+    ctx = pyvolt.cache._UNDEFINED
+
+    user_object = state.parser.parse_user(user)
+    cache.store_user(user_object, ctx)
+    assert cache.get_user(user_object.id, ctx) is user_object
+    assert cache.get_user('0', pyvolt.cache._USER_REQUEST) is None
+
+    first, second = (state.parser.parse_message(copy.deepcopy(payload)) for payload in messages)
+    cache.store_message(first, ctx)
+    cache.store_message(second, ctx)
+    cache.delete_message(second.channel_id, second.id, ctx)
+
+    assert cache.stats is not None
+    snapshot = cache.stats.snapshot()
+    users = snapshot.types['users']
+    assert (users.hits, users.misses, users.stores) == (1, 1, 1)
+    assert snapshot.contexts['users'][pyvolt.CacheContextType.user_request].misses == 1
+    assert snapshot.misses_by_caller['users'] == {'UndefinedCacheContext': 1}
+
+    messages_counters = snapshot.types['messages']
+    assert (messages_counters.stores, messages_counters.evictions, messages_counters.deletes) == (2, 1, 1)
+
+    cache.stats.reset()
+    assert cache.stats.snapshot().types == {}
+
+
+def test_snapshot(tmp_path):
+    import asyncio
+
+    state = make_state()
+    ctx = pyvolt.cache._UNDEFINED
+    cache = pyvolt.MapCache(name_indexes=True)
+
+    user_object = state.parser.parse_user(user)
+    cache.store_user(user_object, ctx)
+    cache.store_server_member(state.parser.parse_member(member), ctx)
+    message = state.parser.parse_message(copy.deepcopy(messages[0]))
+    cache.store_message(message, ctx)
+
+    path = tmp_path / 'cache.bin'
+    with open(path, 'wb') as fp:
+        cache.dump_snapshot(fp)
+
+    other_state = make_state()
+    restored = pyvolt.MapCache(name_indexes=True, snapshot_path=path, snapshot_interval=0, state=other_state)
+    asyncio.run(restored.start())
+
+    restored_user = restored.get_user(user_object.id, ctx)
+    assert restored_user is not None and restored_user.state is other_state
+    assert restored_user.name == user_object.name
+    assert restored.get_users_by_name('insert', ctx) == [restored_user]
+    assert restored.get_server_member(member['_id']['server'], member['_id']['user'], ctx) is not None
+
+    restored_message = restored.get_message(message.channel_id, message.id, ctx)
+    assert restored_message is not None and restored_message.content == message.content
+    assert restored.get_messages_by_author(message.author_id, ctx) == [restored_message]
+
+    # Objects are pickled before saving yields to event loop, so later mutations do not tear the snapshot
+    async def save_and_mutate():
+        task = asyncio.ensure_future(restored._save_snapshot(path))
+        await asyncio.sleep(0)
+        restored_user.name = 'mutated'
+        await task
+
+    asyncio.run(save_and_mutate())
+    with open(path, 'rb') as fp:
+        assert pyvolt.MapCache._read_snapshot(fp, other_state)['users'][user_object.id].name == user_object.name
+
+    # Saving on close
+    restored.delete_message(message.channel_id, message.id, ctx)
+    asyncio.run(restored.close())
+
+    again = pyvolt.MapCache()
+    with open(path, 'rb') as fp:
+        again.load_snapshot(fp, other_state)
+    assert again.get_message(message.channel_id, message.id, ctx) is None
+    assert again.get_user(user_object.id, ctx) is not None
+
+
+def test_sqlite_cache(tmp_path):
+    state = make_state()
+    ctx = pyvolt.cache._UNDEFINED
+    path = tmp_path / 'cache.db'
+    cache = pyvolt.SQLiteCache(path, state=state, lru_size=1, messages_max_size=1)
+
+    user_object = state.parser.parse_user(user)
+    cache.bulk_store_users({user_object.id: user_object}, ctx)
+    member_object = state.parser.parse_member(member)
+    server_id = member_object.server_id
+    cache.bulk_store_server_members(server_id, {member_object.id: member_object}, ctx)
+
+    first, second = (state.parser.parse_message(copy.deepcopy(payload)) for payload in messages)
+    cache.store_message(first, ctx)
+    cache.store_message(second, ctx)
+    assert list(cache.get_messages_mapping_of(first.channel_id, ctx) or ()) == [max(first.id, second.id)]
+
+    # Second connection sees rows written by first one, and decodes them with its own state
+    other_state = make_state()
+    other = pyvolt.SQLiteCache(path, state=other_state)
+    restored_user = other.get_user(user_object.id, ctx)
+    assert restored_user is not None and restored_user.state is other_state
+    assert restored_user.name == user_object.name
+    assert [u.id for u in other.get_users_by_name('ins', ctx, prefix=True)] == [user_object.id]
+    assert [m.id for m in other.get_server_members_by_name(server_id, 'INSERT', ctx)] == [member_object.id]
+    assert len(other.get_server_members_mapping_of(server_id, ctx) or {}) == 1
+
+    cache.delete_server_members_of(server_id, ctx)
+    assert other.get_server_member(server_id, member_object.id, ctx) is None
+    assert other.get_server_members_mapping_of(server_id, ctx) is None
+
+    # Objects remembered by second connection are not served after first one changes them
+    renamed = state.parser.parse_user({**user, 'username': 'Renamed'})
+    cache.store_user(renamed, ctx)
+    assert (other.get_user(user_object.id, ctx) or user_object).name == 'Renamed'
+    kept = max(first, second, key=lambda message: message.id)
+    assert other.get_message(kept.channel_id, kept.id, ctx) is not None
+    cache.delete_messages_of(kept.channel_id, ctx)
+    assert other.get_message(kept.channel_id, kept.id, ctx) is None
+
+
+@pytest.mark.asyncio
+async def test_async_cache():
+    cache = pyvolt.MapCache()
+    client = pyvolt.Client(cache=pyvolt.SyncCacheAdapter(cache))
+    assert client.state.cache is cache and client.state.async_cache is None
+
+    client = pyvolt.Client(cache=None)
+    state = client.state
+    state.setup(async_cache=pyvolt.SyncCacheAdapter(cache))
+
+    payload = copy.deepcopy(messages[0])
+    await client.dispatch(state.parser.parse_message_event(client.shard, payload))
+    message = cache.get_message(payload['channel'], payload['_id'], pyvolt.cache._UNDEFINED)
+    assert message is not None
+
+    event = state.parser.parse_message_delete_event(
+        client.shard, {'type': 'MessageDelete', 'channel': payload['channel'], 'id': payload['_id']}
+    )
+    await client.dispatch(event)
+    assert event.message is message
+    assert cache.get_message(payload['channel'], payload['_id'], pyvolt.cache._UNDEFINED) is None
+
+
+def test_compact_members():
+    state = make_state()
+    ctx = pyvolt.cache._UNDEFINED
+    cache = pyvolt.MapCache(compact_members=True)
+
+    original = state.parser.parse_member(member)
+    server_id = original.server_id
+
+    payloads = []
+    for i in range(3):
+        payload = copy.deepcopy(member)
+        payload['_id']['user'] = f'01HZZZZZZZZZZZZZZZZZZZZZZ{i}'
+        payload['roles'] = [f'role{j}' for j in range(i)]
+        if i == 1:
+            payload['nickname'] = 'Bob'
+        payloads.append(payload)
+
+    members = {m.id: m for m in map(state.parser.parse_member, payloads)}
+    cache.bulk_store_server_members(server_id, members, ctx)
+
+    mapping = cache.get_server_members_mapping_of(server_id, ctx)
+    assert isinstance(mapping, pyvolt.cache._CompactMemberMap)
+    assert list(mapping) == list(members)
+
+    cache.delete_server_member(server_id, payloads[0]['_id']['user'], ctx)
+    assert len(mapping) == 2
+
+    for payload in payloads[1:]:
+        expected = members[payload['_id']['user']]
+        got = cache.get_server_member(server_id, expected.id, ctx)
+        assert got is not None and got.state is state
+        assert (got.joined_at, got.nick, got.roles, got.timed_out_until, got.can_publish, got.can_receive) == (
+            expected.joined_at,
+            expected.nick,
+            expected.roles,
+            expected.timed_out_until,
+            expected.can_publish,
+            expected.can_receive,
+        )
+
+
+def test_messages_range():
+    state = make_state()
+    cache = pyvolt.MapCache(messages_max_size=4)
+    live = pyvolt.cache._MESSAGE_CREATE_EVENT
+    ctx = pyvolt.cache._UNDEFINED
+
+    def make(message_id: str) -> pyvolt.Message:
+        payload = copy.deepcopy(messages[0])
+        payload['_id'] = message_id
+        return state.parser.parse_message(payload)
+
+    channel_id = messages[0]['channel']
+    ids = [f'01J00000000000000000000{i:03d}' for i in range(5)]
+
+    cache.store_message(make(ids[0]), ctx)
+    for message_id in ids[1:4]:
+        cache.store_message(make(message_id), live)
+
+    # Messages before first live one are unknown
+    assert [m.id for m in cache.get_messages_range(channel_id, ctx, limit=3) or ()] == ids[3:0:-1]
+    assert cache.get_messages_range(channel_id, ctx, limit=4) is None
+    assert [m.id for m in cache.get_messages_range(channel_id, ctx, after=ids[1], oldest_first=True) or ()] == ids[2:4]
+
+    # Trimming evicts oldest message, shrinking the range
+    cache.store_message(make(ids[4]), live)
+    cache.store_message(make('01J00000000000000000000999'), live)
+    assert cache.get_messages_range(channel_id, ctx, before=ids[3], limit=2) is None
+    assert cache.get_messages_range(channel_id, ctx, before=ids[4], limit=2) is not None
+
+    # Deleted messages do not break the range
+    cache.delete_message(channel_id, ids[3], ctx)
+    assert [m.id for m in cache.get_messages_range(channel_id, ctx, limit=2) or ()] == [
+        '01J00000000000000000000999',
+        ids[4],
+    ]
+
+    cache.reset_live_message_ranges(ctx)
+    assert cache.get_messages_range(channel_id, ctx, limit=2) is None
+
+
+@pytest.mark.asyncio
+async def test_get_messages_cache_first(monkeypatch: pytest.MonkeyPatch):
+    cache = pyvolt.MapCache()
+    client = pyvolt.Client(cache=cache)
+    state = client.state
+    live = pyvolt.cache._MESSAGE_CREATE_EVENT
+
+    def make(message_id: str) -> dict:
+        payload = copy.deepcopy(messages[0])
+        payload['_id'] = message_id
+        return payload
+
+    channel_id = messages[0]['channel']
+    ids = [f'01J00000000000000000000{i:03d}' for i in range(6)]
+    for message_id in ids[3:]:
+        cache.store_message(state.parser.parse_message(make(message_id)), live)
+
+    requests = []
+
+    async def request(_self, _route, *, params, **_kwargs):
+        requests.append(params)
+        older = [make(message_id) for message_id in reversed(ids) if message_id < params['before']]
+        return older[: params['limit']]
+
+    monkeypatch.setattr(pyvolt.HTTPClient, 'request', request)
+
+    result = await state.http.get_messages(channel_id, limit=2, cache_first=True)
+    assert [m.id for m in result] == [ids[5], ids[4]]
+    assert not requests
+
+    # Only messages older than cached ones are retrieved
+    result = await state.http.get_messages(channel_id, limit=5, cache_first=True)
+    assert [m.id for m in result] == ids[::-1][:5]
+    assert requests == [{'limit': 2, 'before': ids[3]}]
+
+    # Retrieved messages are merged with live range, and the channel start is known
+    result = await state.http.get_messages(channel_id, limit=10, cache_first=True)
+    assert [m.id for m in result] == ids[::-1]
+    assert requests[1:] == [{'limit': 10 - 5, 'before': ids[1]}]
+
+    result = await state.http.get_messages(channel_id, limit=10, before=ids[4], cache_first=True)
+    assert [m.id for m in result] == ids[3::-1]
+    assert len(requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_skip_before_snapshot():
+    cache = pyvolt.MapCache()
+    client = pyvolt.Client(cache=cache)
+    state = client.state
+
+    payload = copy.deepcopy(messages[0])
+    await client.dispatch(state.parser.parse_message_event(client.shard, payload))
+    message = cache.get_message(payload['channel'], payload['_id'], pyvolt.cache._UNDEFINED)
+    assert message is not None
+
+    update = {'type': 'MessageUpdate', 'channel': payload['channel'], 'id': payload['_id'], 'data': {'content': 'a'}}
+    event = state.parser.parse_message_update_event(client.shard, update)
+    await client.dispatch(event)
+    assert event.before is message and event.after is not message
+    assert message.content != 'a'
+
+    state.skip_before_snapshot_in.append('MessageUpdateEvent')
+    message = cache.get_message(payload['channel'], payload['_id'], pyvolt.cache._UNDEFINED)
+
+    update['data']['content'] = 'b'
+    event = state.parser.parse_message_update_event(client.shard, update)
+    await client.dispatch(event)
+    assert event.before is None and event.after is message
+    assert message.content == 'b'
@@ -0,0 +1,514 @@
+from __future__ import annotations
+
+import aiohttp
+import asyncio
+import pytest
+import pyvolt
+from pyvolt import routes
+
+
+class FakeResponse:
+    def __init__(self, bucket: str, remaining: int, reset_after: int) -> None:
+        self.headers = {
+            'x-ratelimit-bucket': bucket,
+            'x-ratelimit-remaining': str(remaining),
+            'x-ratelimit-reset-after': str(reset_after),
+        }
+        self.url = 'https://api.revolt.chat/'
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_expiry(monkeypatch: pytest.MonkeyPatch):
+    now = 100.0
+    monkeypatch.setattr(pyvolt.http, 'monotonic', lambda: now)
+
+    rate_limiter = pyvolt.DefaultRateLimiter()
+    a = routes.CHANNELS_MESSAGE_QUERY.compile(channel_id='01')
+    b = routes.USERS_FETCH_SELF.compile()
+
+    await rate_limiter.on_response(a, '', FakeResponse('messages', 9, 1000))  # type: ignore
+    await rate_limiter.on_response(b, '', FakeResponse('users', 9, 5000))  # type: ignore
+    assert rate_limiter.fetch_ratelimit_for(a, '') is not None
+
+    # Extending ratelimit keeps it alive
+    now = 100.5
+    await rate_limiter.on_response(a, '', FakeResponse('messages', 8, 1000))  # type: ignore
+
+    now = 101.2
+    assert rate_limiter.fetch_ratelimit_for(a, '') is not None
+    assert rate_limiter.fetch_ratelimit_for(b, '') is not None
+
+    now = 102.0
+    assert rate_limiter.fetch_ratelimit_for(a, '') is None
+    assert rate_limiter.fetch_ratelimit_for(b, '') is not None
+
+    now = 105.0
+    assert rate_limiter.fetch_ratelimit_for(b, '') is None
+    assert not rate_limiter._expiry_heap
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_lanes():
+    rate_limiter = pyvolt.DefaultRateLimiter()
+    rate_limit = pyvolt.DefaultRateLimit(rate_limiter, 'messages', remaining=1, reset_after=50, limit=2)
+
+    await rate_limit.block()
+    assert rate_limit.remaining == 0
+
+    released = []
+
+    async def request(lane: pyvolt.RequestLane) -> None:
+        with pyvolt.request_lane(lane):
+            await rate_limit.block()
+        released.append(lane)
+
+    background = asyncio.create_task(request(pyvolt.RequestLane.background))
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(request(pyvolt.RequestLane.interactive))
+    await asyncio.sleep(0)
+
+    # Bucket is exhausted, so the wait times out
+    with pytest.raises(asyncio.TimeoutError):
+        with pyvolt.request_lane(pyvolt.RequestLane.background, timeout=0.01):
+            await rate_limit.block()
+
+    await asyncio.wait_for(asyncio.gather(background, interactive), timeout=1)
+    assert released == [pyvolt.RequestLane.interactive, pyvolt.RequestLane.background]
+    assert rate_limit.remaining == 0
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_cancelled_waiters():
+    rate_limiter = pyvolt.DefaultRateLimiter()
+    rate_limit = pyvolt.DefaultRateLimit(rate_limiter, 'messages', remaining=0, reset_after=10000, limit=2)
+
+    # Timed out waiters are dropped from queue
+    with pytest.raises(asyncio.TimeoutError):
+        with pyvolt.request_lane(pyvolt.RequestLane.background, timeout=0.01):
+            await rate_limit.block()
+    assert not rate_limit._waiters
+    assert rate_limit._timer is None
+
+    # Freed tokens are taken immediately
+    rate_limit.remaining = 1
+    await asyncio.wait_for(rate_limit.block(), timeout=1)
+    assert rate_limit.remaining == 0
+
+    # Waiter cancelled after being released gives its token to next waiter
+    first = asyncio.create_task(rate_limit.block())
+    await asyncio.sleep(0)
+    second = asyncio.create_task(rate_limit.block())
+    await asyncio.sleep(0)
+
+    rate_limit.remaining = 1
+    rate_limit._release()
+    first.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    await asyncio.wait_for(second, timeout=1)
+    assert rate_limit.remaining == 0
+    assert not rate_limit._waiters
+    assert rate_limit._timer is None
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_keeps_queued_buckets(monkeypatch: pytest.MonkeyPatch):
+    now = 100.0
+    monkeypatch.setattr(pyvolt.http, 'monotonic', lambda: now)
+
+    rate_limiter = pyvolt.DefaultRateLimiter()
+    route = routes.CHANNELS_MESSAGE_QUERY.compile(channel_id='01')
+
+    await rate_limiter.on_response(route, '', FakeResponse('messages', 0, 1000))  # type: ignore
+    rate_limit = rate_limiter.fetch_ratelimit_for(route, '')
+    assert isinstance(rate_limit, pyvolt.DefaultRateLimit)
+
+    task = asyncio.create_task(rate_limit.block())
+    await asyncio.sleep(0)
+
+    # Expired bucket is kept while requests are queued in it
+    now = 102.0
+    assert rate_limiter.fetch_ratelimit_for(route, '') is rate_limit
+
+    task.cancel()
+    rate_limit._waiters.clear()
+    rate_limit._schedule()
+    assert rate_limiter.fetch_ratelimit_for(route, '') is None
+
+
+@pytest.mark.asyncio
+async def test_blocker_released_on_timeout():
+    class RateLimiter(pyvolt.DefaultRateLimiter):
+        __slots__ = ('calls',)
+
+        def fetch_ratelimit_for(self, _route, _path, /):
+            # Bucket is discovered by another request while this one waits for the blocker
+            self.calls = getattr(self, 'calls', 0) + 1
+            return None if self.calls == 1 else rate_limit
+
+    rate_limiter = RateLimiter()
+    rate_limit = pyvolt.DefaultRateLimit(rate_limiter, 'users', remaining=0, reset_after=10000)
+    client = pyvolt.Client()
+    http = pyvolt.HTTPClient(rate_limiter=rate_limiter, session=None, state=client._state)  # type: ignore
+    route = routes.USERS_FETCH_SELF.compile()
+
+    with pytest.raises(asyncio.TimeoutError):
+        with pyvolt.request_lane(pyvolt.RequestLane.background, timeout=0.01):
+            await http.raw_request(route)
+
+    blocker = rate_limiter.fetch_blocker_for(route, '')
+    assert isinstance(blocker, pyvolt.DefaultRateLimitBlocker)
+    assert not blocker._lock.locked()
+    rate_limit._waiters.clear()
+    rate_limit._schedule()
+
+
+@pytest.mark.asyncio
+async def test_single_flight(monkeypatch: pytest.MonkeyPatch):
+    client = pyvolt.Client()
+    http = client.http
+    calls = []
+
+    async def request(_self, route, **_kwargs):
+        calls.append(route.build())
+        await asyncio.sleep(0.01)
+        return {'path': route.build()}
+
+    monkeypatch.setattr(pyvolt.HTTPClient, '_request', request)
+
+    a = routes.USERS_FETCH_SELF.compile()
+    b = routes.CHANNELS_MESSAGE_QUERY.compile(channel_id='01')
+    results = await asyncio.gather(http.request(a), http.request(a), http.request(b), http.request(a))
+    assert calls == ['/users/@me', '/channels/01/messages']
+    assert results[0] is results[1] is results[3]
+
+    # Finished requests are not reused
+    await http.request(a)
+    assert len(calls) == 3
+
+    async def background():
+        with pyvolt.request_lane(pyvolt.RequestLane.background, timeout=5):
+            return await http.request(a)
+
+    # Requests in other lanes are not joined
+    results = await asyncio.gather(background(), http.request(a), background())
+    assert len(calls) == 5
+    assert results[0] is results[2] is not results[1]
+
+
+@pytest.mark.asyncio
+async def test_response_cache(monkeypatch: pytest.MonkeyPatch):
+    client = pyvolt.Client()
+    http = client.http
+    cache = http.response_cache = pyvolt.TTLResponseCache()
+    calls = []
+
+    async def request(_self, route, **_kwargs):
+        path = route.build()
+        calls.append(path)
+        return {'users': [], 'bans': []} if path.endswith('/bans') else []
+
+    monkeypatch.setattr(pyvolt.HTTPClient, '_request', request)
+
+    await http.get_server_emojis('01')
+    await http.get_server_emojis('01')
+    await http.get_server_emojis('02')
+    await http.get_bans('01')
+    assert calls == ['/servers/01/emojis', '/servers/02/emojis', '/servers/01/bans']
+    assert cache.hit_rate(routes.SERVERS_EMOJI_LIST) == 1 / 3
+
+    # Banning someone changes ban list
+    await http.request(routes.SERVERS_BAN_CREATE.compile(server_id='01', user_id='03'), json={})
+    await http.get_bans('01')
+    assert calls[-2:] == ['/servers/01/bans/03', '/servers/01/bans']
+
+    event = pyvolt.ServerEmojiDeleteEvent(shard=client.shard, server_id='01', emoji_id='04', emoji=None)
+    event.invalidate_responses(cache)
+    await http.get_server_emojis('01')
+    await http.get_server_emojis('02')
+    assert calls[-1] == '/servers/01/emojis'
+    assert len(calls) == 6
+
+
+@pytest.mark.asyncio
+async def test_bulk_kick(monkeypatch: pytest.MonkeyPatch):
+    client = pyvolt.Client()
+    kicked = []
+    failing = {'03'}
+
+    async def request(_self, route, **_kwargs):
+        member_id = route.args['member_id']
+        await asyncio.sleep(0)
+        if member_id in failing:
+            raise RuntimeError(member_id)
+        kicked.append(member_id)
+
+    monkeypatch.setattr(pyvolt.HTTPClient, 'request', request)
+
+    operation = client.http.bulk_kick('01', ['02', '03', '04', '02'], concurrency=2)
+    results = {result.target: result async for result in operation}
+    assert sorted(results) == ['02', '03', '04']
+    assert not results['03'].ok and results['02'].ok
+    assert list(operation.remaining) == ['03'] and list(operation.failed) == ['03']
+
+    # Resuming retries only failed targets
+    failing.clear()
+    results = [result async for result in operation]
+    assert [result.target for result in results] == ['03']
+    assert not operation.remaining and not operation.failed
+    assert sorted(kicked) == ['02', '03', '04']
+
+
+@pytest.mark.asyncio
+async def test_http_metrics():
+    metrics = pyvolt.HTTPMetrics()
+    statuses = [502, 200, 200]
+
+    class Response:
+        content_length = 2
+
+        def __init__(self, status: int) -> None:
+            self.status = status
+
+    class HTTPClient(pyvolt.HTTPClient):
+        __slots__ = ()
+
+        async def send_request(self, session, /, **kwargs):
+            assert kwargs['trace_request_ctx'] is route
+            await asyncio.sleep(0.01)
+            return Response(statuses.pop(0))
+
+    client = pyvolt.Client()
+    http = HTTPClient(
+        rate_limiter=None,
+        instrumentation=metrics,
+        retry_policy=pyvolt.ExponentialBackoff(base=0),
+        session=None,  # type: ignore
+        state=client._state,
+    )
+    route = routes.USERS_EDIT_SELF_USER.compile()
+    await http.raw_request(route, json={'a': 1})
+    await http.raw_request(route)
+
+    metrics_for_route = metrics.routes[routes.USERS_EDIT_SELF_USER]
+    assert metrics_for_route.requests == 3
+    assert metrics_for_route.statuses == {502: 1, 200: 2}
+    assert metrics_for_route.retries == {'502': 1}
+    assert metrics_for_route.request_bytes == 2 * len(pyvolt.utils.to_json_bytes({'a': 1}))
+    assert metrics_for_route.response_bytes == 6
+    assert metrics_for_route.average_latency >= 0.01
+    assert metrics.export()['PATCH /users/@me']['requests'] == 3
+
+
+def test_exponential_backoff():
+    budget = pyvolt.RetryBudget(max_tokens=2, ratio=0.5)
+    policy = pyvolt.ExponentialBackoff(
+        base=1,
+        max_delay=3,
+        jitter=0,
+        budget=budget,
+        overrides={'GET /users/@me': pyvolt.ExponentialBackoff(max_retries=0)},
+    )
+    options = {'method': 'PATCH', 'path': '/users/@me', 'idempotent': True}
+
+    assert policy.compute_delay(0, '502', **options) == 1
+    assert policy.compute_delay(2, '502', **options) == 3
+    assert policy.compute_delay(3, '502', **options) is None
+    assert policy.compute_delay(0, 'connection_reset', **options) is None  # Budget is exhausted
+    assert policy.compute_delay(0, '429', retry_after=0.25, **options) == 0.25
+
+    policy.on_success()
+    policy.on_success()
+    assert policy.compute_delay(0, '525', **options) == 1
+
+    # Non-idempotent requests might have been processed already
+    options = {'method': 'POST', 'path': '/channels/{channel_id}/messages', 'idempotent': False}
+    budget.tokens = 2
+    assert policy.compute_delay(0, '502', **options) is None
+    assert policy.compute_delay(0, '429', retry_after=1, **options) == 1
+
+    options = {'method': 'GET', 'path': '/users/@me', 'idempotent': True}
+    assert policy.compute_delay(0, '502', **options) is None
+
+
+@pytest.mark.asyncio
+async def test_stream_members(monkeypatch: pytest.MonkeyPatch):
+    client = pyvolt.Client()
+    count = 20
+    payload = {
+        'members': [
+            {'_id': {'server': '01', 'user': f'u{i}'}, 'joined_at': '2024-01-01T00:00:00Z', 'nickname': 'a, "]'}
+            for i in range(count)
+        ],
+        'users': [
+            {
+                '_id': f'u{i}',
+                'username': f'user{i}',
+                'discriminator': '0001',
+                'relationship': 'None',
+                'online': False,
+            }
+            for i in range(count)
+        ],
+    }
+    body = pyvolt.utils.to_json(payload).encode()
+
+    class Content:
+        async def iter_chunked(self, n: int):
+            # Split document at arbitrary points
+            for i in range(0, len(body), 7):
+                yield body[i : i + 7]
+
+    class Response:
+        content = Content()
+        method = 'GET'
+        url = '/servers/01/members'
+        status = 200
+
+        @property
+        def request_info(self):
+            return self
+
+        def close(self) -> None:
+            pass
+
+    async def raw_request(_self, route, **_kwargs):
+        assert route.route is routes.SERVERS_MEMBER_FETCH_ALL
+        return Response()
+
+    monkeypatch.setattr(pyvolt.HTTPClient, 'raw_request', raw_request)
+
+    items = [item async for item in client.http.stream_members('01')]
+    assert [type(item) for item in items] == [pyvolt.Member] * count + [pyvolt.User] * count
+    assert items[3].nick == 'a, "]'
+
+    members = await client.http.get_members('01')
+    assert [member.user.name for member in members] == [f'user{i}' for i in range(count)]
+
+    # Users may come before members
+    body = pyvolt.utils.to_json({'users': payload['users'], 'members': payload['members']}).encode()
+    members = await client.http.get_members('01')
+    assert [member.user.name for member in members] == [f'user{i}' for i in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_json_bytes():
+    class Response:
+        headers = {'content-type': 'application/json; charset=utf-8'}
+
+        async def read(self) -> bytes:
+            return '{"name":"\u0444"}'.encode()
+
+    assert await pyvolt.utils._json_or_text(Response()) == {'name': '\u0444'}  # type: ignore
+
+    frames = []
+
+    class Socket:
+        async def send_frame(self, message: bytes, opcode: aiohttp.WSMsgType) -> None:
+            frames.append((message, opcode))
+
+    client = pyvolt.Client()
+    client.shard._socket = Socket()  # type: ignore
+    await client.shard._send_json({'type': 'Ping', 'data': 0})
+    assert frames == [(b'{"type":"Ping","data":0}', aiohttp.WSMsgType.TEXT)]
+
+
+def test_compiled_route():
+    route = routes.CHANNELS_MESSAGE_REACT.compile(channel_id='01', message_id='02', emoji='a b/😀')
+    assert route.build() == '/channels/01/messages/02/reactions/a%20b/%F0%9F%98%80'
+    assert route.build() is route.build()
+    assert route.build_ratelimit_key() == 'channels/01'
+    assert routes.USERS_FETCH_SELF.compile().build() == '/users/@me'
+
+
+@pytest.mark.asyncio
+async def test_history(monkeypatch: pytest.MonkeyPatch):
+    client = pyvolt.Client()
+    ids = [f'{i:026}' for i in range(250)]
+    calls = []
+
+    async def get_messages(_self, channel, *, limit, before, after, sort, **_kwargs):
+        calls.append((before, after))
+        if sort is pyvolt.MessageSort.oldest:
+            page = [i for i in ids if (after is None or i > after) and (before is None or i < before)][:limit]
+        else:
+            page = [i for i in reversed(ids) if (after is None or i > after) and (before is None or i < before)][:limit]
+        await asyncio.sleep(0)
+        return [pyvolt.BaseMessage(state=client._state, id=i, channel_id=channel) for i in page]
+
+    monkeypatch.setattr(pyvolt.HTTPClient, 'get_messages', get_messages)
+
+    iterator = client.http.history('01', after=ids[9], oldest_first=True)
+    messages = []
+    async for message in iterator:
+        if not messages:
+            # Next page is being retrieved while first one is consumed
+            await asyncio.sleep(0.01)
+            assert len(calls) == 2
+        messages.append(message.id)
+    assert messages == ids[10:]
+    assert calls == [(None, ids[9]), (None, ids[109]), (None, ids[209])]
+
+    calls.clear()
+    messages = await client.http.history('01', limit=150, before=ids[200], page_size=100).flatten()
+    assert [message.id for message in messages] == ids[199:49:-1]
+    assert calls == [(ids[200], None), (ids[100], None)]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_uploads(monkeypatch: pytest.MonkeyPatch):
+    client = pyvolt.Client(
+        cdn_client=lambda _client, state: pyvolt.CDNClient(max_concurrent_uploads=2, session=None, state=state)  # type: ignore
+    )
+    cdn_client = client._state.cdn_client
+    uploading = 0
+    peak = 0
+
+    class Response:
+        def __init__(self, id: str) -> None:
+            self.id = id
+
+        async def read(self) -> bytes:
+            return pyvolt.utils.to_json_bytes({'id': self.id})
+
+        def close(self) -> None:
+            pass
+
+    async def request(_self, _method, _route, /, *, data, **_kwargs):
+        nonlocal uploading, peak
+        uploading += 1
+        peak = max(peak, uploading)
+        try:
+            filename = data._fields[0][0]['filename']
+            if filename == 'bad':
+                raise Failed
+            # Later files finish first
+            await asyncio.sleep(0.01 * (5 - int(filename[-1])))
+        finally:
+            uploading -= 1
+        return Response(filename)
+
+    class Sent(Exception):
+        pass
+
+    class Failed(Exception):
+        pass
+
+    async def send(_self, _route, *, json, **_kwargs):
+        raise Sent(json)
+
+    monkeypatch.setattr(pyvolt.CDNClient, 'request', request)
+    monkeypatch.setattr(pyvolt.HTTPClient, 'request', send)
+
+    with pytest.raises(Sent) as exc_info:
+        await client.http.send_message(
+            '01', attachments=[('f1', b'1'), 'existing', ('f2', b'2'), ('f3', b'3'), ('f4', b'4')]
+        )
+    assert exc_info.value.args[0]['attachments'] == ['f1', 'existing', 'f2', 'f3', 'f4']
+    assert peak == cdn_client.max_concurrent_uploads
+
+    # Remaining uploads are cancelled once one fails
+    with pytest.raises(Failed):
+        await client.http.send_message('01', attachments=[('f1', b'1'), ('bad', b'0'), ('f2', b'2')])
+    assert uploading == 0